@@ -1,3 +1,7 @@
 #!/usr/bin/env python3
 
 version = __version__ = "0.5.5-dev0"
+
+# library API, not imported when setup.py reads the version
+if __package__:
+    from .api import GlyphResult, inspect  # noqa: F401
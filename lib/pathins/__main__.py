@@ -5,19 +5,92 @@ import os
 import sys
 
 from . import __version__
+from .batch import batch_run
 from .contours import contours_run
 from .coordinates import coordinates_run
-from .direction import direction_run
+from .diff import METRICS, diff_run
+from .direction import ENGINES, direction_run
+from .formats import FORMATS, TABLE_FORMATS
+from .overlap import overlap_run
 from .path import path_run
+from .report import ANALYSES, report_run
 from .segments import segments_run
 
-# from .overlap import overlap_run
-
 
 def main() -> None:  # pragma: no cover
     run(sys.argv[1:])
 
 
+def glyph_analysis_parser(formats) -> argparse.ArgumentParser:
+    """
+    Returns the parent parser with the shared output, process pool,
+    cache, glyph selection, and font path arguments of the glyph
+    analysis sub-commands.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--nocolor", action="store_true", help="no ANSI color")
+    parser.add_argument(
+        "--format",
+        choices=formats,
+        default="text",
+        help="output format (default=text)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes (default=1, 0=one per CPU)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        metavar="PATH",
+        help="persistent analysis result cache database path",
+    )
+    parser.add_argument(
+        "-g",
+        "--glyph",
+        action="append",
+        metavar="NAME",
+        help="glyph name to include, repeat for more",
+    )
+    parser.add_argument(
+        "--match",
+        action="append",
+        metavar="PATTERN",
+        help="glob pattern of glyph names to include, repeat for more",
+    )
+    parser.add_argument(
+        "--regex",
+        action="append",
+        metavar="PATTERN",
+        help="regular expression to search in glyph names, repeat for more",
+    )
+    parser.add_argument(
+        "--unicodes",
+        type=str,
+        metavar="RANGES",
+        help="Unicode code point ranges to include (e.g., U+0400-04FF,U+20AC)",
+    )
+    parser.add_argument(
+        "--gid",
+        type=str,
+        metavar="RANGES",
+        help="glyph ID ranges to include (e.g., 100-500,600)",
+    )
+    parser.add_argument(
+        "fontpath",
+        type=str,
+        help="font file path(s), directories, or glob patterns",
+        nargs="+",
+    )
+    parser.add_argument(
+        "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
+    )
+    return parser
+
+
 def run(argv) -> None:
     # ===========================================================
     # argparse command line argument definitions
@@ -27,6 +100,9 @@ def run(argv) -> None:
         "-v", "--version", action="version", version=f"pathins v{__version__}"
     )
     subparsers = parser.add_subparsers(dest="subparser_name")
+    # shared arguments of the glyph analysis sub-commands
+    analysis_parser = glyph_analysis_parser(FORMATS)
+    table_analysis_parser = glyph_analysis_parser(FORMATS + TABLE_FORMATS)
 
     # -------------------------------
     # contours sub-command parser
@@ -35,15 +111,11 @@ def run(argv) -> None:
         "contours",
         help="Contours inspection",
         description="Contours inspection",
+        parents=[analysis_parser],
     )
     parser_contours.add_argument(
         "-v", "--version", action="version", version=f"pathins v{__version__}"
     )
-    parser_contours.add_argument("--nocolor", action="store_true", help="no ANSI color")
-    parser_contours.add_argument("fontpath", type=str, help="font file path")
-    parser_contours.add_argument(
-        "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
-    )
     parser_contours.set_defaults(func=contours_run)
 
     # -------------------------------
@@ -53,18 +125,48 @@ def run(argv) -> None:
         "coordinates",
         help="Path coordinates inspection",
         description="Path coordinates inspection",
+        parents=[table_analysis_parser],
     )
     parser_coordinates.add_argument(
         "-v", "--version", action="version", version=f"pathins v{__version__}"
     )
-    parser_coordinates.add_argument(
-        "--nocolor", action="store_true", help="no ANSI color"
+    parser_coordinates.set_defaults(func=coordinates_run)
+
+    # -----------------------------
+    # diff sub-command parser
+    # -----------------------------
+    parser_diff = subparsers.add_parser(
+        "diff",
+        help="Outline changes between two font builds",
+        description="Outline changes between two font builds",
     )
-    parser_coordinates.add_argument("fontpath", type=str, help="font file path")
-    parser_coordinates.add_argument(
-        "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
+    parser_diff.add_argument(
+        "-v", "--version", action="version", version=f"pathins v{__version__}"
     )
-    parser_coordinates.set_defaults(func=coordinates_run)
+    parser_diff.add_argument(
+        "-a",
+        "--analysis",
+        action="append",
+        choices=list(METRICS),
+        help="analysis to compare, repeat for more (default=all)",
+    )
+    parser_diff.add_argument("--nocolor", action="store_true", help="no ANSI color")
+    parser_diff.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help="output format (default=text)",
+    )
+    parser_diff.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes (default=1, 0=one per CPU)",
+    )
+    parser_diff.add_argument("oldpath", type=str, help="old font file path")
+    parser_diff.add_argument("newpath", type=str, help="new font file path")
+    parser_diff.set_defaults(func=diff_run)
 
     # -----------------------------
     # direction sub-command parser
@@ -73,66 +175,83 @@ def run(argv) -> None:
         "direction",
         help="Path direction inspection",
         description="Path direction inspection",
+        parents=[analysis_parser],
     )
     parser_direction.add_argument(
         "-v", "--version", action="version", version=f"pathins v{__version__}"
     )
-    parser_direction.add_argument("--nocolor", action="store_true", help="no ANSI color")
-    parser_direction.add_argument("fontpath", type=str, help="font file path")
     parser_direction.add_argument(
-        "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
+        "--engine",
+        choices=ENGINES,
+        default="skia",
+        help="direction engine (default=skia)",
     )
     parser_direction.set_defaults(func=direction_run)
 
     # -----------------------------
     # overlap sub-command parser
     # -----------------------------
-    # parser_overlap = subparsers.add_parser(
-    #     "overlap", help="Path overlap inspection", description="Path overlap inspection"
-    # )
-    # parser_overlap.add_argument(
-    #     "-v", "--version", action="version", version=f"pathins v{__version__}"
-    # )
-    # parser_overlap.add_argument(
-    #     "--check",
-    #     action="store_true",
-    #     help="quick check for any overlaps with status code",
-    # )
-    # parser_overlap.add_argument("--nocolor", action="store_true", help="no ANSI color")
-    # parser_overlap.add_argument("fontpath", type=str, help="font file path")
-    # parser_overlap.add_argument(
-    #     "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
-    # )
-    # parser_overlap.set_defaults(func=overlap_run)
+    parser_overlap = subparsers.add_parser(
+        "overlap",
+        help="Path overlap inspection",
+        description="Path overlap inspection",
+        parents=[analysis_parser],
+    )
+    parser_overlap.add_argument(
+        "-v", "--version", action="version", version=f"pathins v{__version__}"
+    )
+    parser_overlap.add_argument(
+        "--check",
+        action="store_true",
+        help="quick check for any overlaps with status code",
+    )
+    parser_overlap.set_defaults(func=overlap_run)
 
     # -----------------------------
     # path sub-command parser
     # -----------------------------
-    parser_path = subparsers.add_parser("path", help="Path dump", description="Path dump")
-    parser_path.add_argument(
-        "-v", "--version", action="version", version=f"pathins v{__version__}"
+    parser_path = subparsers.add_parser(
+        "path", help="Path dump", description="Path dump", parents=[analysis_parser]
     )
-    parser_path.add_argument("--nocolor", action="store_true", help="no ANSI color")
-    parser_path.add_argument("fontpath", type=str, help="font file path")
     parser_path.add_argument(
-        "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
+        "-v", "--version", action="version", version=f"pathins v{__version__}"
     )
     parser_path.set_defaults(func=path_run)
 
+    # -----------------------------
+    # report sub-command parser
+    # -----------------------------
+    parser_report = subparsers.add_parser(
+        "report",
+        aliases=["all"],
+        help="Combined multi-analysis report",
+        description="Combined multi-analysis report",
+        parents=[analysis_parser],
+    )
+    parser_report.add_argument(
+        "-v", "--version", action="version", version=f"pathins v{__version__}"
+    )
+    parser_report.add_argument(
+        "-a",
+        "--analysis",
+        action="append",
+        choices=list(ANALYSES),
+        help="analysis to include, repeat for more (default=all)",
+    )
+    parser_report.set_defaults(func=report_run)
+
     # -----------------------------
     # segments sub-command parser
     # -----------------------------
     parser_segments = subparsers.add_parser(
-        "segments", help="Path segment inspection", description="Path segment inspection"
+        "segments",
+        help="Path segment inspection",
+        description="Path segment inspection",
+        parents=[table_analysis_parser],
     )
     parser_segments.add_argument(
         "-v", "--version", action="version", version=f"pathins v{__version__}"
     )
-    parser_segments.add_argument("--nocolor", action="store_true", help="no ANSI color")
-    parser_segments.add_argument("fontpath", type=str, help="font file path")
-    parser_segments.add_argument(
-        "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
-    )
     parser_segments.set_defaults(func=segments_run)
 
     # -----------------------------
@@ -145,5 +264,8 @@ def run(argv) -> None:
         parser.print_usage()
         sys.stderr.write(f"pathins: error: please enter a valid sub-command{os.linesep}")
         sys.exit(1)
-    else:
+    elif args.subparser_name == "diff":
+        # two font paths, not supported in batch mode
         args.func(args)
+    else:
+        batch_run(args)
@@ -0,0 +1,186 @@
+import os
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from fontTools.ttLib import TTFont  # type: ignore
+
+from .engine import jobs_count
+from .report import RECORDS, glyph_records
+from .selection import select_analyses
+from .utils import open_font
+
+Point2D = Tuple[float, float]
+
+
+class Point(NamedTuple):
+    """Outline point of a decomposed glyph."""
+
+    x: int
+    y: int
+    oncurve: bool
+    startpoint: bool
+    endpoint: bool
+
+
+class PathOperation(NamedTuple):
+    """Pen drawing operation of a decomposed glyph path."""
+
+    operation: str
+    points: Tuple[Point2D, ...]
+
+
+class Segment(NamedTuple):
+    """Line or quadratic curve segment of a decomposed glyph path."""
+
+    type: str
+    points: Tuple[Point2D, ...]
+    length: float
+
+
+class TransformedComponent(NamedTuple):
+    """Composite glyph component with a 2x2 scale transform."""
+
+    glyph: str
+    transform: Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+class GlyphResult(NamedTuple):
+    """
+    Per-glyph analysis results.  Fields of analyses that were
+    not requested are None.
+    """
+
+    font: str
+    glyph: str
+    contours: Optional[int] = None
+    direction: Optional[str] = None
+    transformed_components: Optional[Tuple[TransformedComponent, ...]] = None
+    coordinates: Optional[Tuple[Point, ...]] = None
+    path: Optional[Tuple[PathOperation, ...]] = None
+    segments: Optional[Tuple[Segment, ...]] = None
+    total_length: Optional[float] = None
+    overlap: Optional[bool] = None
+
+
+def _points(points: Iterable[Sequence[float]]) -> Tuple[Point2D, ...]:
+    return tuple((point[0], point[1]) for point in points)
+
+
+# record field name : typed field value function
+_FIELD_TYPES: Dict[str, Callable[[Any], Any]] = {
+    "transformed_components": lambda components: tuple(
+        TransformedComponent(
+            component["glyph"],
+            (tuple(component["transform"][0]), tuple(component["transform"][1])),
+        )
+        for component in components
+    ),
+    "coordinates": lambda coordinates: tuple(
+        Point(**coordinate) for coordinate in coordinates
+    ),
+    "path": lambda operations: tuple(
+        PathOperation(operation["operation"], _points(operation["points"]))
+        for operation in operations
+    ),
+    "segments": lambda segments: tuple(
+        Segment(segment["type"], _points(segment["points"]), segment["length"])
+        for segment in segments
+    ),
+}
+
+
+def inspect(
+    font: Union[str, "os.PathLike[str]", TTFont],
+    analyses: Optional[Sequence[str]] = None,
+    glyphs: Union[None, str, Iterable[str]] = None,
+    jobs: int = 1,
+    cache_path: Optional[str] = None,
+) -> Iterator[GlyphResult]:
+    """
+    Library interface that yields one GlyphResult per glyph
+    with the results of the requested analyses (default=all)
+    in report.RECORDS.  GlyphResults are the typed form of the
+    report.glyph_records records.  Results are calculated lazily
+    as the iterator is consumed.  `font` is a font file path or
+    a fontTools.ttLib.TTFont object.  Results are yielded for a
+    single glyph name, the glyph names in `glyphs` in the
+    requested order, or the full glyph set in glyph order when
+    `glyphs` is not defined.  Font files are closed when the
+    iterator is exhausted or closed.
+
+    `jobs` and `cache_path` are the engine.glyph_map process
+    pool and diskcache options.  Process pools require a font
+    file path.
+
+    Raises ValueError on unsupported analysis names and process
+    pool requests with a TTFont object.  The iterator raises
+    ValueError on glyph names that are not in the font when
+    iteration starts.
+    """
+    requested = select_analyses(analyses, list(RECORDS))
+    jobs = jobs_count(jobs)
+    if jobs > 1 and isinstance(font, TTFont):
+        raise ValueError("process pools require a font file path")
+    return _inspect(font, requested, glyphs, jobs, cache_path)
+
+
+def _inspect(
+    font: Union[str, "os.PathLike[str]", TTFont],
+    analyses: Sequence[str],
+    glyphs: Union[None, str, Iterable[str]],
+    jobs: int,
+    cache_path: Optional[str],
+) -> Iterator[GlyphResult]:
+    with _opened_font(font) as tt:
+        fontpath = "" if isinstance(font, TTFont) else os.fspath(font)
+        glyph_names = _requested_glyphs(tt, glyphs)
+        for record in glyph_records(
+            tt, analyses, glyph_names, fontpath=fontpath, jobs=jobs, cache_path=cache_path
+        ):
+            yield glyph_result(record)
+
+
+def glyph_result(record: Dict[str, Any]) -> GlyphResult:
+    """
+    Returns the GlyphResult for a formats.glyph_record
+    machine-readable record.
+    """
+    return GlyphResult(
+        **{
+            name: _FIELD_TYPES[name](value) if name in _FIELD_TYPES else value
+            for name, value in record.items()
+        }
+    )
+
+
+@contextmanager
+def _opened_font(font: Union[str, "os.PathLike[str]", TTFont]) -> Iterator[TTFont]:
+    # TTFont objects are owned by the caller and are not closed
+    if isinstance(font, TTFont):
+        yield font
+    else:
+        with open_font(font) as tt:
+            yield tt
+
+
+def _requested_glyphs(tt: TTFont, glyphs: Union[None, str, Iterable[str]]) -> List[str]:
+    if glyphs is None:
+        return tt.getGlyphOrder()
+    glyph_names = [glyphs] if isinstance(glyphs, str) else list(glyphs)
+    reverse_glyph_map = tt.getReverseGlyphMap()
+    for glyph_name in glyph_names:
+        if glyph_name not in reverse_glyph_map:
+            raise ValueError(f"glyph '{glyph_name}' is not in the font")
+    return glyph_names
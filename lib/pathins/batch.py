@@ -0,0 +1,237 @@
+import argparse
+import glob
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from .engine import jobs_count
+from .stringbuilder import batch_summary, font_header
+from .utils import CheckIssueFound
+
+FONT_FILE_EXTENSIONS = (".ttf",)
+# font file extensions that are never interpreted as glyph names
+FONT_PATH_EXTENSIONS = (".ttf", ".otf", ".ttc")
+GLOB_CHARACTERS = ("*", "?", "[")
+# per-font run status of fonts that were analyzed and a --check
+# option found an issue, exit status codes are not negative
+CHECK_ISSUE_FOUND = -1
+
+
+def batch_run(args: argparse.Namespace) -> None:
+    """
+    Executes the sub-command function defined on `args` for
+    every font file path that is requested on the command
+    line.  Font paths, directories of fonts, and glob patterns
+    are supported.  A single font path request is passed through
+    to the sub-command without modification.  Requests with
+    multiple font paths include a per-font report section and
+    an aggregate summary.  Fonts in which a --check option found
+    an issue are reported separately from fonts that failed.
+    Machine-readable output formats
+    do not include the per-font report section headers and the
+    summary is written to the standard error stream.  The json
+    format writes the records of all fonts in a single JSON array
+    and the csv format writes the rows of all fonts in a single
+    table with one header row.
+    """
+    fontpaths, glyphname = split_fontpath_arguments(args.fontpath, args.glyphname)
+
+    if len(fontpaths) == 1:
+        args.fontpath = fontpaths[0]
+        args.glyphname = glyphname
+        args.func(args)
+        return
+
+    jobs = jobs_count(getattr(args, "jobs", 1))
+    output_format = getattr(args, "format", "text")
+    text_output = output_format == "text"
+    # per-font ndjson records are combined in one JSON array
+    json_output = output_format == "json"
+    # per-font csv tables are combined in one table with one header row
+    csv_output = output_format == "csv"
+    font_args_list = []
+    for fontpath in fontpaths:
+        font_args = argparse.Namespace(**vars(args))
+        font_args.fontpath = fontpath
+        font_args.glyphname = glyphname
+        # fonts are scheduled across the worker pool,
+        # each font is processed in a single process
+        font_args.jobs = 1
+        if json_output:
+            font_args.format = "ndjson"
+        font_args_list.append(font_args)
+
+    failed: List[str] = []
+    flagged: List[str] = []
+    number_of_records = 0
+    if json_output:
+        sys.stdout.write("[")
+    csv_header_written = False
+    for x, (font_args, status, stdout) in enumerate(
+        _run_fonts(
+            font_args_list, jobs, headers=text_output, capture=json_output or csv_output
+        )
+    ):
+        if status == CHECK_ISSUE_FOUND:
+            flagged.append(font_args.fontpath)
+        elif status != 0:
+            failed.append(font_args.fontpath)
+        if json_output:
+            for record in stdout.splitlines():
+                if number_of_records > 0:
+                    sys.stdout.write(",")
+                sys.stdout.write(f"\n{record}")
+                number_of_records += 1
+            sys.stdout.flush()
+        elif csv_output and stdout:
+            if csv_header_written:
+                # remove the header row of all tables except first
+                stdout = stdout.partition("\n")[2]
+            sys.stdout.write(stdout)
+            sys.stdout.flush()
+            csv_header_written = True
+        elif text_output and x + 1 < len(font_args_list):
+            # append a newline to all font reports except last
+            print("")
+    if json_output:
+        print("\n]")
+
+    summary = batch_summary(
+        len(fontpaths), failed, nocolor=args.nocolor, flagged_fontpaths=flagged
+    )
+    if text_output:
+        print("")
+        print(summary)
+    else:
+        # keep the standard output stream machine-readable
+        sys.stderr.write(f"{summary}{os.linesep}")
+    if len(failed) > 0 or len(flagged) > 0:
+        sys.exit(1)
+
+
+def split_fontpath_arguments(
+    paths: Sequence[str], glyphname: Optional[str]
+) -> Tuple[List[str], Optional[str]]:
+    """
+    Returns a tuple of (font file paths, glyph name) from the
+    positional command line arguments.  argparse assigns all
+    positional arguments to the font path list.  The last
+    positional argument is interpreted as a glyph name when
+    more than one argument is present and it does not look like
+    a path: it does not exist, is not a glob pattern, and has no
+    path separator or font file extension.  Mistyped font paths
+    are reported by the font path validations.
+    """
+    path_args = list(paths)
+    if glyphname is None and len(path_args) > 1:
+        last = path_args[-1]
+        if not _is_path(last):
+            glyphname = path_args.pop()
+    return expand_fontpaths(path_args), glyphname
+
+
+def expand_fontpaths(paths: Sequence[str]) -> List[str]:
+    """
+    Returns a list of font file paths from a sequence of
+    font file paths, directory paths, and glob patterns.
+    Directories are expanded to the font files that they
+    contain (non-recursive).  Paths that do not exist and
+    glob patterns without matches are returned unmodified
+    so that they are reported by the font path validations.
+    """
+    fontpaths: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            fontpaths.extend(
+                os.path.join(path, filename)
+                for filename in sorted(os.listdir(path))
+                if _is_font_file(os.path.join(path, filename))
+            )
+        elif _is_glob(path):
+            matches = [
+                match
+                for match in sorted(glob.glob(path, recursive=True))
+                if os.path.isfile(match)
+            ]
+            fontpaths.extend(matches if len(matches) > 0 else [path])
+        else:
+            fontpaths.append(path)
+    return fontpaths
+
+
+def _is_font_file(path: str) -> bool:
+    return os.path.isfile(path) and path.lower().endswith(FONT_FILE_EXTENSIONS)
+
+
+def _is_glob(path: str) -> bool:
+    return any(char in path for char in GLOB_CHARACTERS)
+
+
+def _is_path(path: str) -> bool:
+    separators = [sep for sep in (os.sep, os.altsep) if sep]
+    return (
+        os.path.exists(path)
+        or _is_glob(path)
+        or any(sep in path for sep in separators)
+        or path.lower().endswith(FONT_PATH_EXTENSIONS)
+    )
+
+
+def _run_fonts(
+    font_args_list: Sequence[argparse.Namespace],
+    jobs: int,
+    headers: bool = True,
+    capture: bool = False,
+) -> Iterator[Tuple[argparse.Namespace, int, str]]:
+    """
+    Yields (font_args, exit status, captured report) tuples in
+    request order.  Reports are written to the standard output
+    stream as they become available.  Reports are returned
+    instead when `capture` is True.  Captured reports are empty
+    strings when `capture` is False.
+    """
+    if jobs < 2:
+        for font_args in font_args_list:
+            if headers:
+                print(font_header(font_args.fontpath, nocolor=font_args.nocolor))
+            if capture:
+                status, stdout, stderr = _run_font_captured(font_args)
+                sys.stderr.write(stderr)
+                yield font_args, status, stdout
+            else:
+                yield font_args, _run_font(font_args), ""
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for font_args, (status, stdout, stderr) in zip(
+                font_args_list, executor.map(_run_font_captured, font_args_list)
+            ):
+                if headers:
+                    print(font_header(font_args.fontpath, nocolor=font_args.nocolor))
+                if not capture:
+                    sys.stdout.write(stdout)
+                    sys.stdout.flush()
+                sys.stderr.write(stderr)
+                yield font_args, status, stdout if capture else ""
+
+
+def _run_font(font_args: argparse.Namespace) -> int:
+    try:
+        font_args.func(font_args)
+    except CheckIssueFound:
+        return CHECK_ISSUE_FOUND
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    return 0
+
+
+def _run_font_captured(font_args: argparse.Namespace) -> Tuple[int, str, str]:
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        status = _run_font(font_args)
+    return status, stdout.getvalue(), stderr.getvalue()
@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, List, Sequence, Set, Tuple
 
 from fontTools.ttLib.tables._g_l_y_f import Glyph  # type: ignore
 
@@ -28,62 +28,98 @@ def quadratic_path(
     specification.
     """
     coords, endpoints, flags = glyph.getCoordinates(glyf_table)
-    endpoint_coordinates = [coords[endpoint] for endpoint in endpoints]
-    new_coords: List[Coordinate] = []
-
-    for x, coord in enumerate(coords):
+    if include_implied:
+        coords, endpoints, oncurve, implied = implied_oncurve_points(
+            coords, endpoints, flags
+        )
+    else:
         # on- and off-curve points are defined in
         # the `flags` integer array that are mapped
         # 1:1 to coordinate indices
-        on_curve: bool = (flags[x] & FLAG_ON_CURVE) != 0
+        oncurve = [(flag & FLAG_ON_CURVE) != 0 for flag in flags]
+        implied = [False] * len(oncurve)
+    startpoint_indices, endpoint_indices = contour_point_indices(endpoints)
+    new_coords: List[Coordinate] = []
+
+    for x, coord in enumerate(coords):
         # this is a start coordinate if it
         # (1) is the first coordinate in the iterable
         # (2) follows a previous endpoint coordinate
-        start_coord: bool = (x == 0) or (coords[x - 1] in endpoint_coordinates)
-        # this is an end coordinate if the coordinate tuple is in
-        # endpoint_coordinates
-        end_coord: bool = coord in endpoint_coordinates
-        # cannot be both start and end point
-        assert not (end_coord and start_coord)
-
-        if include_implied:
-            if not on_curve:
-                # there should always be a previous point in the contour
-                # if this is *not* an on-curve point
-                last_on_curve = (flags[x - 1] & FLAG_ON_CURVE) != 0
-                if not last_on_curve:
-                    last = coords[x - 1]
-                    # get the implied on curve point between two off curve points
-                    implied_coordinate = midpoint_between_coordinates(last, coord)
-                    new_implied_coordinate = Coordinate(
-                        implied_coordinate[0],
-                        implied_coordinate[1],
-                        oncurve=True,
-                        startpoint=False,
-                        endpoint=False,
-                        implied=True,
-                    )
-                    # add *new* implied coordinate that was not in the original
-                    # coordinate set
-                    # set next coordinate attr in the last coordinate if there is one
-                    if len(new_coords) > 0 and not new_coords[-1].endpoint:
-                        new_coords[-1].set_coord_next(new_implied_coordinate)
-                        new_implied_coordinate.set_coord_previous(new_coords[-1])
-                    # add the new implied coordinate
-                    new_coords.append(new_implied_coordinate)
-        # add current coordinate object from this
-        # iteration on the original coordinate set
+        # single point contours are start and end coordinates
         new_coordinate = Coordinate(
             coord[0],
             coord[1],
-            oncurve=on_curve,
-            startpoint=start_coord,
-            endpoint=end_coord,
-            implied=False,
+            oncurve=oncurve[x],
+            startpoint=x in startpoint_indices,
+            endpoint=x in endpoint_indices,
+            implied=implied[x],
         )
+        # set next coordinate attr in the last coordinate of
+        # the same contour if there is one
         if len(new_coords) > 0 and not new_coords[-1].endpoint:
             new_coords[-1].set_coord_next(new_coordinate)
             new_coordinate.set_coord_previous(new_coords[-1])
         new_coords.append(new_coordinate)
 
     return new_coords
+
+
+def implied_oncurve_points(
+    coords: Sequence[Tuple[Any, Any]], endpoints: Sequence[int], flags: Sequence[int]
+) -> Tuple[List[Tuple[Any, Any]], List[int], List[bool], List[bool]]:
+    """
+    Returns a tuple of (coordinates, contour end point indices,
+    on-curve indicators, implied point indicators) arrays for a
+    quadratic outline with the implied on-curve points between
+    consecutive off-curve points, including the pair of the
+    contour end point and start point.  Contours that begin with
+    an off-curve point start at the preceding on-curve point, the
+    implied point of the end point and start point pair or the
+    contour end point.  Implied point coordinates are rounded with
+    the fontTools otRound approach.
+    """
+    new_points: List[Tuple[Any, Any]] = []
+    new_endpoints: List[int] = []
+    new_oncurve: List[bool] = []
+    new_implied: List[bool] = []
+    start = 0
+    for end in endpoints:
+        contour_start = len(new_points)
+        # the contour start point follows the contour end point,
+        # single point contours do not define curves
+        previous = coords[end]
+        previous_on = (flags[end] & FLAG_ON_CURVE) != 0 or end == start
+        for index in range(start, end + 1):
+            point = coords[index]
+            on = (flags[index] & FLAG_ON_CURVE) != 0
+            if not (on or previous_on):
+                new_points.append(midpoint_between_coordinates(previous, point))
+                new_oncurve.append(True)
+                new_implied.append(True)
+            new_points.append(point)
+            new_oncurve.append(on)
+            new_implied.append(False)
+            previous = point
+            previous_on = on
+        if not new_oncurve[contour_start] and new_oncurve[-1]:
+            # contours start on-curve, move the on-curve end point
+            # that precedes an off-curve start point to the start
+            new_points.insert(contour_start, new_points.pop())
+            new_oncurve.insert(contour_start, new_oncurve.pop())
+            new_implied.insert(contour_start, new_implied.pop())
+        new_endpoints.append(len(new_points) - 1)
+        start = end + 1
+    return new_points, new_endpoints, new_oncurve, new_implied
+
+
+def contour_point_indices(endpoints: Sequence[int]) -> Tuple[Set[int], Set[int]]:
+    """
+    Returns a tuple of (start point index set, end point index set)
+    for a glyph endPtsOfContours array.  Contour start points are
+    the first point index and the point indices that follow a
+    previous contour end point.
+    """
+    endpoint_indices = set(endpoints)
+    startpoint_indices = {0} if len(endpoints) > 0 else set()
+    startpoint_indices.update(endpoint + 1 for endpoint in endpoints[:-1])
+    return startpoint_indices, endpoint_indices
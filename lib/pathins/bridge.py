@@ -1,8 +1,21 @@
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
 import pathops  # type: ignore
-from fontTools.pens.recordingPen import DecomposingRecordingPen  # type: ignore
+from fontTools.misc.transform import Identity  # type: ignore
+from fontTools.pens.basePen import AbstractPen  # type: ignore
+from fontTools.pens.recordingPen import RecordingPen, replayRecording  # type: ignore
+from fontTools.pens.transformPen import TransformPen  # type: ignore
 from fontTools.pens.ttGlyphPen import TTGlyphPen  # type: ignore
 from fontTools.ttLib import ttFont  # type: ignore
 from fontTools.ttLib.tables import _g_l_y_f  # type: ignore
+from fontTools.ttLib.tables import ttProgram  # type: ignore
+
+
+# pen recording operations, see fontTools.pens.recordingPen
+Recording = List[Tuple[str, Tuple[Any, ...]]]
+# glyph (coordinates, contour end point indices, flags)
+GlyphPoints = Tuple[_g_l_y_f.GlyphCoordinates, List[int], array]
 
 
 def ttfont_glyph_to_skia_path(glyph_name: str, tt_font: ttFont.TTFont) -> pathops.Path:
@@ -10,21 +23,10 @@ def ttfont_glyph_to_skia_path(glyph_name: str, tt_font: ttFont.TTFont) -> pathop
     Converts fontTools.ttLib.TTFont glyph to a pathops.Path object
     by glyph name.  During this conversion, all composite paths are
     decomposed.
-    """
-    glyf_table = tt_font["glyf"]
-    glyph_set: ttFont._TTGlyphSet = tt_font.getGlyphSet()
-    tt_glyph = glyf_table[glyph_name]
-    skia_path = pathops.Path()
-    skia_path_pen = skia_path.getPen()
 
-    if tt_glyph.isComposite():
-        decompose_pen = DecomposingRecordingPen(glyph_set)
-        glyph_set[glyph_name].draw(decompose_pen)
-        decompose_pen.replay(skia_path_pen)
-        return skia_path
-    else:
-        glyph_set[glyph_name].draw(skia_path_pen)
-        return skia_path
+    Use a GlyphPathConverter to convert multiple glyphs in a font.
+    """
+    return GlyphPathConverter(tt_font).convert(glyph_name)
 
 
 def skia_path_to_ttfont_glyph(skia_path: pathops.Path) -> _g_l_y_f.Glyph:
@@ -37,3 +39,273 @@ def skia_path_to_ttfont_glyph(skia_path: pathops.Path) -> _g_l_y_f.Glyph:
     glyph = tt_pen.glyph()
     glyph.recalcBounds(glyfTable=None)
     return glyph
+
+
+class ComponentDecomposer(object):
+    """
+    Decomposes composite glyphs with memoized component outlines.
+
+    The outline of every glyph that is referenced as a component
+    is drawn and decomposed once.  Composite glyphs are assembled
+    from the memoized pen recordings of their components with the
+    component transforms applied so that decomposition cost scales
+    with the number of unique component outlines rather than the
+    number of component references.
+    """
+
+    def __init__(self, glyph_set: Any) -> None:
+        self.glyph_set = glyph_set
+        # glyph name : decomposed, untransformed pen recording
+        self._recordings: Dict[str, Recording] = {}
+
+    def __len__(self) -> int:
+        return len(self._recordings)
+
+    def draw(self, glyph_name: str, pen: AbstractPen) -> None:
+        """
+        Draws the decomposed outline of `glyph_name` to `pen`.
+        """
+        recording_pen = _ComponentRecordingPen(self)
+        self.glyph_set[glyph_name].draw(recording_pen)
+        replayRecording(recording_pen.value, pen)
+
+    def component_recording(self, glyph_name: str) -> Recording:
+        """
+        Returns the memoized, decomposed pen recording of a
+        component glyph.
+        """
+        recording = self._recordings.get(glyph_name)
+        if recording is None:
+            recording_pen = _ComponentRecordingPen(self)
+            self.glyph_set[glyph_name].draw(recording_pen)
+            recording = recording_pen.value
+            self._recordings[glyph_name] = recording
+        return recording
+
+
+class PointDecomposer(object):
+    """
+    Decomposes composite glyphs in point space with memoized
+    component coordinates.
+
+    Component offsets and 2x2 transforms (including point
+    matching anchors and scaled component offsets) are applied
+    directly to the coordinate arrays of nested components, so
+    decomposed glyphs keep the point structure of the source
+    glyph outlines.  Composite coordinates are rounded once,
+    after all nested transforms are applied.  The points of every
+    glyph that is referenced as a component are memoized.
+    """
+
+    def __init__(self, glyf_table: Any) -> None:
+        self.glyf_table = glyf_table
+        # glyph name : decomposed, untransformed, unrounded points
+        self._points: Dict[str, GlyphPoints] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def decompose(self, glyph_name: str) -> _g_l_y_f.Glyph:
+        """
+        Returns a new simple fontTools.ttLib._g_l_y_f.Glyph with
+        the decomposed outline of `glyph_name`.
+        """
+        coordinates, end_points, flags = self._glyph_points(glyph_name)
+        coordinates = coordinates.copy()
+        coordinates.toInt()
+        return _points_to_glyph(coordinates, end_points, flags)
+
+    def component_points(self, glyph_name: str) -> GlyphPoints:
+        """
+        Returns the memoized, decomposed points of a component
+        glyph.  Do not modify the returned objects.
+        """
+        points = self._points.get(glyph_name)
+        if points is None:
+            # placeholder points protect against component cycles
+            # in malformed fonts
+            self._points[glyph_name] = _empty_points()
+            points = self._glyph_points(glyph_name)
+            self._points[glyph_name] = points
+        return points
+
+    def _glyph_points(self, glyph_name: str) -> GlyphPoints:
+        glyph = self.glyf_table[glyph_name]
+        if glyph.numberOfContours > 0:
+            return (
+                glyph.coordinates,
+                list(glyph.endPtsOfContours),
+                array("B", glyph.flags),
+            )
+        if not glyph.isComposite():
+            return _empty_points()
+
+        all_coordinates, all_end_points, all_flags = _empty_points()
+        for component in glyph.components:
+            # skip missing base glyphs, consistent with the
+            # ComponentDecomposer behavior
+            if component.glyphName not in self.glyf_table.glyphs:
+                continue
+            coordinates, end_points, flags = self.component_points(component.glyphName)
+            if len(coordinates) == 0:
+                continue
+            coordinates = coordinates.copy()
+            _transform_component(component, coordinates, all_coordinates)
+            offset = len(all_coordinates)
+            all_coordinates.extend(coordinates)
+            all_end_points.extend(end_point + offset for end_point in end_points)
+            all_flags.extend(flags)
+        return all_coordinates, all_end_points, all_flags
+
+
+def _transform_component(component: Any, coordinates: Any, all_coordinates: Any) -> None:
+    # transforms component coordinates in place, see the
+    # fontTools glyf Glyph.getCoordinates implementation
+    transform = getattr(component, "transform", None)
+    if hasattr(component, "firstPt"):
+        # point matching anchors are compared after the
+        # component transform is applied
+        if transform is not None:
+            coordinates.transform(transform)
+        x1, y1 = all_coordinates[component.firstPt]
+        x2, y2 = coordinates[component.secondPt]
+        coordinates.translate((x1 - x2, y1 - y2))
+    elif transform is None:
+        coordinates.translate((component.x, component.y))
+    elif component.flags & _g_l_y_f.SCALED_COMPONENT_OFFSET:
+        # scale the component offset
+        coordinates.translate((component.x, component.y))
+        coordinates.transform(transform)
+    else:
+        coordinates.transform(transform)
+        coordinates.translate((component.x, component.y))
+
+
+def _empty_points() -> GlyphPoints:
+    return _g_l_y_f.GlyphCoordinates(), [], array("B")
+
+
+def _points_to_glyph(
+    coordinates: _g_l_y_f.GlyphCoordinates, end_points: List[int], flags: array
+) -> _g_l_y_f.Glyph:
+    glyph = _g_l_y_f.Glyph()
+    glyph.numberOfContours = len(end_points)
+    if glyph.numberOfContours > 0:
+        glyph.coordinates = coordinates
+        glyph.endPtsOfContours = end_points
+        glyph.flags = flags
+        glyph.program = ttProgram.Program()
+        glyph.program.fromBytecode(b"")
+    glyph.recalcBounds(glyfTable=None)
+    return glyph
+
+
+class GlyphPathConverter(object):
+    """
+    Converts fontTools.ttLib.TTFont glyphs to pathops.Path objects
+    by glyph name.  All composite paths are decomposed.
+
+    The font glyph set and glyf table references are built once on
+    instantiation and component outlines are memoized across
+    conversions.  Use one converter for all glyphs in a font.
+    """
+
+    def __init__(self, tt_font: ttFont.TTFont) -> None:
+        self.glyf_table = tt_font["glyf"]
+        # unbound method call so that the glyph set holds a reference
+        # to `tt_font` as defined, including weakref.proxy objects
+        self.glyph_set: ttFont._TTGlyphSet = ttFont.TTFont.getGlyphSet(tt_font)
+        self.decomposer = ComponentDecomposer(self.glyph_set)
+
+    def convert(self, glyph_name: str) -> pathops.Path:
+        """
+        Returns the decomposed pathops.Path for `glyph_name`.
+        """
+        skia_path = pathops.Path()
+        skia_path_pen = skia_path.getPen()
+        if self.glyf_table[glyph_name].isComposite():
+            self.decomposer.draw(glyph_name, skia_path_pen)
+        else:
+            self.glyph_set[glyph_name].draw(skia_path_pen)
+        return skia_path
+
+
+class _ComponentRecordingPen(RecordingPen):
+    """
+    Recording pen that replaces components with the memoized
+    decomposed component outlines of a ComponentDecomposer.
+    """
+
+    def __init__(self, decomposer: ComponentDecomposer) -> None:
+        super(_ComponentRecordingPen, self).__init__()
+        self.decomposer = decomposer
+
+    def addComponent(self, glyphName: str, transformation: Tuple) -> None:
+        # skip missing base glyphs, consistent with the default
+        # fontTools.pens.basePen.DecomposingPen behavior
+        if glyphName not in self.decomposer.glyph_set:
+            return
+        recording = self.decomposer.component_recording(glyphName)
+        if transformation == Identity:
+            self.value.extend(recording)
+        else:
+            replayRecording(recording, TransformPen(self, transformation))
+
+
+class DecomposedGlyph(object):
+    """
+    Glyph-level decomposition data that is shared across
+    analyses.  The decomposed pathops.Path and the decomposed
+    fontTools.ttLib._g_l_y_f.Glyph are built on first access
+    and re-used on all subsequent accesses.  Composite glyphs
+    are decomposed in point space, not through the pathops.Path.
+    """
+
+    def __init__(
+        self,
+        glyph_name: str,
+        tt_font: ttFont.TTFont,
+        converter: Optional[GlyphPathConverter] = None,
+        point_decomposer: Optional[PointDecomposer] = None,
+    ) -> None:
+        self.glyph_name = glyph_name
+        self.tt_font = tt_font
+        self.converter = converter
+        self.point_decomposer = point_decomposer
+        self.glyf_table = tt_font["glyf"]
+        # source glyph, composite glyphs are *not* decomposed
+        self.glyph: _g_l_y_f.Glyph = self.glyf_table[glyph_name]
+        self._skia_path: Optional[pathops.Path] = None
+        self._decomposed_glyph: Optional[_g_l_y_f.Glyph] = None
+        # points in the decomposition data, counted when built
+        self._number_of_points = 0
+
+    @property
+    def skia_path(self) -> pathops.Path:
+        if self._skia_path is None:
+            if self.converter is None:
+                self.converter = GlyphPathConverter(self.tt_font)
+            self._skia_path = self.converter.convert(self.glyph_name)
+            self._number_of_points += len(self._skia_path.points)
+        return self._skia_path
+
+    @property
+    def decomposed_glyph(self) -> _g_l_y_f.Glyph:
+        if self._decomposed_glyph is None:
+            if self.glyph.isComposite():
+                if self.point_decomposer is None:
+                    self.point_decomposer = PointDecomposer(self.glyf_table)
+                self._decomposed_glyph = self.point_decomposer.decompose(self.glyph_name)
+                coordinates = self._decomposed_glyph.getCoordinates(self.glyf_table)[0]
+                self._number_of_points += len(coordinates)
+            else:
+                self._decomposed_glyph = self.glyph
+        return self._decomposed_glyph
+
+    def number_of_points(self) -> int:
+        """
+        Returns the number of outline points in the decomposition
+        data that were built.  Data that were not accessed are not
+        built.  The points are counted once when the data are built.
+        """
+        return self._number_of_points
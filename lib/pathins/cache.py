@@ -0,0 +1,182 @@
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from fontTools.ttLib import TTFont  # type: ignore
+
+from .bridge import DecomposedGlyph, GlyphPathConverter, PointDecomposer
+
+# default bounds on the number of cached glyphs and
+# on the estimated memory use of the cached glyph data
+DEFAULT_MAXSIZE = 4096
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# approximate memory use per cached outline point, including
+# the Python object overhead of the pathops.Path and
+# fontTools Glyph coordinate and flag storage
+BYTES_PER_POINT = 64
+# approximate fixed memory use per cached glyph entry
+BYTES_PER_ENTRY = 1024
+
+# TTFont instance : DecompositionCache instance
+_font_caches: "weakref.WeakKeyDictionary[TTFont, DecompositionCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# (id(glyf table instance), memo name) : glyph name : memoized value
+_glyf_memos: Dict[Tuple[int, str], Dict[str, Any]] = {}
+
+
+class DecompositionCache(object):
+    """
+    Per-font cache of glyph decomposition data keyed by glyph
+    name.  Cached bridge.DecomposedGlyph objects hold the
+    decomposed pathops.Path and the decomposed fontTools Glyph
+    so that they are re-used by all analyses of a glyph.
+
+    The cache is bounded by the number of glyphs (`maxsize`) and
+    by an estimate of the memory use of cached data (`max_bytes`).
+    Least recently used glyphs are evicted first.  The cache is
+    cleared when the font glyf table is reloaded.
+    """
+
+    def __init__(
+        self,
+        tt_font: TTFont,
+        maxsize: int = DEFAULT_MAXSIZE,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        # weak reference to the font so that the module level
+        # cache registry does not keep fonts alive
+        self.tt_font: Any = weakref.proxy(tt_font)
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, DecomposedGlyph]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._last_glyph_name: Optional[str] = None
+        self._glyf_table = tt_font["glyf"]
+        self.converter = GlyphPathConverter(self.tt_font)
+        self.point_decomposer = PointDecomposer(self._glyf_table)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, glyph_name: str) -> bool:
+        return glyph_name in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        """
+        Returns the estimated memory use of the cached data.
+        """
+        self._update_size(self._last_glyph_name)
+        return self._total_bytes
+
+    def get(self, glyph_name: str) -> DecomposedGlyph:
+        """
+        Returns the bridge.DecomposedGlyph for `glyph_name`.  Raises
+        KeyError if the glyph is not in the font.
+        """
+        self._validate()
+        # decomposition data are built lazily by the caller after
+        # they are returned from the cache.  Account for data that
+        # were built on the most recently returned glyph.
+        self._update_size(self._last_glyph_name)
+
+        decomposed = self._entries.get(glyph_name)
+        if decomposed is None:
+            self.misses += 1
+            decomposed = DecomposedGlyph(
+                glyph_name,
+                self.tt_font,
+                converter=self.converter,
+                point_decomposer=self.point_decomposer,
+            )
+            self._entries[glyph_name] = decomposed
+            self._sizes[glyph_name] = 0
+        else:
+            self.hits += 1
+            self._entries.move_to_end(glyph_name)
+
+        self._last_glyph_name = glyph_name
+        self._update_size(glyph_name)
+        self._evict()
+        return decomposed
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self._total_bytes = 0
+        self._last_glyph_name = None
+        self._glyf_table = self.tt_font["glyf"]
+        self.converter = GlyphPathConverter(self.tt_font)
+        self.point_decomposer = PointDecomposer(self._glyf_table)
+
+    def _validate(self) -> None:
+        # a new glyf table object indicates that the font
+        # tables were reloaded and cached data are stale
+        if self.tt_font["glyf"] is not self._glyf_table:
+            self.clear()
+
+    def _update_size(self, glyph_name: Optional[str]) -> None:
+        if glyph_name is None or glyph_name not in self._entries:
+            return
+        size = _estimate_size(self._entries[glyph_name])
+        self._total_bytes += size - self._sizes[glyph_name]
+        self._sizes[glyph_name] = size
+
+    def _evict(self) -> None:
+        # the most recently used glyph is never evicted
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.maxsize or self._total_bytes > self.max_bytes
+        ):
+            glyph_name, _ = self._entries.popitem(last=False)
+            self._total_bytes -= self._sizes.pop(glyph_name)
+
+
+def decomposition_cache(tt_font: TTFont) -> DecompositionCache:
+    """
+    Returns the DecompositionCache for a fontTools.ttLib.TTFont
+    object.  A new cache is created on the first request for
+    a font.  Caches are released with their font objects.
+    """
+    cache = _font_caches.get(tt_font)
+    if cache is None:
+        cache = DecompositionCache(tt_font)
+        _font_caches[tt_font] = cache
+    return cache
+
+
+def decomposed_glyph(glyph_name: str, tt_font: TTFont) -> DecomposedGlyph:
+    """
+    Returns the cached bridge.DecomposedGlyph for `glyph_name`
+    in `tt_font`.
+    """
+    return decomposition_cache(tt_font).get(glyph_name)
+
+
+def glyf_memo(tt_font: TTFont, name: str) -> Dict[str, Any]:
+    """
+    Returns the `name` memo dictionary of glyph-level values for
+    the glyf table of `tt_font`.  Memos are keyed by the glyf
+    table object so that reloaded tables start with new memos,
+    and they are released with the glyf table.
+    """
+    glyf_table = tt_font["glyf"]
+    key = (id(glyf_table), name)
+    memo = _glyf_memos.get(key)
+    if memo is None:
+        memo = {}
+        _glyf_memos[key] = memo
+        # fontTools tables are not hashable, release the
+        # memo when the glyf table is garbage collected
+        weakref.finalize(glyf_table, _glyf_memos.pop, key, None)
+    return memo
+
+
+def _estimate_size(decomposed: DecomposedGlyph) -> int:
+    # only account for decomposition data that were built
+    return BYTES_PER_ENTRY + (decomposed.number_of_points() * BYTES_PER_POINT)
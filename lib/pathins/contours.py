@@ -1,11 +1,32 @@
 import argparse
+import struct
+from functools import partial
+from typing import Any, Dict, List
 
 from fontTools.ttLib import TTFont  # type: ignore
 from fontTools.ttLib.tables._g_l_y_f import Glyph  # type: ignore
 
-from .bridge import skia_path_to_ttfont_glyph, ttfont_glyph_to_skia_path
+from .bridge import DecomposedGlyph
+from .cache import glyf_memo
+from .engine import glyph_map, jobs_count
+from .formats import write_glyph_records
+from .selection import selected_glyph_names
 from .stringbuilder import cyan_bright_text
-from .validators import validate_fontpath, validate_glyph_in_font
+from .utils import open_font
+from .validators import validate_fontpath
+from .writer import ReportWriter
+
+# composite glyph component flags, see the OpenType glyf table
+# specification
+ARG_1_AND_2_ARE_WORDS = 0x0001
+WE_HAVE_A_SCALE = 0x0008
+MORE_COMPONENTS = 0x0020
+WE_HAVE_AN_X_AND_Y_SCALE = 0x0040
+WE_HAVE_A_TWO_BY_TWO = 0x0080
+
+# size of the glyph header that precedes the glyph description
+# (int16 numberOfContours and the int16 xMin, yMin, xMax, yMax)
+GLYPH_HEADER_SIZE = 10
 
 
 def contours_run(args: argparse.Namespace) -> None:
@@ -16,42 +37,142 @@ def contours_run(args: argparse.Namespace) -> None:
     glyph set.
     """
     fontpath: str = args.fontpath
-    glyphname: str = args.glyphname
+    output_format: str = getattr(args, "format", "text")
 
     # --------------------
     # CLI arg validations
     # --------------------
-    validate_fontpath(fontpath)
+    font_file = validate_fontpath(fontpath)
 
-    tt = TTFont(fontpath)
-    glyf_table = tt["glyf"]
+    with open_font(font_file) as tt, ReportWriter() as writer:
+        glyph_names = selected_glyph_names(args, tt)
+        if output_format != "text":
+            write_glyph_records(
+                writer,
+                fontpath,
+                tt,
+                glyph_names,
+                [contours_record],
+                output_format,
+                jobs=jobs_count(getattr(args, "jobs", 1)),
+                cache_path=getattr(args, "cache", None),
+            )
+        else:
+            glyph_report = partial(contours_glyph_report, nocolor=args.nocolor)
+            jobs = jobs_count(getattr(args, "jobs", 1))
+            for report in glyph_map(
+                glyph_report,
+                fontpath,
+                tt,
+                glyph_names,
+                jobs=jobs,
+                cache_path=getattr(args, "cache", None),
+            ):
+                writer.writeline(report)
 
-    if glyphname:
-        # confirm that `glyphname` request is in the font
-        validate_glyph_in_font(glyphname, tt)
 
-        glyph = glyf_table[glyphname]
-        print(
-            f"[ {cyan_bright_text(glyphname, nocolor=args.nocolor)} ]: "
-            f"{number_of_contours(glyphname, glyph, tt)}"
-        )
-    else:
-        glyph_names = tt.getGlyphOrder()
-        for local_glyphname in glyph_names:
-            glyph = glyf_table[local_glyphname]
+def contours_glyph_report(glyphname: str, tt: TTFont, nocolor: bool) -> str:
+    """
+    Returns the contour number report string for a single glyph.
+    """
+    return (
+        f"[ {cyan_bright_text(glyphname, nocolor=nocolor)} ]: "
+        f"{contour_count(glyphname, tt)}"
+    )
 
-            print(
-                f"[ {cyan_bright_text(local_glyphname, nocolor=args.nocolor)} ]: "
-                f"{number_of_contours(local_glyphname, glyph, tt)}"
-            )
+
+def contours_section(decomposed: DecomposedGlyph, nocolor: bool) -> str:
+    """
+    Returns the contour number report section string for
+    shared glyph decomposition data.
+    """
+    return f"{contour_count(decomposed.glyph_name, decomposed.tt_font)}"
 
 
 def number_of_contours(glyphname: str, glyph: Glyph, tt: TTFont) -> int:
     """
     Returns the number of contours in a glyph outline.  Composite
-    glyphs are decomposed before assessment.
+    glyph counts are the sum of the component glyph counts.
     """
     if glyph.isComposite():
-        # decompose composite glyphs
-        glyph = skia_path_to_ttfont_glyph(ttfont_glyph_to_skia_path(glyphname, tt))
+        return contour_count(glyphname, tt)
     return glyph.numberOfContours
+
+
+def contour_count(glyphname: str, tt: TTFont) -> int:
+    """
+    Returns the number of contours in a glyph outline.  Counts
+    are read from the glyph header of the raw glyf table data
+    without a glyph decompile.  Composite glyph counts are the
+    sum of the component glyph counts, missing component glyphs
+    are skipped.  Counts are memoized per font so that every
+    glyph in the component graph is read once.
+    """
+    return _contour_count(
+        glyphname, tt["glyf"], tt.getGlyphOrder(), glyf_memo(tt, "contour_count")
+    )
+
+
+def _contour_count(
+    glyphname: str, glyf_table: Any, glyph_order: List[str], counts: Dict[str, int]
+) -> int:
+    count = counts.get(glyphname)
+    if count is not None:
+        return count
+    # placeholder count protects against component cycles
+    # in malformed fonts
+    counts[glyphname] = 0
+
+    glyph = glyf_table.glyphs[glyphname]
+    component_names: List[str] = []
+    if hasattr(glyph, "data"):
+        # glyphs that are not expanded hold their raw glyf table bytes
+        data = glyph.data
+        count = struct.unpack(">h", data[:2])[0] if len(data) >= 2 else 0
+        if count < 0:
+            component_names = [
+                glyph_order[glyph_id]
+                for glyph_id in _component_glyph_ids(data)
+                if glyph_id < len(glyph_order)
+            ]
+    else:
+        count = glyph.numberOfContours
+        if count < 0:
+            component_names = [component.glyphName for component in glyph.components]
+
+    if count < 0:
+        # skip missing base glyphs, consistent with the
+        # PointDecomposer and ComponentDecomposer behavior
+        count = sum(
+            _contour_count(component_name, glyf_table, glyph_order, counts)
+            for component_name in component_names
+            if component_name in glyf_table.glyphs
+        )
+    counts[glyphname] = count
+    return count
+
+
+def _component_glyph_ids(data: bytes) -> List[int]:
+    # returns the component glyph IDs of raw composite glyph data
+    glyph_ids: List[int] = []
+    offset = GLYPH_HEADER_SIZE
+    flags = MORE_COMPONENTS
+    while flags & MORE_COMPONENTS:
+        flags, glyph_id = struct.unpack_from(">HH", data, offset)
+        glyph_ids.append(glyph_id)
+        offset += 8 if flags & ARG_1_AND_2_ARE_WORDS else 6
+        if flags & WE_HAVE_A_SCALE:
+            offset += 2
+        elif flags & WE_HAVE_AN_X_AND_Y_SCALE:
+            offset += 4
+        elif flags & WE_HAVE_A_TWO_BY_TWO:
+            offset += 8
+    return glyph_ids
+
+
+def contours_record(decomposed: DecomposedGlyph) -> Dict[str, Any]:
+    """
+    Returns the contour number record fields for shared glyph
+    decomposition data.
+    """
+    return {"contours": contour_count(decomposed.glyph_name, decomposed.tt_font)}
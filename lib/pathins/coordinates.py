@@ -1,14 +1,21 @@
 import argparse
 import os
-import sys
-from typing import Any
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
 from fontTools.ttLib import TTFont  # type: ignore
 from fontTools.ttLib.tables._g_l_y_f import Glyph  # type: ignore
 
-from .bridge import skia_path_to_ttfont_glyph, ttfont_glyph_to_skia_path
+from .bezier import contour_point_indices
+from .bridge import DecomposedGlyph
+from .cache import decomposed_glyph
+from .engine import glyph_map, jobs_count
+from .formats import TABLE_FORMATS, write_glyph_records, write_glyph_rows
+from .selection import selected_glyph_names
 from .stringbuilder import green_text, red_text, report_header
-from .validators import validate_fontpath, validate_glyph_in_font
+from .utils import open_font
+from .validators import validate_fontpath
+from .writer import ReportWriter
 
 FLAG_ON_CURVE = 0x01
 
@@ -16,6 +23,19 @@ ON_OFF = ["", "----- on -----"]
 START_STRING = "START ~~~~~~~~"
 END_STRING = "~~~~~~~~~~ END"
 
+# coordinates table columns, boolean values are written as 1 / 0
+COORDINATES_COLUMNS = (
+    "font",
+    "glyph",
+    "contour",
+    "point",
+    "x",
+    "y",
+    "oncurve",
+    "startpoint",
+    "endpoint",
+)
+
 
 def coordinates_run(args: argparse.Namespace) -> None:
     """
@@ -26,45 +46,75 @@ def coordinates_run(args: argparse.Namespace) -> None:
     glyph set.
     """
     fontpath: str = args.fontpath
-    glyphname: str = args.glyphname
+    output_format: str = getattr(args, "format", "text")
 
     # --------------------
     # CLI arg validations
     # --------------------
-    validate_fontpath(fontpath)
-
-    tt = TTFont(fontpath)
-    glyf_table = tt["glyf"]
-
-    if glyphname:
-        # confirm that `glyphname` request is in the font
-        validate_glyph_in_font(glyphname, tt)
+    font_file = validate_fontpath(fontpath)
+
+    with open_font(font_file) as tt, ReportWriter() as writer:
+        glyph_names = selected_glyph_names(args, tt)
+        if output_format in TABLE_FORMATS:
+            write_glyph_rows(
+                writer,
+                fontpath,
+                tt,
+                glyph_names,
+                COORDINATES_COLUMNS,
+                coordinates_rows,
+                jobs=jobs_count(getattr(args, "jobs", 1)),
+                cache_path=getattr(args, "cache", None),
+            )
+        elif output_format != "text":
+            write_glyph_records(
+                writer,
+                fontpath,
+                tt,
+                glyph_names,
+                [coordinates_record],
+                output_format,
+                jobs=jobs_count(getattr(args, "jobs", 1)),
+                cache_path=getattr(args, "cache", None),
+            )
+        else:
+            len_glyph_names = len(glyph_names)
+            glyph_report = partial(coordinates_glyph_report, nocolor=args.nocolor)
+            jobs = jobs_count(getattr(args, "jobs", 1))
+            for x, report in enumerate(
+                glyph_map(
+                    glyph_report,
+                    fontpath,
+                    tt,
+                    glyph_names,
+                    jobs=jobs,
+                    cache_path=getattr(args, "cache", None),
+                )
+            ):
+                writer.write(report)
+                if x + 1 < len_glyph_names:
+                    # append a newline to all glyph reports except last
+                    writer.writeline()
 
-        glyph = glyf_table[glyphname]
 
-        # decompose composite glyphs
-        if glyph.isComposite():
-            glyph = skia_path_to_ttfont_glyph(ttfont_glyph_to_skia_path(glyphname, tt))
+def coordinates_glyph_report(glyphname: str, tt: TTFont, nocolor: bool) -> str:
+    """
+    Returns the coordinates report string, including the report
+    header, for a single glyph.
+    """
+    header = report_header(f"'{glyphname}' coordinates", nocolor=nocolor)
+    section = coordinates_section(decomposed_glyph(glyphname, tt), nocolor=nocolor)
+    return f"{header}{os.linesep}{section}{os.linesep}"
 
-        print(report_header(f"'{glyphname}' coordinates", nocolor=args.nocolor))
-        sys.stdout.write(coordinates_report(glyph, glyf_table, nocolor=args.nocolor))
-    else:
-        glyph_names = tt.getGlyphOrder()
-        len_glyph_names = len(glyph_names)
-        for x, local_glyphname in enumerate(glyph_names):
-            glyph = glyf_table[local_glyphname]
-
-            # decompose composite glyphs
-            if glyph.isComposite():
-                glyph = skia_path_to_ttfont_glyph(
-                    ttfont_glyph_to_skia_path(local_glyphname, tt)
-                )
 
-            print(report_header(f"'{local_glyphname}' coordinates", nocolor=args.nocolor))
-            sys.stdout.write(coordinates_report(glyph, glyf_table, nocolor=args.nocolor))
-            if x + 1 < len_glyph_names:
-                # append a newline to all glyph reports except last
-                print("")
+def coordinates_section(decomposed: DecomposedGlyph, nocolor: bool) -> str:
+    """
+    Returns the coordinates report section string for shared
+    glyph decomposition data.  Composite glyphs are decomposed.
+    """
+    return coordinates_report(
+        decomposed.decomposed_glyph, decomposed.glyf_table, nocolor=nocolor
+    ).rstrip(os.linesep)
 
 
 def coordinates_report(glyph: Glyph, glyf_table: Any, nocolor: bool) -> str:
@@ -75,9 +125,9 @@ def coordinates_report(glyph: Glyph, glyf_table: Any, nocolor: bool) -> str:
     if glyph.numberOfContours > 0:
         coords, endpoints, flags = glyph.getCoordinates(glyf_table)
 
-        endpoint_coordinates = [coords[endpoint] for endpoint in endpoints]
+        startpoint_indices, endpoint_indices = contour_point_indices(endpoints)
 
-        coordinates_string: str = ""
+        coordinate_lines: List[str] = []
         for x, coord in enumerate(coords):
             # on- and off-curve points are defined in
             # the `flags` integer array that are mapped
@@ -89,24 +139,75 @@ def coordinates_report(glyph: Glyph, glyf_table: Any, nocolor: bool) -> str:
             # this is a start coordinate if it
             # (1) is the first coordinate in the iterable
             # (2) follows a previous endpoint coordinate
-            start_coord = (x == 0) or (coords[x - 1] in endpoint_coordinates)
-            if start_coord:
-                coordinates_string += (
+            if x in startpoint_indices:
+                coordinate_lines.append(
                     f"{str(coord): >13} "
                     f"{green_text(START_STRING, nocolor=nocolor): <13}{os.linesep}"
                 )
             # end coordinates are defined by the indices returned
             # in the Glyph.getGlyphCoordinates method return tuple
-            # compare current test coordinate with those coordinate
-            # values
-            elif coords[x] in endpoint_coordinates:
-                coordinates_string += (
+            elif x in endpoint_indices:
+                coordinate_lines.append(
                     f"{str(coord): >13} "
                     f"{red_text(END_STRING, nocolor=nocolor): <13}{os.linesep}"
                 )
             else:
-                coordinates_string += f"{str(coord): >13} {on_off: >13}{os.linesep}"
+                coordinate_lines.append(f"{str(coord): >13} {on_off: >13}{os.linesep}")
 
-        return coordinates_string
+        return "".join(coordinate_lines)
     else:
         return f"   No contours{os.linesep}"
+
+
+def coordinates_record(decomposed: DecomposedGlyph) -> Dict[str, Any]:
+    """
+    Returns the coordinates record fields for shared glyph
+    decomposition data.  Composite glyphs are decomposed.
+    """
+    glyph = decomposed.decomposed_glyph
+    if glyph.numberOfContours <= 0:
+        return {"coordinates": []}
+    coords, endpoints, flags = glyph.getCoordinates(decomposed.glyf_table)
+    startpoint_indices, endpoint_indices = contour_point_indices(endpoints)
+    return {
+        "coordinates": [
+            {
+                "x": coord[0],
+                "y": coord[1],
+                "oncurve": (flags[x] & FLAG_ON_CURVE) != 0,
+                "startpoint": x in startpoint_indices,
+                "endpoint": x in endpoint_indices,
+            }
+            for x, coord in enumerate(coords)
+        ]
+    }
+
+
+def coordinates_rows(decomposed: DecomposedGlyph) -> List[Tuple[Any, ...]]:
+    """
+    Returns the coordinates table rows, without font and glyph
+    columns, for shared glyph decomposition data.  Composite
+    glyphs are decomposed.
+    """
+    glyph = decomposed.decomposed_glyph
+    if glyph.numberOfContours <= 0:
+        return []
+    coords, endpoints, flags = glyph.getCoordinates(decomposed.glyf_table)
+    startpoint_indices, endpoint_indices = contour_point_indices(endpoints)
+    rows: List[Tuple[Any, ...]] = []
+    contour = -1
+    for x, coord in enumerate(coords):
+        if x in startpoint_indices:
+            contour += 1
+        rows.append(
+            (
+                contour,
+                x,
+                coord[0],
+                coord[1],
+                flags[x] & FLAG_ON_CURVE,
+                int(x in startpoint_indices),
+                int(x in endpoint_indices),
+            )
+        )
+    return rows
@@ -2,6 +2,19 @@ from typing import Optional
 
 
 class Coordinate(object):
+    # fixed attribute storage, Coordinate objects are allocated
+    # for every outline point in full glyph set analyses
+    __slots__ = (
+        "x",
+        "y",
+        "oncurve",
+        "startpoint",
+        "endpoint",
+        "implied",
+        "coord_next",
+        "coord_previous",
+    )
+
     def __init__(
         self,
         x: int,
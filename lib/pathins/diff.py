@@ -0,0 +1,241 @@
+import argparse
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from fontTools.ttLib import TTFont  # type: ignore
+from fontTools.ttLib.tables import _g_l_y_f  # type: ignore
+
+from .bridge import DecomposedGlyph
+from .cache import decomposed_glyph
+from .contours import contour_count
+from .direction import direction_record
+from .diskcache import glyph_digest
+from .engine import glyph_map, jobs_count
+from .formats import write_records
+from .segments import segments_record
+from .selection import select_analyses
+from .stringbuilder import diff_metric_line, diff_result, diff_summary
+from .utils import open_font
+from .validators import validate_fontpath
+from .writer import ReportWriter
+
+# glyph change status values
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+FLAG_ON_CURVE = 0x01
+# composite glyph flags that change the component offset
+COMPONENT_OFFSET_FLAGS = (
+    _g_l_y_f.SCALED_COMPONENT_OFFSET | _g_l_y_f.UNSCALED_COMPONENT_OFFSET
+)
+
+
+def _contours(decomposed: DecomposedGlyph) -> int:
+    return contour_count(decomposed.glyph_name, decomposed.tt_font)
+
+
+def _direction(decomposed: DecomposedGlyph) -> Optional[str]:
+    return direction_record(decomposed)["direction"]
+
+
+def _points(decomposed: DecomposedGlyph) -> int:
+    glyph = decomposed.decomposed_glyph
+    if glyph.numberOfContours <= 0:
+        return 0
+    return len(glyph.getCoordinates(decomposed.glyf_table)[0])
+
+
+def _length(decomposed: DecomposedGlyph) -> float:
+    # round to the reported precision so that floating point
+    # noise is not reported as a change
+    return round(segments_record(decomposed)["total_length"], 2)
+
+
+# glyph-level comparison metric name : metric function
+# metrics are reported in this order
+METRICS: Dict[str, Callable[[DecomposedGlyph], Any]] = {
+    "contours": _contours,
+    "direction": _direction,
+    "points": _points,
+    "length": _length,
+}
+
+
+def diff_run(args: argparse.Namespace) -> None:
+    """
+    Parses command line arguments to the `diff` sub-command
+    and reports the outline metric changes between two builds
+    of a font.  Only glyphs with changed outline data in the
+    glyph or any of its components are analyzed.
+    """
+    oldpath: str = args.oldpath
+    newpath: str = args.newpath
+    metrics: Sequence[str] = select_analyses(
+        getattr(args, "analysis", None), list(METRICS)
+    )
+    output_format: str = getattr(args, "format", "text")
+    jobs = jobs_count(getattr(args, "jobs", 1))
+
+    # --------------------
+    # CLI arg validations
+    # --------------------
+    old_font_file = validate_fontpath(oldpath)
+    new_font_file = validate_fontpath(newpath)
+
+    with open_font(old_font_file) as old_tt, open_font(new_font_file) as new_tt:
+        with ReportWriter() as writer:
+            changes = glyph_diffs(
+                oldpath, old_tt, newpath, new_tt, metrics=metrics, jobs=jobs
+            )
+            if output_format != "text":
+                write_records(writer, changes, output_format)
+                return
+
+            number_of_changes: Dict[str, int] = {ADDED: 0, REMOVED: 0, CHANGED: 0}
+            for record in changes:
+                number_of_changes[record["status"]] += 1
+                writer.writeline(
+                    diff_result(record["glyph"], record["status"], nocolor=args.nocolor)
+                )
+                for metric in metrics:
+                    old_value = record["old"].get(metric)
+                    new_value = record["new"].get(metric)
+                    # changed glyph reports only include changed metrics
+                    if record["status"] == CHANGED and old_value == new_value:
+                        continue
+                    writer.writeline(diff_metric_line(metric, old_value, new_value))
+            writer.writeline(
+                diff_summary(
+                    number_of_changes[CHANGED],
+                    number_of_changes[ADDED],
+                    number_of_changes[REMOVED],
+                    nocolor=args.nocolor,
+                )
+            )
+
+
+def changed_glyphs(old_tt: TTFont, new_tt: TTFont) -> List[Tuple[str, str]]:
+    """
+    Returns a list of (glyph name, status) tuples for all glyphs
+    that were added, removed, or changed between two fonts.
+    Glyphs are changed when the outline data of the glyph or any
+    of its components differ.  Instruction and glyph order changes
+    are not outline changes.  Glyphs are listed in the new font
+    glyph order, followed by removed glyphs in the old font glyph
+    order.
+    """
+    old_glyph_names = old_tt.getGlyphOrder()
+    new_glyph_names = new_tt.getGlyphOrder()
+    old_glyph_set = set(old_glyph_names)
+    new_glyph_set = set(new_glyph_names)
+    old_digests: Dict[str, str] = {}
+    new_digests: Dict[str, str] = {}
+    old_keys: Dict[str, Tuple] = {}
+    new_keys: Dict[str, Tuple] = {}
+
+    changes: List[Tuple[str, str]] = []
+    for glyph_name in new_glyph_names:
+        if glyph_name not in old_glyph_set:
+            changes.append((glyph_name, ADDED))
+        elif glyph_digest(old_tt, glyph_name, old_digests) == glyph_digest(
+            new_tt, glyph_name, new_digests
+        ):
+            # identical glyf table data and component names
+            continue
+        elif outline_key(old_tt, glyph_name, old_keys) != outline_key(
+            new_tt, glyph_name, new_keys
+        ):
+            changes.append((glyph_name, CHANGED))
+    for glyph_name in old_glyph_names:
+        if glyph_name not in new_glyph_set:
+            changes.append((glyph_name, REMOVED))
+    return changes
+
+
+def outline_key(
+    tt: TTFont, glyph_name: str, keys: Optional[Dict[str, Tuple]] = None
+) -> Tuple:
+    """
+    Returns a comparable key of the outline data of a glyph.  Simple
+    glyph keys hold the coordinates, on-curve flags, and contour end
+    points.  Composite glyph keys hold the component glyph names,
+    offsets, and transforms, and the keys of the component glyphs.
+    Keys are memoized in `keys` across calls.
+    """
+    if keys is None:
+        keys = {}
+    key = keys.get(glyph_name)
+    if key is not None:
+        return key
+    # placeholder key protects against component cycles
+    # in malformed fonts
+    keys[glyph_name] = ()
+
+    glyf_table = tt["glyf"]
+    glyph = glyf_table[glyph_name]
+    if glyph.isComposite():
+        key = tuple(
+            (
+                component.glyphName,
+                getattr(component, "x", None),
+                getattr(component, "y", None),
+                getattr(component, "firstPt", None),
+                getattr(component, "secondPt", None),
+                component.flags & COMPONENT_OFFSET_FLAGS,
+                tuple(map(tuple, getattr(component, "transform", ()))),
+                outline_key(tt, component.glyphName, keys)
+                if component.glyphName in glyf_table.glyphs
+                else None,
+            )
+            for component in glyph.components
+        )
+    elif glyph.numberOfContours > 0:
+        key = (
+            tuple(glyph.coordinates),
+            tuple(flag & FLAG_ON_CURVE for flag in glyph.flags),
+            tuple(glyph.endPtsOfContours),
+        )
+    else:
+        key = ()
+    keys[glyph_name] = key
+    return key
+
+
+def glyph_diffs(
+    oldpath: str,
+    old_tt: TTFont,
+    newpath: str,
+    new_tt: TTFont,
+    metrics: Optional[Sequence[str]] = None,
+    jobs: int = 1,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yields one record per added, removed, or changed glyph with
+    the glyph name, change status, and the requested (default=all)
+    metrics of the glyph in the old and new fonts.  Metrics are
+    only calculated for the glyphs that changed.
+    """
+    requested = select_analyses(metrics, list(METRICS))
+    changes = changed_glyphs(old_tt, new_tt)
+    glyph_metrics_func = partial(glyph_metrics, metrics=requested)
+    old_glyph_names = [name for name, status in changes if status != ADDED]
+    new_glyph_names = [name for name, status in changes if status != REMOVED]
+    old_metrics = glyph_map(glyph_metrics_func, oldpath, old_tt, old_glyph_names, jobs)
+    new_metrics = glyph_map(glyph_metrics_func, newpath, new_tt, new_glyph_names, jobs)
+    for glyph_name, status in changes:
+        yield {
+            "glyph": glyph_name,
+            "status": status,
+            "old": next(old_metrics) if status != ADDED else {},
+            "new": next(new_metrics) if status != REMOVED else {},
+        }
+
+
+def glyph_metrics(glyphname: str, tt: TTFont, metrics: Sequence[str]) -> Dict[str, Any]:
+    """
+    Returns a dictionary of the requested comparison metrics for
+    a single glyph.  Composite glyphs are decomposed.
+    """
+    decomposed = decomposed_glyph(glyphname, tt)
+    return {metric: METRICS[metric](decomposed) for metric in metrics}
@@ -1,16 +1,32 @@
 import argparse
-from typing import Sequence, Tuple
+from functools import partial
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import pathops  # type: ignore
 from fontTools.ttLib import TTFont  # type: ignore
 from fontTools.ttLib.tables._g_l_y_f import Glyph  # type: ignore
 
-from .bridge import ttfont_glyph_to_skia_path
-from .stringbuilder import direction_result
-from .validators import validate_fontpath, validate_glyph_in_font
+from .bridge import DecomposedGlyph
+from .cache import decomposed_glyph, glyf_memo
+from .contours import contour_count
+from .engine import glyph_map, jobs_count
+from .formats import write_glyph_records
+from .glyfarrays import GlyfArrays, glyf_arrays, parse_glyph_points
+from .selection import selected_glyph_names
+from .stringbuilder import direction_result, direction_text
+from .utils import open_font
+from .validators import validate_fontpath
+from .writer import ReportWriter
 
 # TODO: add --summary to include total CW and CCW directions
 
+FLAG_ON_CURVE = 0x01
+
+# supported direction engines
+# skia: pathops.Path direction of the decomposed outline
+# native: signed area of the glyf table coordinates
+ENGINES = ("skia", "native")
+
 
 def direction_run(args: argparse.Namespace) -> None:
     """
@@ -22,65 +38,96 @@ def direction_run(args: argparse.Namespace) -> None:
     direction that is reported for the decomposed outline.
     """
     fontpath: str = args.fontpath
-    glyphname: str = args.glyphname
+    output_format: str = getattr(args, "format", "text")
+    engine: str = getattr(args, "engine", None) or "skia"
 
     # --------------------
     # CLI arg validations
     # --------------------
-    validate_fontpath(fontpath)
+    font_file = validate_fontpath(fontpath)
 
-    tt = TTFont(fontpath)
-
-    skia_path: pathops.Path
+    with open_font(font_file) as tt, ReportWriter() as writer:
+        glyph_names = selected_glyph_names(args, tt)
+        # full glyph set runs of the native engine parse the raw
+        # glyf table data of all glyphs in a single pass
+        full_glyph_set = glyph_names == tt.getGlyphOrder()
+        if output_format != "text":
+            write_glyph_records(
+                writer,
+                fontpath,
+                tt,
+                glyph_names,
+                [partial(direction_record, engine=engine, full_glyph_set=full_glyph_set)],
+                output_format,
+                jobs=jobs_count(getattr(args, "jobs", 1)),
+                cache_path=getattr(args, "cache", None),
+            )
+        else:
+            glyph_report = partial(
+                direction_glyph_report,
+                nocolor=args.nocolor,
+                engine=engine,
+                full_glyph_set=full_glyph_set,
+            )
+            jobs = jobs_count(getattr(args, "jobs", 1))
+            for report in glyph_map(
+                glyph_report,
+                fontpath,
+                tt,
+                glyph_names,
+                jobs=jobs,
+                cache_path=getattr(args, "cache", None),
+            ):
+                writer.writeline(report)
 
-    if glyphname:
-        validate_glyph_in_font(glyphname, tt)
-        skia_path = ttfont_glyph_to_skia_path(glyphname, tt)
 
-        # transformed components can change path direction
-        # in the decomposed paths
-        # (e.g. 180 degree Y-axis rotation = mirroring)
-        # add base component glyph name and transform values
-        # to the report if this is present
-        glyph = tt["glyf"][glyphname]
-        components_with_transforms: Sequence[Tuple] = []
+def direction_glyph_report(
+    glyphname: str,
+    tt: TTFont,
+    nocolor: bool,
+    engine: str = "skia",
+    full_glyph_set: bool = False,
+) -> str:
+    """
+    Returns the direction report string for a single glyph.
+    See native_direction for the `full_glyph_set` option.
+    """
+    if engine == "native":
+        clockwise, contours = native_direction(glyphname, tt, full_glyph_set)
+        # only composite glyphs are decompiled, glyphs that are not
+        # expanded read the composite flag from the raw glyph data
+        glyph = tt["glyf"].glyphs[glyphname]
         if glyph.isComposite():
-            components_with_transforms = _get_components_with_transforms(glyph)
-
-        print(
-            direction_result(
-                glyphname,
-                skia_path.clockwise,
-                len(list(skia_path.contours)),
-                components_with_transforms=components_with_transforms,
-                nocolor=args.nocolor,
-            )
-        )
+            glyph = tt["glyf"][glyphname]
     else:
-        glyph_names = tt.getGlyphOrder()
-        for local_glyphname in glyph_names:
-            glyph = tt["glyf"][local_glyphname]
-            components_with_transforms = []
-
-            # transformed components can change path direction
-            # in the decomposed paths
-            # (e.g. 180 degree Y-axis rotation = mirroring)
-            # add base component glyph name and transform values
-            # to the report if this is present
-            if glyph.isComposite():
-                components_with_transforms = _get_components_with_transforms(glyph)
-
-            skia_path = ttfont_glyph_to_skia_path(local_glyphname, tt)  # type: ignore
-
-            print(
-                direction_result(
-                    str(local_glyphname),
-                    skia_path.clockwise,
-                    len(list(skia_path.contours)),
-                    components_with_transforms=components_with_transforms,
-                    nocolor=args.nocolor,
-                )
-            )
+        decomposed = decomposed_glyph(glyphname, tt)
+        clockwise, contours = skia_direction(decomposed.skia_path)
+        glyph = decomposed.glyph
+    # transformed components can change path direction
+    # in the decomposed paths
+    # (e.g. 180 degree Y-axis rotation = mirroring)
+    # add base component glyph name and transform values
+    # to the report if this is present
+    return direction_result(
+        str(glyphname),
+        clockwise,
+        contours,
+        components_with_transforms=_get_components_with_transforms(glyph),
+        nocolor=nocolor,
+    )
+
+
+def direction_section(decomposed: DecomposedGlyph, nocolor: bool) -> str:
+    """
+    Returns the direction report section string for shared
+    glyph decomposition data.
+    """
+    clockwise, contours = skia_direction(decomposed.skia_path)
+    return direction_text(
+        clockwise,
+        contours,
+        components_with_transforms=_get_components_with_transforms(decomposed.glyph),
+    )
 
 
 def _get_components_with_transforms(glyph: Glyph) -> Sequence[Tuple]:
@@ -107,3 +154,182 @@ def _get_components_with_transforms(glyph: Glyph) -> Sequence[Tuple]:
                     (component.glyphName, [[a1, a2], [b1, b2]])
                 )
     return components_with_transforms
+
+
+def direction_record(
+    decomposed: DecomposedGlyph, engine: str = "skia", full_glyph_set: bool = False
+) -> Dict[str, Any]:
+    """
+    Returns the direction record fields for shared glyph
+    decomposition data.  The direction is null for glyphs
+    without contours.  See native_direction for the
+    `full_glyph_set` option.
+    """
+    if engine == "native":
+        clockwise, contours = native_direction(
+            decomposed.glyph_name, decomposed.tt_font, full_glyph_set
+        )
+    else:
+        clockwise, contours = skia_direction(decomposed.skia_path)
+    direction: Optional[str] = None
+    if contours > 0:
+        direction = "clockwise" if clockwise else "counter-clockwise"
+    return {
+        "direction": direction,
+        "transformed_components": [
+            {"glyph": component_glyphname, "transform": component_transform}
+            for component_glyphname, component_transform in (
+                _get_components_with_transforms(decomposed.glyph)
+            )
+        ],
+    }
+
+
+def skia_direction(skia_path: pathops.Path) -> Tuple[bool, int]:
+    """
+    Returns a (clockwise, number of contours) tuple for a
+    decomposed pathops.Path.
+    """
+    return skia_path.clockwise, len(list(skia_path.contours))
+
+
+def native_direction(
+    glyphname: str, tt: TTFont, full_glyph_set: bool = False
+) -> Tuple[bool, int]:
+    """
+    Returns a (clockwise, number of contours) tuple for the
+    decomposed outline of a glyph from the signed area of the
+    glyf table coordinates.  Glyphs are not decomposed.  Set
+    `full_glyph_set` when all glyphs of the font are requested
+    to read the outlines from the whole font GlyfArrays.
+    """
+    area = glyph_signed_area(glyphname, tt, full_glyph_set)
+    return area < 0, contour_count(glyphname, tt)
+
+
+def glyph_signed_area(glyphname: str, tt: TTFont, full_glyph_set: bool = False) -> float:
+    """
+    Returns the signed area of the decomposed outline of a glyph.
+    Clockwise outlines have negative areas.  Composite glyph
+    areas are the sum of the component glyph areas scaled by
+    the determinant of the component transforms, so mirrored
+    components reverse the sign of their area.  Simple glyph
+    outlines that are not expanded are parsed from their raw glyf
+    table data, glyphs with malformed raw data are decompiled with
+    fontTools.  When `full_glyph_set` is set, the raw data of all
+    glyphs are parsed in a single pass with glyf_arrays, otherwise
+    only the requested glyph and its components are parsed.  Areas
+    are memoized per font.
+    """
+    arrays = glyf_arrays(tt) if full_glyph_set else None
+    return _glyph_signed_area(
+        glyphname,
+        tt["glyf"],
+        glyf_memo(tt, "signed_area"),
+        arrays,
+        tt.getReverseGlyphMap() if arrays is not None else None,
+    )
+
+
+def _glyph_signed_area(
+    glyphname: str,
+    glyf_table: Any,
+    areas: Dict[str, float],
+    arrays: Optional[GlyfArrays] = None,
+    glyph_ids: Optional[Dict[str, int]] = None,
+) -> float:
+    area = areas.get(glyphname)
+    if area is not None:
+        return area
+    # placeholder area protects against component cycles
+    # in malformed fonts
+    areas[glyphname] = 0.0
+
+    glyph = glyf_table.glyphs[glyphname]
+    if hasattr(glyph, "data") and not glyph.isComposite():
+        # glyphs that are not expanded hold their raw glyf table
+        # bytes, read the outline from the parsed whole font arrays
+        # or parse the outline of this glyph only
+        if arrays is not None and glyph_ids is not None:
+            glyph_id = glyph_ids[glyphname]
+            if glyph_id not in arrays.malformed:
+                area = _signed_area(*arrays.glyph_points(glyph_id))
+                areas[glyphname] = area
+                return area
+        try:
+            area = _signed_area(*parse_glyph_points(glyph.data))
+        except ValueError:
+            # malformed raw data, fontTools decompiles the glyph
+            pass
+        else:
+            areas[glyphname] = area
+            return area
+
+    glyph = glyf_table[glyphname]
+    area = 0.0
+    if glyph.isComposite():
+        for component in glyph.components:
+            determinant = 1.0
+            if hasattr(component, "transform"):
+                (xx, xy), (yx, yy) = component.transform
+                determinant = xx * yy - xy * yx
+            area += determinant * _glyph_signed_area(
+                component.glyphName, glyf_table, areas, arrays, glyph_ids
+            )
+    elif glyph.numberOfContours > 0:
+        coordinates, end_points, flags = glyph.getCoordinates(glyf_table)
+        area = contours_signed_area(coordinates, end_points, flags)
+    areas[glyphname] = area
+    return area
+
+
+def contours_signed_area(
+    coordinates: Sequence[Tuple[float, float]],
+    end_points: Sequence[int],
+    flags: Sequence[int],
+) -> float:
+    """
+    Returns the sum of the signed areas of the quadratic contours
+    in glyf table coordinate, contour end point index, and flag
+    arrays.  Clockwise contours have negative areas.
+
+    The shoelace area of the control polygon, including off-curve
+    points, is corrected by one third of the (on, off, on) triangle
+    area of every quadratic curve.  Implied on-curve points lie on
+    the control polygon and do not change the polygon area.
+    """
+    # flat x, y coordinate array, GlyphCoordinates.array is
+    # not available in older fontTools versions
+    if hasattr(coordinates, "array"):
+        values: Sequence[float] = coordinates.array
+    else:
+        values = [value for coordinate in coordinates for value in coordinate]
+    return _signed_area(values, end_points, flags)
+
+
+def _signed_area(
+    values: Sequence[float], end_points: Sequence[int], flags: Sequence[int]
+) -> float:
+    # contours_signed_area with flat x, y coordinate values
+    xs = values[0::2]
+    ys = values[1::2]
+    twice_area = 0.0
+    correction = 0.0
+    start = 0
+    for end in end_points:
+        # previous point index, wraps to the contour end point
+        previous = end
+        for index in range(start, end + 1):
+            twice_area += xs[previous] * ys[index] - xs[index] * ys[previous]
+            if not flags[index] & FLAG_ON_CURVE:
+                following = index + 1 if index < end else start
+                x0, y0 = xs[previous], ys[previous]
+                if not flags[previous] & FLAG_ON_CURVE:
+                    x0, y0 = (x0 + xs[index]) / 2, (y0 + ys[index]) / 2
+                x2, y2 = xs[following], ys[following]
+                if not flags[following] & FLAG_ON_CURVE:
+                    x2, y2 = (x2 + xs[index]) / 2, (y2 + ys[index]) / 2
+                correction += (xs[index] - x0) * (y2 - y0) - (ys[index] - y0) * (x2 - x0)
+            previous = index
+        start = end + 1
+    return (twice_area - correction / 3) / 2
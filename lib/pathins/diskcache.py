@@ -0,0 +1,201 @@
+import hashlib
+import json
+import sqlite3
+import struct
+from functools import partial
+from typing import Any, Dict, Iterator, Optional, Sequence, Set
+
+from fontTools.ttLib import TTFont  # type: ignore
+
+from . import __version__
+from . import stringbuilder
+
+# number of new results that are written to the cache
+# database in a single transaction
+COMMIT_INTERVAL = 1024
+
+# seconds to wait for cache database locks held by other
+# pathins processes (e.g., concurrent batch mode workers)
+LOCK_TIMEOUT = 60.0
+
+# maximum number of bound parameters in a single SQLite query
+MAX_QUERY_PARAMETERS = 500
+
+
+class DiskCache(object):
+    """
+    Persistent SQLite store of per-glyph analysis results.
+
+    Results are keyed by a hash of the pathins version, the
+    analysis function and its parameters, the glyph name, and
+    the raw glyf table bytes of the glyph and its component
+    closure.  Unchanged glyphs are served from the store across
+    runs and edited glyphs are re-analyzed.  Results must be
+    JSON serializable.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=LOCK_TIMEOUT)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self.connection.commit()
+        self._pending = 0
+
+    def __enter__(self) -> "DiskCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def existing_keys(self, keys: Sequence[str]) -> Set[str]:
+        """
+        Returns the set of `keys` that are defined in the store.
+        """
+        existing: Set[str] = set()
+        for start in range(0, len(keys), MAX_QUERY_PARAMETERS):
+            stop = start + MAX_QUERY_PARAMETERS
+            batch = keys[start:stop]
+            placeholders = ",".join("?" * len(batch))
+            existing.update(
+                row[0]
+                for row in self.connection.execute(
+                    f"SELECT key FROM results WHERE key IN ({placeholders})", batch
+                )
+            )
+        return existing
+
+    def get(self, key: str) -> Any:
+        """
+        Returns the result that is stored for `key`.  Raises
+        KeyError if the key is not in the store.
+        """
+        row = self.connection.execute(
+            "SELECT value FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores the result `value` for `key`.
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+            (key, json.dumps(value)),
+        )
+        self._pending += 1
+        if self._pending >= COMMIT_INTERVAL:
+            self.connection.commit()
+            self._pending = 0
+
+
+def cached_results(
+    cache: DiskCache,
+    func: Any,
+    tt: TTFont,
+    glyph_names: Sequence[str],
+    compute: Any,
+) -> Iterator[Any]:
+    """
+    Yields the results of `func` for every glyph name in
+    `glyph_names`, in `glyph_names` order.  Stored results are
+    read from `cache`.  Missing results are calculated with
+    compute(missing glyph names), which must yield the results
+    of `func` in the order of the requested glyph names, and are
+    added to the cache.
+    """
+    digests: Dict[str, str] = {}
+    keys = [result_key(func, tt, glyph_name, digests) for glyph_name in glyph_names]
+    existing = cache.existing_keys(keys)
+    missing = [name for name, key in zip(glyph_names, keys) if key not in existing]
+    computed = compute(missing)
+    for key in keys:
+        if key in existing:
+            yield cache.get(key)
+        else:
+            result = next(computed)
+            cache.set(key, result)
+            # return the stored representation so that cached
+            # and calculated results are identical
+            yield json.loads(json.dumps(result))
+
+
+def result_key(
+    func: Any, tt: TTFont, glyph_name: str, digests: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Returns the cache key for the result of func(glyph_name, tt).
+    """
+    key_data = json.dumps(
+        [
+            __version__,
+            stringbuilder.IS_A_TTY,
+            function_key(func),
+            glyph_name,
+            glyph_digest(tt, glyph_name, digests),
+        ]
+    )
+    return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+
+def function_key(func: Any) -> Any:
+    """
+    Returns a JSON serializable identifier for a function and
+    the parameters of functools.partial wrapped functions.
+    """
+    if isinstance(func, partial):
+        return [
+            function_key(func.func),
+            [function_key(arg) for arg in func.args],
+            {name: function_key(value) for name, value in sorted(func.keywords.items())},
+        ]
+    if callable(func):
+        return f"{func.__module__}.{func.__qualname__}"
+    if isinstance(func, (list, tuple)):
+        return [function_key(item) for item in func]
+    return repr(func)
+
+
+def glyph_digest(
+    tt: TTFont, glyph_name: str, digests: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Returns a hash of the raw glyf table bytes of a glyph and
+    the names and digests of its component glyphs.  Digests
+    are memoized in `digests` across calls.
+    """
+    if digests is None:
+        digests = {}
+    digest = digests.get(glyph_name)
+    if digest is not None:
+        return digest
+
+    glyf_table = tt["glyf"]
+    glyph = glyf_table.glyphs[glyph_name]
+    # glyphs that are not expanded hold their raw glyf table bytes
+    if hasattr(glyph, "data"):
+        data = glyph.data
+    else:
+        data = glyph.compile(glyf_table, recalcBBoxes=False)
+
+    sha = hashlib.sha256(data)
+    # placeholder digest protects against component cycles
+    # in malformed fonts
+    digests[glyph_name] = ""
+    if len(data) >= 2 and struct.unpack(">h", data[:2])[0] < 0:
+        # composite glyph, include the component closure
+        for component_name in glyf_table[glyph_name].getComponentNames(glyf_table):
+            sha.update(component_name.encode("utf-8"))
+            if component_name in glyf_table.glyphs:
+                sha.update(glyph_digest(tt, component_name, digests).encode("ascii"))
+    digest = sha.hexdigest()
+    digests[glyph_name] = digest
+    return digest
@@ -0,0 +1,164 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+
+from fontTools.ttLib import TTFont  # type: ignore
+
+from .diskcache import DiskCache, cached_results
+from .utils import open_font
+
+# glyph-level functions executed by the engine are called
+# with the signature func(glyph_name, tt_font) and must be
+# picklable (i.e., module level functions or functools.partial
+# wrappers of module level functions) to support process pools
+GlyphFunc = Callable[[str, TTFont], Any]
+
+# upper limit on the number of glyphs that are sent to
+# a worker process in a single task
+MAX_CHUNKSIZE = 256
+# upper limit on the number of glyphs in a single search task,
+# smaller tasks limit the work that is done after a match
+MAX_SEARCH_CHUNKSIZE = 32
+
+# per-process font state used by pool workers.  The font
+# is opened lazily on the first task that a worker receives
+# and is re-used for all subsequent tasks on the same path
+_worker_fontpath: Optional[str] = None
+_worker_font: Optional[TTFont] = None
+
+
+def jobs_count(jobs: Optional[int]) -> int:
+    """
+    Returns the number of worker processes for a requested
+    --jobs value.  Values less than one request one worker
+    process per available CPU.
+    """
+    if jobs is None:
+        return 1
+    if jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def glyph_map(
+    func: GlyphFunc,
+    fontpath: str,
+    tt: TTFont,
+    glyph_names: Sequence[str],
+    jobs: int = 1,
+    cache_path: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Yields the results of func(glyph_name, tt_font) for every
+    glyph name in `glyph_names`, in `glyph_names` order.
+
+    When `jobs` is greater than one, the glyph names are split
+    into chunks that are processed in a pool of `jobs` worker
+    processes.  Every worker opens the font at `fontpath` once
+    and the per-glyph results are merged back in the original
+    glyph order so that output is identical to the serial path.
+
+    When `cache_path` is defined, results are read from and
+    written to the diskcache.DiskCache database at that path
+    and only glyphs without stored results are processed.
+    """
+    if cache_path is not None:
+        with DiskCache(cache_path) as cache:
+            compute = partial(glyph_map, func, fontpath, tt, jobs=jobs)
+            yield from cached_results(cache, func, tt, glyph_names, compute)
+        return
+
+    if jobs < 2 or len(glyph_names) < 2:
+        for glyph_name in glyph_names:
+            yield func(glyph_name, tt)
+        return
+
+    chunks = _chunks(glyph_names, _chunksize(len(glyph_names), jobs))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Executor.map returns results in submission order
+        for results in executor.map(partial(_map_chunk, func, fontpath), chunks):
+            yield from results
+
+
+def glyph_search(
+    func: GlyphFunc,
+    fontpath: str,
+    tt: TTFont,
+    glyph_names: Sequence[str],
+    jobs: int = 1,
+) -> Optional[str]:
+    """
+    Returns the name of a glyph in `glyph_names` for which
+    func(glyph_name, tt_font) returns a truthy value, or None
+    when there is no matching glyph.
+
+    Glyphs are searched in `glyph_names` order when `jobs` is
+    less than two.  When `jobs` is greater than one, chunks of
+    glyph names are searched in a pool of `jobs` worker processes
+    in submission order and all outstanding tasks are cancelled
+    as soon as any worker finds a match.  The returned glyph is
+    not necessarily the first match in `glyph_names` order.
+    """
+    if jobs < 2 or len(glyph_names) < 2:
+        for glyph_name in glyph_names:
+            if func(glyph_name, tt):
+                return glyph_name
+        return None
+
+    chunksize = min(_chunksize(len(glyph_names), jobs), MAX_SEARCH_CHUNKSIZE)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(_search_chunk, func, fontpath, chunk)
+            for chunk in _chunks(glyph_names, chunksize)
+        ]
+        try:
+            for future in as_completed(futures):
+                match = future.result()
+                if match is not None:
+                    return match
+        finally:
+            # tasks that are already running finish before the
+            # executor shuts down, queued tasks are not started
+            for future in futures:
+                future.cancel()
+    return None
+
+
+def _chunksize(glyph_count: int, jobs: int) -> int:
+    # aim for several chunks per worker so that fast workers
+    # pick up the slack of workers that receive expensive
+    # (e.g., deeply nested composite) glyphs
+    chunksize = -(-glyph_count // (jobs * 4))
+    return max(1, min(chunksize, MAX_CHUNKSIZE))
+
+
+def _chunks(glyph_names: Sequence[str], chunksize: int) -> List[Sequence[str]]:
+    chunks = []
+    for start in range(0, len(glyph_names), chunksize):
+        stop = start + chunksize
+        chunks.append(glyph_names[start:stop])
+    return chunks
+
+
+def _map_chunk(func: GlyphFunc, fontpath: str, glyph_names: Sequence[str]) -> List:
+    tt = _worker_ttfont(fontpath)
+    return [func(glyph_name, tt) for glyph_name in glyph_names]
+
+
+def _search_chunk(
+    func: GlyphFunc, fontpath: str, glyph_names: Sequence[str]
+) -> Optional[str]:
+    tt = _worker_ttfont(fontpath)
+    for glyph_name in glyph_names:
+        if func(glyph_name, tt):
+            return glyph_name
+    return None
+
+
+def _worker_ttfont(fontpath: str) -> TTFont:
+    global _worker_fontpath, _worker_font
+    if _worker_font is None or _worker_fontpath != fontpath:
+        _worker_font = open_font(fontpath)
+        _worker_fontpath = fontpath
+    return _worker_font
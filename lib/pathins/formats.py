@@ -0,0 +1,137 @@
+import csv
+import json
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from fontTools.ttLib import TTFont  # type: ignore
+
+from .bridge import DecomposedGlyph
+from .cache import decomposed_glyph
+from .engine import glyph_map
+from .validators import validate_glyph_in_font
+from .writer import ReportWriter
+
+# supported sub-command output formats
+FORMATS = ("text", "json", "ndjson")
+# supported tabular output formats for point and segment level data
+TABLE_FORMATS = ("csv",)
+
+# glyph decomposition data -> JSON serializable record fields
+RecordFunc = Callable[[DecomposedGlyph], Dict[str, Any]]
+# glyph decomposition data -> table rows without font and glyph columns
+RowFunc = Callable[[DecomposedGlyph], List[Tuple[Any, ...]]]
+
+
+def write_glyph_records(
+    writer: ReportWriter,
+    fontpath: str,
+    tt: TTFont,
+    glyph_names: Union[None, str, Sequence[str]],
+    record_funcs: Sequence[RecordFunc],
+    output_format: str,
+    jobs: int = 1,
+    cache_path: Optional[str] = None,
+) -> None:
+    """
+    Writes one machine-readable record per glyph to `writer`
+    in the requested `output_format`.  Records are written for
+    a single glyph name, a sequence of `glyph_names`, or the full
+    glyph set when `glyph_names` is not defined.  Records are
+    streamed as they become available.
+    """
+    requested = _requested_glyph_names(tt, glyph_names)
+    record = partial(glyph_record, record_funcs=record_funcs, fontpath=fontpath)
+    write_records(
+        writer,
+        glyph_map(record, fontpath, tt, requested, jobs=jobs, cache_path=cache_path),
+        output_format,
+    )
+
+
+def glyph_record(
+    glyphname: str, tt: TTFont, record_funcs: Sequence[RecordFunc], fontpath: str
+) -> Dict[str, Any]:
+    """
+    Returns the machine-readable record for a single glyph with
+    the fields of all `record_funcs` results.
+    """
+    decomposed = decomposed_glyph(glyphname, tt)
+    record: Dict[str, Any] = {"font": fontpath, "glyph": glyphname}
+    for record_func in record_funcs:
+        record.update(record_func(decomposed))
+    return record
+
+
+def write_records(
+    writer: ReportWriter, records: Iterable[Dict[str, Any]], output_format: str
+) -> None:
+    """
+    Writes `records` as newline-delimited JSON objects (ndjson)
+    or as a JSON array with one object per line (json).  Raises
+    ValueError on unsupported output formats.
+    """
+    if output_format == "ndjson":
+        for record in records:
+            writer.writeline(json.dumps(record))
+    elif output_format == "json":
+        writer.write("[")
+        for x, record in enumerate(records):
+            if x > 0:
+                writer.write(",")
+            writer.write(f"\n{json.dumps(record)}")
+        writer.writeline("\n]")
+    else:
+        raise ValueError(f"unsupported output format '{output_format}'")
+
+
+def write_glyph_rows(
+    writer: ReportWriter,
+    fontpath: str,
+    tt: TTFont,
+    glyph_names: Union[None, str, Sequence[str]],
+    columns: Sequence[str],
+    row_func: RowFunc,
+    jobs: int = 1,
+    cache_path: Optional[str] = None,
+) -> None:
+    """
+    Writes a CSV table with a header row of `columns` names and
+    the `row_func` rows of each glyph to `writer`.  Rows are
+    written for a single glyph name, a sequence of `glyph_names`,
+    or the full glyph set when `glyph_names` is not defined.  The
+    first two columns of every row are the font path and the
+    glyph name.  Rows are written in per-glyph chunks as they
+    become available.
+    """
+    requested = _requested_glyph_names(tt, glyph_names)
+    csv_writer = csv.writer(writer, lineterminator="\n")
+    csv_writer.writerow(columns)
+    rows = partial(glyph_rows, row_func=row_func, fontpath=fontpath)
+    for chunk in glyph_map(
+        rows, fontpath, tt, requested, jobs=jobs, cache_path=cache_path
+    ):
+        csv_writer.writerows(chunk)
+
+
+def glyph_rows(
+    glyphname: str, tt: TTFont, row_func: RowFunc, fontpath: str
+) -> List[Tuple[Any, ...]]:
+    """
+    Returns the table rows for a single glyph with the font
+    path and glyph name columns.
+    """
+    prefix = (fontpath, glyphname)
+    return [prefix + row for row in row_func(decomposed_glyph(glyphname, tt))]
+
+
+def _requested_glyph_names(
+    tt: TTFont, glyph_names: Union[None, str, Sequence[str]]
+) -> Sequence[str]:
+    if glyph_names is None:
+        return tt.getGlyphOrder()
+    if isinstance(glyph_names, str):
+        glyph_names = [glyph_names]
+    for glyph_name in glyph_names:
+        # confirm that `glyph_name` request is in the font
+        validate_glyph_in_font(glyph_name, tt)
+    return glyph_names
@@ -0,0 +1,235 @@
+import struct
+import sys
+from array import array
+from typing import Any, List, Optional, Set, Tuple
+
+from fontTools.ttLib import TTFont  # type: ignore
+
+from .cache import glyf_memo
+
+# simple glyph flags, see the OpenType glyf table specification
+FLAG_ON_CURVE = 0x01
+X_SHORT_VECTOR = 0x02
+Y_SHORT_VECTOR = 0x04
+REPEAT_FLAG = 0x08
+X_IS_SAME_OR_POSITIVE_X_SHORT_VECTOR = 0x10
+Y_IS_SAME_OR_POSITIVE_Y_SHORT_VECTOR = 0x20
+OVERLAP_SIMPLE = 0x40
+
+# flag bits that are kept in the outline flag arrays, the
+# coordinate encoding bits are only used in the parser
+KEEP_FLAGS = FLAG_ON_CURVE | OVERLAP_SIMPLE
+
+# size of the glyph header that precedes the glyph description
+# (int16 numberOfContours and the int16 xMin, yMin, xMax, yMax)
+GLYPH_HEADER_SIZE = 10
+
+# flat x, y coordinate array, contour end point index array,
+# and flag array of a simple glyph
+RawPoints = Tuple["array[int]", List[int], "array[int]"]
+
+
+class GlyfArrays(object):
+    """
+    Outline arrays of all glyphs in a font that are parsed
+    from the raw loca and glyf table bytes in a single pass,
+    without fontTools Glyph objects.
+
+    Points of all simple glyphs are concatenated in glyph ID
+    order.  `coordinates` holds the flat, absolute x, y values,
+    `flags` holds the on-curve (and overlap) flag bits, and
+    `end_points` holds the contour end point indices relative to
+    the first point of each glyph.  The points and contours of
+    glyph ID `gid` are in the [`point_offsets[gid]`,
+    `point_offsets[gid + 1]`) and [`contour_offsets[gid]`,
+    `contour_offsets[gid + 1]`) ranges.  `number_of_contours`
+    holds the glyph header values, composite glyphs are -1 and
+    have no points.
+
+    Glyphs with truncated or malformed data have no points and
+    their glyph IDs are in the `malformed` set.
+    """
+
+    def __init__(self, loca: Any, glyf_data: bytes) -> None:
+        number_of_glyphs = len(loca) - 1
+        self.number_of_contours = array("h", bytes(2 * number_of_glyphs))
+        self.point_offsets = array("i", [0])
+        self.contour_offsets = array("i", [0])
+        self.coordinates = array("i")
+        self.flags = array("B")
+        self.end_points = array("H")
+        self.malformed: Set[int] = set()
+
+        for glyph_id in range(number_of_glyphs):
+            start = loca[glyph_id]
+            stop = loca[glyph_id + 1]
+            if stop - start >= GLYPH_HEADER_SIZE:
+                number_of_contours = struct.unpack_from(">h", glyf_data, start)[0]
+                self.number_of_contours[glyph_id] = number_of_contours
+                try:
+                    coordinates, end_points, flags = parse_glyph_points(
+                        glyf_data, start, stop
+                    )
+                except ValueError:
+                    self.malformed.add(glyph_id)
+                else:
+                    self.coordinates.extend(coordinates)
+                    self.flags.extend(flags)
+                    self.end_points.extend(end_points)
+            self.point_offsets.append(len(self.flags))
+            self.contour_offsets.append(len(self.end_points))
+
+    def __len__(self) -> int:
+        return len(self.number_of_contours)
+
+    def glyph_points(self, glyph_id: int) -> RawPoints:
+        """
+        Returns the (flat x, y coordinate array, contour end point
+        indices, flags) outline arrays of a glyph.  The arrays are
+        empty for composite glyphs and glyphs without outlines.
+        """
+        start = self.point_offsets[glyph_id]
+        stop = self.point_offsets[glyph_id + 1]
+        contour_start = self.contour_offsets[glyph_id]
+        contour_stop = self.contour_offsets[glyph_id + 1]
+        coordinate_start = 2 * start
+        coordinate_stop = 2 * stop
+        return (
+            self.coordinates[coordinate_start:coordinate_stop],
+            self.end_points[contour_start:contour_stop].tolist(),
+            self.flags[start:stop],
+        )
+
+
+def parse_glyph_points(
+    data: bytes, start: int = 0, stop: Optional[int] = None
+) -> RawPoints:
+    """
+    Returns the (flat x, y coordinate array, contour end point
+    indices, flags) outline arrays of the raw glyf table data of
+    a single glyph in the `data`[`start`:`stop`] range.  The
+    arrays are empty for composite glyphs and glyphs without
+    outlines.  Raises ValueError on truncated or malformed glyph
+    data.
+    """
+    if stop is None:
+        stop = len(data)
+    if stop - start < GLYPH_HEADER_SIZE:
+        return array("i"), [], array("B")
+    number_of_contours = struct.unpack_from(">h", data, start)[0]
+    if number_of_contours <= 0:
+        return array("i"), [], array("B")
+
+    position = start + GLYPH_HEADER_SIZE
+    try:
+        end_points = struct.unpack_from(f">{number_of_contours}H", data, position)
+        position += 2 * number_of_contours
+        number_of_points = end_points[-1] + 1
+        instructions_length = struct.unpack_from(">H", data, position)[0]
+        position += 2 + instructions_length
+
+        flags = array("B")
+        while len(flags) < number_of_points:
+            flag = data[position]
+            position += 1
+            if flag & REPEAT_FLAG:
+                flags.extend(bytes((flag,)) * (data[position] + 1))
+                position += 1
+            else:
+                flags.append(flag)
+        del flags[number_of_points:]
+
+        xs, position = _deltas(
+            data,
+            position,
+            flags,
+            X_SHORT_VECTOR,
+            X_IS_SAME_OR_POSITIVE_X_SHORT_VECTOR,
+        )
+        ys, position = _deltas(
+            data,
+            position,
+            flags,
+            Y_SHORT_VECTOR,
+            Y_IS_SAME_OR_POSITIVE_Y_SHORT_VECTOR,
+        )
+    except (IndexError, struct.error):
+        raise ValueError("truncated glyf table glyph data")
+    if position > stop:
+        raise ValueError("glyph data exceed the loca table glyph length")
+
+    coordinates = array("i", xs + ys)
+    coordinates[0::2] = xs
+    coordinates[1::2] = ys
+    return (
+        coordinates,
+        list(end_points),
+        array("B", (flag & KEEP_FLAGS for flag in flags)),
+    )
+
+
+def _deltas(
+    data: bytes, position: int, flags: "array[int]", short_flag: int, same_flag: int
+) -> Tuple["array[int]", int]:
+    # returns the absolute coordinate values of one axis from
+    # the delta-encoded values and the next data position
+    values = array("i")
+    value = 0
+    for flag in flags:
+        if flag & short_flag:
+            if flag & same_flag:
+                value += data[position]
+            else:
+                value -= data[position]
+            position += 1
+        elif not flag & same_flag:
+            value += (data[position] << 8 | data[position + 1]) - (
+                (data[position] & 0x80) << 9
+            )
+            position += 2
+        values.append(value)
+    return values, position
+
+
+def glyf_arrays(tt_font: TTFont) -> GlyfArrays:
+    """
+    Returns the GlyfArrays of `tt_font`.  The raw table bytes are
+    read from the font file when the font was opened from a file,
+    so the arrays hold the outlines of the font file data.  The
+    arrays are parsed on the first request and memoized per font.
+    """
+    memo = glyf_memo(tt_font, "glyf_arrays")
+    arrays = memo.get("glyf")
+    if arrays is None:
+        # glyf table compiles update the loca table offsets of
+        # fonts without a file reader, read the glyf data first
+        glyf_data = _table_data(tt_font, "glyf")
+        arrays = GlyfArrays(_loca_offsets(tt_font), glyf_data)
+        memo["glyf"] = arrays
+    return arrays
+
+
+def _loca_offsets(tt_font: TTFont) -> "array[int]":
+    short_offsets = tt_font["head"].indexToLocFormat == 0
+    offsets = array("H" if short_offsets else "I")
+    data = _table_data(tt_font, "loca")
+    # ignore trailing padding bytes
+    stop = len(data) - (len(data) % offsets.itemsize)
+    offsets.frombytes(data[:stop])
+    if sys.byteorder == "little":
+        offsets.byteswap()
+    # one offset per glyph and the end offset of the last glyph
+    stop = tt_font["maxp"].numGlyphs + 1
+    if short_offsets:
+        # short offsets are stored divided by 2
+        return array("i", (offset * 2 for offset in offsets[:stop]))
+    return array("i", offsets[:stop])
+
+
+def _table_data(tt_font: TTFont, tag: str) -> bytes:
+    # read unmodified table data from the font file, fontTools
+    # compiles tables that were loaded
+    reader = getattr(tt_font, "reader", None)
+    if reader is not None and tag in reader:
+        return reader[tag]
+    return tt_font.getTableData(tag)
@@ -0,0 +1,205 @@
+import argparse
+import math
+import sys
+from functools import partial
+from typing import Any, Dict, List, Sequence
+
+import pathops  # type: ignore
+from fontTools.ttLib import TTFont  # type: ignore
+
+from .bridge import DecomposedGlyph
+from .cache import decomposed_glyph
+from .engine import glyph_map, glyph_search, jobs_count
+from .formats import write_glyph_records, write_records
+from .selection import selected_glyph_names
+from .stringbuilder import overlap_result
+from .utils import CheckIssueFound, open_font
+from .validators import validate_fontpath
+from .writer import ReportWriter
+
+# glyphs that commonly include overlapping paths.  These
+# glyphs are checked first in the --check mode search.
+PROBABLE_OVERLAPS = [
+    "Q",
+    "numbersign",
+    "plus",
+    "A",
+    "notequal",
+    "ampersand",
+    "K",
+    "Eth",
+    "Dcroat",
+    "Hbar",
+    "uni0424",
+    "uni04FE",
+    "uni048E",
+    "uni03A6",
+    "uni03A8",
+]
+
+# absolute tolerance in units^2 for contour area differences
+# between the source path and the simplified path
+AREA_TOLERANCE = 0.5
+
+
+def overlap_run(args: argparse.Namespace) -> None:
+    """
+    Parses command line arguments to the `overlap` sub-command
+    and reports whether the paths of a command line specified
+    glyph name or the full glyph set overlap.  The --check option
+    exits with status code 1 on the first overlap that is found
+    in the font and status code 0 when there are no overlaps.
+    Machine-readable --check output is a single font record.
+    """
+    fontpath: str = args.fontpath
+    output_format: str = getattr(args, "format", "text")
+
+    # --------------------
+    # CLI arg validations
+    # --------------------
+    font_file = validate_fontpath(fontpath)
+
+    with open_font(font_file) as tt, ReportWriter() as writer:
+        glyph_names = selected_glyph_names(args, tt)
+        # --check option implementation
+        if args.check:
+            jobs = jobs_count(getattr(args, "jobs", 1))
+            found = font_has_overlap(fontpath, tt, glyph_names, jobs=jobs)
+            if output_format != "text":
+                write_records(
+                    writer, [{"font": fontpath, "overlap": found}], output_format
+                )
+            elif found:
+                writer.writeline(f"{fontpath}: overlapping paths are present")
+            else:
+                writer.writeline(f"{fontpath}: no overlapping paths")
+            if found:
+                raise CheckIssueFound()
+            sys.exit(0)
+
+        if output_format != "text":
+            write_glyph_records(
+                writer,
+                fontpath,
+                tt,
+                glyph_names,
+                [overlap_record],
+                output_format,
+                jobs=jobs_count(getattr(args, "jobs", 1)),
+                cache_path=getattr(args, "cache", None),
+            )
+        else:
+            glyph_report = partial(overlap_glyph_report, nocolor=args.nocolor)
+            jobs = jobs_count(getattr(args, "jobs", 1))
+            for report in glyph_map(
+                glyph_report,
+                fontpath,
+                tt,
+                glyph_names,
+                jobs=jobs,
+                cache_path=getattr(args, "cache", None),
+            ):
+                writer.writeline(report)
+
+
+def overlap_glyph_report(glyphname: str, tt: TTFont, nocolor: bool) -> str:
+    """
+    Returns the overlap report string for a single glyph.
+    """
+    return overlap_result(glyphname, glyph_has_overlap(glyphname, tt), nocolor=nocolor)
+
+
+def overlap_record(decomposed: DecomposedGlyph) -> Dict[str, Any]:
+    """
+    Returns the overlap record fields for shared glyph
+    decomposition data.
+    """
+    return {"overlap": has_overlap(decomposed.skia_path)}
+
+
+def font_has_overlap(
+    fontpath: str, tt: TTFont, glyph_names: Sequence[str], jobs: int = 1
+) -> bool:
+    """
+    Returns True if the decomposed paths of any glyph in
+    `glyph_names` overlap.  Glyphs in the PROBABLE_OVERLAPS list
+    are checked first and the search stops at the first overlap.
+    """
+    return (
+        glyph_search(
+            glyph_has_overlap, fontpath, tt, _probable_first(glyph_names), jobs=jobs
+        )
+        is not None
+    )
+
+
+def glyph_has_overlap(glyphname: str, tt: TTFont) -> bool:
+    """
+    Returns True if the decomposed paths of a glyph overlap.
+    """
+    return has_overlap(decomposed_glyph(glyphname, tt).skia_path)
+
+
+def has_overlap(skia_path: pathops.Path) -> bool:
+    """
+    Returns True if the contours of a pathops.Path overlap.
+
+    The path is compared with its pathops.simplify result.
+    Simplification can also change contour start points,
+    remove collinear and duplicate points, and split curves
+    in paths without overlaps.  Paths are only simplified when
+    the bounding boxes of at least two contours intersect or a
+    contour is not convex.  The sum of the absolute contour
+    areas is only reduced when overlapping (or self-intersecting)
+    contours are merged, so it is used to confirm overlaps when
+    the paths differ.
+    """
+    contours = list(skia_path.contours)
+    # if there are no contours, then there are no overlaps
+    # skip pathops.simplify and diff check
+    if len(contours) == 0:
+        return False
+    # convex contours with disjoint bounding boxes cannot
+    # overlap, skip pathops.simplify
+    if not _may_overlap(contours):
+        return False
+    skia_path_simplified = pathops.simplify(skia_path, clockwise=skia_path.clockwise)
+    if skia_path == skia_path_simplified:
+        return False
+    return not math.isclose(
+        _contours_area(skia_path),
+        _contours_area(skia_path_simplified),
+        abs_tol=AREA_TOLERANCE,
+    )
+
+
+def _may_overlap(contours: Sequence[pathops.Path]) -> bool:
+    # True if any contour may self-intersect or if the control
+    # point bounding boxes of any two contours intersect.  Convex
+    # contours cannot self-intersect and curves are contained in
+    # the bounding box of their control points, so False confirms
+    # that there are no overlaps.  Most glyphs include a concave
+    # contour and exit on the (native) convexity check.
+    if not all(contour.isConvex for contour in contours):
+        return True
+    boxes = sorted(contour.controlPointBounds for contour in contours)
+    for x, box in enumerate(boxes):
+        start = x + 1
+        for other in boxes[start:]:
+            # boxes are sorted by x min
+            if other[0] > box[2]:
+                break
+            if other[1] <= box[3] and box[1] <= other[3]:
+                return True
+    return False
+
+
+def _contours_area(skia_path: pathops.Path) -> float:
+    return sum(abs(contour.area) for contour in skia_path.contours)
+
+
+def _probable_first(glyph_names: Sequence[str]) -> List[str]:
+    glyph_name_set = set(glyph_names)
+    probable = [name for name in PROBABLE_OVERLAPS if name in glyph_name_set]
+    probable_set = set(probable)
+    return probable + [name for name in glyph_names if name not in probable_set]
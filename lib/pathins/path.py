@@ -1,11 +1,20 @@
 import argparse
+import os
+from functools import partial
+from typing import Any, Dict
 
 import pathops  # type: ignore
 from fontTools.ttLib import TTFont  # type: ignore
 
-from .bridge import ttfont_glyph_to_skia_path
+from .bridge import DecomposedGlyph
+from .cache import decomposed_glyph
+from .engine import glyph_map, jobs_count
+from .formats import write_glyph_records
+from .selection import selected_glyph_names
 from .stringbuilder import report_header
-from .validators import validate_fontpath, validate_glyph_in_font
+from .utils import open_font
+from .validators import validate_fontpath
+from .writer import ReportWriter
 
 
 def path_run(args: argparse.Namespace) -> None:
@@ -16,37 +25,77 @@ def path_run(args: argparse.Namespace) -> None:
     glyph name.
     """
     fontpath: str = args.fontpath
-    glyphname: str = args.glyphname
+    output_format: str = getattr(args, "format", "text")
 
     # --------------------
     # CLI arg validations
     # --------------------
-    validate_fontpath(fontpath)
+    font_file = validate_fontpath(fontpath)
+
+    with open_font(font_file) as tt, ReportWriter() as writer:
+        glyph_names = selected_glyph_names(args, tt)
+        if output_format != "text":
+            write_glyph_records(
+                writer,
+                fontpath,
+                tt,
+                glyph_names,
+                [path_record],
+                output_format,
+                jobs=jobs_count(getattr(args, "jobs", 1)),
+                cache_path=getattr(args, "cache", None),
+            )
+        else:
+            len_glyph_names = len(glyph_names)
+            glyph_report = partial(path_glyph_report, nocolor=args.nocolor)
+            jobs = jobs_count(getattr(args, "jobs", 1))
+            for x, report in enumerate(
+                glyph_map(
+                    glyph_report,
+                    fontpath,
+                    tt,
+                    glyph_names,
+                    jobs=jobs,
+                    cache_path=getattr(args, "cache", None),
+                )
+            ):
+                writer.writeline(report)
+                if x + 1 < len_glyph_names:
+                    # append a newline to all glyph reports except last
+                    writer.writeline()
 
-    tt = TTFont(fontpath)
 
-    skia_path: pathops.Path
+def path_glyph_report(glyphname: str, tt: TTFont, nocolor: bool) -> str:
+    """
+    Returns the path report string, including the report
+    header, for a single glyph.
+    """
+    header = report_header(f"'{glyphname}' path", nocolor=nocolor)
+    section = path_section(decomposed_glyph(glyphname, tt), nocolor=nocolor)
+    return f"{header}{os.linesep}{section}"
 
-    if glyphname:
-        # confirm that `glyphname` request is in the font
-        validate_glyph_in_font(glyphname, tt)
 
-        skia_path = ttfont_glyph_to_skia_path(glyphname, tt)
-        print(report_header(f"'{glyphname}' path", nocolor=args.nocolor))
-        if len(list(skia_path.contours)) == 0:
-            print("No contours")
-        else:
-            print(skia_path)
+def path_section(decomposed: DecomposedGlyph, nocolor: bool) -> str:
+    """
+    Returns the path report section string for shared glyph
+    decomposition data.
+    """
+    skia_path: pathops.Path = decomposed.skia_path
+    if len(list(skia_path.contours)) == 0:
+        return "No contours"
     else:
-        glyph_names = tt.getGlyphOrder()
-        len_glyph_names = len(glyph_names)
-        for x, local_glyphname in enumerate(glyph_names):
-            skia_path = ttfont_glyph_to_skia_path(local_glyphname, tt)
-            print(report_header(f"'{local_glyphname}' path", nocolor=args.nocolor))
-            if len(list(skia_path.contours)) == 0:
-                print("No contours")
-            else:
-                print(skia_path)
-            if x + 1 < len_glyph_names:
-                # append a newline to all glyph reports except last
-                print("")
+        return f"{skia_path}"
+
+
+def path_record(decomposed: DecomposedGlyph) -> Dict[str, Any]:
+    """
+    Returns the path record fields for shared glyph
+    decomposition data.  The path is serialized as a list of
+    pen drawing operations.
+    """
+    return {
+        "path": [
+            {"operation": operation, "points": [list(point) for point in points]}
+            for operation, points in decomposed.skia_path.segments
+        ]
+    }
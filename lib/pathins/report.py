@@ -0,0 +1,163 @@
+import argparse
+import os
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+
+from fontTools.ttLib import TTFont  # type: ignore
+
+from .bridge import DecomposedGlyph
+from .cache import decomposed_glyph
+from .contours import contours_record, contours_section
+from .coordinates import coordinates_record, coordinates_section
+from .direction import direction_record, direction_section
+from .engine import glyph_map, jobs_count
+from .formats import RecordFunc, glyph_record, write_glyph_records
+from .overlap import overlap_record
+from .path import path_record, path_section
+from .segments import segments_record, segments_section
+from .selection import select_analyses, selected_glyph_names
+from .stringbuilder import bold_text, report_header
+from .utils import open_font
+from .validators import validate_fontpath
+from .writer import ReportWriter
+
+# analysis name : section function
+# report sections are written in this order
+ANALYSES: Dict[str, Callable[[DecomposedGlyph, bool], str]] = {
+    "contours": contours_section,
+    "direction": direction_section,
+    "coordinates": coordinates_section,
+    "path": path_section,
+    "segments": segments_section,
+}
+
+# analysis name : machine-readable record function
+# record fields are calculated in this order, overlap
+# records do not have a report section
+RECORDS: Dict[str, RecordFunc] = {
+    "contours": contours_record,
+    "direction": direction_record,
+    "coordinates": coordinates_record,
+    "path": path_record,
+    "segments": segments_record,
+    "overlap": overlap_record,
+}
+
+
+def report_run(args: argparse.Namespace) -> None:
+    """
+    Parses command line arguments to the `report` sub-command
+    and dumps a combined report of one or more analyses for a
+    command line specified glyph name or the full glyph set.
+    All analyses share a single decomposition of each glyph.
+    """
+    fontpath: str = args.fontpath
+    analyses: Sequence[str] = select_analyses(
+        getattr(args, "analysis", None), list(ANALYSES)
+    )
+    output_format: str = getattr(args, "format", "text")
+
+    # --------------------
+    # CLI arg validations
+    # --------------------
+    font_file = validate_fontpath(fontpath)
+
+    with open_font(font_file) as tt, ReportWriter() as writer:
+        glyph_names = selected_glyph_names(args, tt)
+        if output_format != "text":
+            write_glyph_records(
+                writer,
+                fontpath,
+                tt,
+                glyph_names,
+                [RECORDS[analysis] for analysis in analyses],
+                output_format,
+                jobs=jobs_count(getattr(args, "jobs", 1)),
+                cache_path=getattr(args, "cache", None),
+            )
+        else:
+            len_glyph_names = len(glyph_names)
+            glyph_report = partial(
+                report_glyph_report, analyses=analyses, nocolor=args.nocolor
+            )
+            jobs = jobs_count(getattr(args, "jobs", 1))
+            for x, report in enumerate(
+                glyph_map(
+                    glyph_report,
+                    fontpath,
+                    tt,
+                    glyph_names,
+                    jobs=jobs,
+                    cache_path=getattr(args, "cache", None),
+                )
+            ):
+                writer.writeline(report)
+                if x + 1 < len_glyph_names:
+                    # append a newline to all glyph reports except last
+                    writer.writeline()
+
+
+def report_glyph_report(
+    glyphname: str, tt: TTFont, analyses: Sequence[str], nocolor: bool
+) -> str:
+    """
+    Returns the combined report string, including the report
+    header, of the requested analyses for a single glyph.
+    """
+    decomposed = decomposed_glyph(glyphname, tt)
+    sections = [report_header(f"'{glyphname}' report", nocolor=nocolor)]
+    for analysis in select_analyses(analyses, list(ANALYSES)):
+        section = ANALYSES[analysis](decomposed, nocolor)
+        if os.linesep in section:
+            sections.append(f"{bold_text(analysis, nocolor=nocolor)}:")
+            sections.append(section)
+        else:
+            sections.append(f"{bold_text(analysis, nocolor=nocolor)}: {section.strip()}")
+    return os.linesep.join(sections)
+
+
+def glyph_reports(
+    tt: TTFont,
+    analyses: Optional[Sequence[str]] = None,
+    glyph_names: Optional[Sequence[str]] = None,
+    nocolor: bool = True,
+) -> Iterator[str]:
+    """
+    Library interface that yields combined per-glyph report
+    strings for the requested analyses (default=all) in glyph
+    order.  The full glyph set is reported when `glyph_names`
+    is not defined.  Raises ValueError on unsupported analysis
+    names.
+    """
+    requested = select_analyses(analyses, list(ANALYSES))
+    if glyph_names is None:
+        glyph_names = tt.getGlyphOrder()
+    for glyph_name in glyph_names:
+        yield report_glyph_report(glyph_name, tt, requested, nocolor=nocolor)
+
+
+def glyph_records(
+    tt: TTFont,
+    analyses: Optional[Sequence[str]] = None,
+    glyph_names: Optional[Sequence[str]] = None,
+    fontpath: str = "",
+    jobs: int = 1,
+    cache_path: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Library interface that yields machine-readable per-glyph
+    records for the requested analyses (default=all) in RECORDS.
+    The full glyph set is reported when `glyph_names` is not
+    defined.  `jobs` and `cache_path` are the engine.glyph_map
+    process pool and diskcache options.  Raises ValueError on
+    unsupported analysis names.
+    """
+    requested = select_analyses(analyses, list(RECORDS))
+    if glyph_names is None:
+        glyph_names = tt.getGlyphOrder()
+    record = partial(
+        glyph_record,
+        record_funcs=[RECORDS[analysis] for analysis in requested],
+        fontpath=fontpath,
+    )
+    return glyph_map(record, fontpath, tt, glyph_names, jobs=jobs, cache_path=cache_path)
@@ -1,22 +1,51 @@
 import argparse
 import os
-from typing import List
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from fontTools.misc.bezierTools import calcQuadraticArcLength  # type: ignore
 from fontTools.ttLib import TTFont  # type: ignore
-from fontTools.ttLib.tables._g_l_y_f import Glyph  # type: ignore
 
 from .bezier import quadratic_path
-from .bridge import skia_path_to_ttfont_glyph, ttfont_glyph_to_skia_path
+from .bridge import DecomposedGlyph
+from .cache import decomposed_glyph
 from .datastructures import Coordinate
+from .engine import glyph_map, jobs_count
+from .formats import TABLE_FORMATS, write_glyph_records, write_glyph_rows
 from .math import linear_distance_between_coordinates
+from .selection import selected_glyph_names
 from .stringbuilder import (
     report_header,
     segment_line,
     segment_quadratic_curve,
     segment_total_distance,
 )
-from .validators import validate_fontpath, validate_glyph_in_font
+from .utils import open_font
+from .validators import validate_fontpath
+from .writer import ReportWriter
+
+# line (start, end) or quadratic curve (start, off-curve, end)
+# path segment
+Segment = Tuple[Coordinate, ...]
+
+# segments table columns, line segments do not have control
+# point values, boolean values are written as 1 / 0
+SEGMENTS_COLUMNS = (
+    "font",
+    "glyph",
+    "contour",
+    "segment",
+    "type",
+    "start_x",
+    "start_y",
+    "control_x",
+    "control_y",
+    "end_x",
+    "end_y",
+    "start_implied",
+    "end_implied",
+    "length",
+)
 
 
 def segments_run(args: argparse.Namespace) -> None:
@@ -27,62 +56,134 @@ def segments_run(args: argparse.Namespace) -> None:
     glyph set.
     """
     fontpath: str = args.fontpath
-    glyphname: str = args.glyphname
+    output_format: str = getattr(args, "format", "text")
 
     # --------------------
     # CLI arg validations
     # --------------------
-    validate_fontpath(fontpath)
+    font_file = validate_fontpath(fontpath)
 
-    tt = TTFont(fontpath)
-    glyf_table = tt["glyf"]
+    with open_font(font_file) as tt, ReportWriter() as writer:
+        glyph_names = selected_glyph_names(args, tt)
+        if output_format in TABLE_FORMATS:
+            write_glyph_rows(
+                writer,
+                fontpath,
+                tt,
+                glyph_names,
+                SEGMENTS_COLUMNS,
+                segments_rows,
+                jobs=jobs_count(getattr(args, "jobs", 1)),
+                cache_path=getattr(args, "cache", None),
+            )
+        elif output_format != "text":
+            write_glyph_records(
+                writer,
+                fontpath,
+                tt,
+                glyph_names,
+                [segments_record],
+                output_format,
+                jobs=jobs_count(getattr(args, "jobs", 1)),
+                cache_path=getattr(args, "cache", None),
+            )
+        else:
+            len_glyph_names = len(glyph_names)
+            glyph_report = partial(segments_glyph_report, nocolor=args.nocolor)
+            jobs = jobs_count(getattr(args, "jobs", 1))
+            for x, report in enumerate(
+                glyph_map(
+                    glyph_report,
+                    fontpath,
+                    tt,
+                    glyph_names,
+                    jobs=jobs,
+                    cache_path=getattr(args, "cache", None),
+                )
+            ):
+                writer.writeline(report)
+                if x + 1 < len_glyph_names:
+                    # append a newline to all glyph reports except last
+                    writer.writeline()
 
-    if glyphname:
-        # confirm that `glyphname` request is in the font
-        validate_glyph_in_font(glyphname, tt)
 
-        glyph: Glyph = glyf_table[glyphname]
+def segments_glyph_report(glyphname: str, tt: TTFont, nocolor: bool) -> str:
+    """
+    Returns the segments report string, including the report
+    header, for a single glyph.
+    """
+    header = report_header(f"'{glyphname}' segments", nocolor=nocolor)
+    section = segments_section(decomposed_glyph(glyphname, tt), nocolor=nocolor)
+    return f"{header}{os.linesep}{section}"
 
-        # decompose composite glyphs
-        if glyph.isComposite():
-            glyph = skia_path_to_ttfont_glyph(ttfont_glyph_to_skia_path(glyphname, tt))
 
-        # define new quadratic path coordinates with *implied*
-        # on curve points to support the arc distance calculations
-        coords: List[Coordinate] = quadratic_path(glyph, glyf_table, include_implied=True)
+def segments_section(decomposed: DecomposedGlyph, nocolor: bool) -> str:
+    """
+    Returns the segments report section string for shared
+    glyph decomposition data.  Composite glyphs are decomposed.
+    """
+    # define new quadratic path coordinates with *implied*
+    # on curve points to support the arc distance calculations
+    coords: List[Coordinate] = quadratic_path(
+        decomposed.decomposed_glyph, decomposed.glyf_table, include_implied=True
+    )
+    if len(coords) == 0:
+        return "   No contours"
+    else:
+        return _segments_report(coords, nocolor)
 
-        print(report_header(f"'{glyphname}' segments", nocolor=args.nocolor))
-        if len(coords) == 0:
-            print("   No contours")
+
+def _segments_report(coords: List[Coordinate], nocolor: bool) -> str:
+    segments = _quadratic_segments(coords)
+    distances = segment_distances(segments)
+    lines: List[str] = []
+    total_distance: float = 0.0
+    for segment, distance in zip(segments, distances):
+        if len(segment) == 2:
+            lines.append(segment_line(segment[0], segment[1], distance, nocolor))
         else:
-            _print_segments(coords, args.nocolor)
-    # full glyph set
-    else:
-        glyph_names = tt.getGlyphOrder()
-        len_glyph_names = len(glyph_names)
-        for x, local_glyphname in enumerate(glyph_names):
-            glyph = glyf_table[local_glyphname]
-
-            # decompose composite glyphs
-            if glyph.isComposite():
-                glyph = skia_path_to_ttfont_glyph(
-                    ttfont_glyph_to_skia_path(local_glyphname, tt)
+            lines.append(
+                segment_quadratic_curve(
+                    segment[0], segment[1], segment[2], distance, nocolor
                 )
-            coords = quadratic_path(glyph, glyf_table, include_implied=True)
+            )
+        total_distance += distance
+
+    lines.append(
+        f"{os.linesep} {segment_total_distance(total_distance, nocolor=nocolor)}"
+    )
+    return os.linesep.join(lines)
+
 
-            print(report_header(f"'{local_glyphname}' segments", nocolor=args.nocolor))
-            if len(coords) == 0:
-                print("   No contours")
-            else:
-                _print_segments(coords, args.nocolor)
-            if x + 1 < len_glyph_names:
-                # append a newline to all glyph reports except last
-                print("")
+def segment_distances(segments: Sequence[Segment]) -> List[float]:
+    """
+    Returns a list of segment distances for a sequence of line
+    (two Coordinate) and quadratic curve (three Coordinate)
+    segments.  Quadratic curve arc lengths are calculated with
+    the analytical solution in fontTools.
+    """
+    distances: List[float] = []
+    for segment in segments:
+        if len(segment) == 2:
+            start, end = segment
+            distances.append(
+                linear_distance_between_coordinates((start.x, start.y), (end.x, end.y))
+            )
+        else:
+            start, off_curve, end = segment
+            distances.append(
+                calcQuadraticArcLength(
+                    (start.x, start.y), (off_curve.x, off_curve.y), (end.x, end.y)
+                )
+            )
+    return distances
 
 
-def _print_segments(coords: List[Coordinate], nocolor: bool) -> None:
+def _quadratic_segments(coords: List[Coordinate]) -> List[Segment]:
+    # returns the line and quadratic curve segments of a quadratic
+    # path with implied on-curve points in path order
+    segments: List[Segment] = []
     start_coord = None
-    total_distance: float = 0.0
     for coord in coords:
         # keep start coordinate for calculation of final
         # contour point distances as curve is closed
@@ -94,62 +195,93 @@ def _print_segments(coords: List[Coordinate], nocolor: bool) -> None:
         if coord.oncurve:
             # we are on the curve, check previous point to see if this
             # is a line or quadratic curve segment
-            if coord.coord_previous:
-                if coord.coord_previous.oncurve:
-                    distance = linear_distance_between_coordinates(
-                        (coord.coord_previous.x, coord.coord_previous.y),
-                        (coord.x, coord.y),
-                    )
-                    line_string = segment_line(
-                        coord.coord_previous,
-                        coord,
-                        distance,
-                        nocolor,
-                    )
-                    total_distance += distance
-                    print(line_string)
-                else:
-                    pass
+            if coord.coord_previous and coord.coord_previous.oncurve:
+                segments.append((coord.coord_previous, coord))
 
             if coord.endpoint and start_coord:
                 # add the endpoint to startpoint segment if the endpoint is oncurve
                 # note: this is a forward direction write in contrast to previous
                 #       logic which checks backwards
-                distance = linear_distance_between_coordinates(
-                    (coord.x, coord.y), (start_coord.x, start_coord.y)
-                )
-                line_string = segment_line(coord, start_coord, distance, nocolor)
-                total_distance += distance
-                print(line_string)
+                segments.append((coord, start_coord))
         # we have an off-curve point
         else:
             if coord.endpoint and coord.coord_previous and start_coord:
-                distance = calcQuadraticArcLength(
-                    (coord.coord_previous.x, coord.coord_previous.y),
-                    (coord.x, coord.y),
-                    (start_coord.x, start_coord.y),
-                )
-                qcurve_string = segment_quadratic_curve(
-                    coord.coord_previous, coord, start_coord, distance, nocolor
-                )
-                total_distance += distance
-                print(qcurve_string)
+                segments.append((coord.coord_previous, coord, start_coord))
             elif coord.coord_previous and coord.coord_next:
                 assert coord.coord_previous.oncurve is True
                 assert coord.coord_next.oncurve is True
-                distance = calcQuadraticArcLength(
-                    (coord.coord_previous.x, coord.coord_previous.y),
-                    (coord.x, coord.y),
-                    (coord.coord_next.x, coord.coord_next.y),
-                )
-                qcurve_string = segment_quadratic_curve(
-                    coord.coord_previous,
-                    coord,
-                    coord.coord_next,
-                    distance,
-                    nocolor,
-                )
-                total_distance += distance
-                print(qcurve_string)
+                segments.append((coord.coord_previous, coord, coord.coord_next))
+    return segments
+
+
+def segments_record(decomposed: DecomposedGlyph) -> Dict[str, Any]:
+    """
+    Returns the segments record fields for shared glyph
+    decomposition data.  Composite glyphs are decomposed.
+    """
+    coords: List[Coordinate] = quadratic_path(
+        decomposed.decomposed_glyph, decomposed.glyf_table, include_implied=True
+    )
+    segments = _quadratic_segments(coords)
+    distances = segment_distances(segments)
+    segment_records: List[Dict[str, Any]] = []
+    total_distance: float = 0.0
+    for segment, distance in zip(segments, distances):
+        segment_records.append(
+            {
+                "type": "line" if len(segment) == 2 else "qcurve",
+                "points": [[coord.x, coord.y] for coord in segment],
+                "length": distance,
+            }
+        )
+        total_distance += distance
+    return {"segments": segment_records, "total_length": total_distance}
+
 
-    print(f"{os.linesep} {segment_total_distance(total_distance, nocolor=nocolor)}")
+def segments_rows(decomposed: DecomposedGlyph) -> List[Tuple[Any, ...]]:
+    """
+    Returns the segments table rows, without font and glyph
+    columns, for shared glyph decomposition data.  Composite
+    glyphs are decomposed.
+    """
+    coords: List[Coordinate] = quadratic_path(
+        decomposed.decomposed_glyph, decomposed.glyf_table, include_implied=True
+    )
+    # Coordinate object identity : contour index
+    contours: Dict[int, int] = {}
+    contour = -1
+    for coord in coords:
+        if coord.startpoint:
+            contour += 1
+        contours[id(coord)] = contour
+
+    segments = _quadratic_segments(coords)
+    rows: List[Tuple[Any, ...]] = []
+    for x, (segment, distance) in enumerate(zip(segments, segment_distances(segments))):
+        start = segment[0]
+        end = segment[-1]
+        if len(segment) == 2:
+            segment_type = "line"
+            control_x: Optional[int] = None
+            control_y: Optional[int] = None
+        else:
+            segment_type = "qcurve"
+            control_x = segment[1].x
+            control_y = segment[1].y
+        rows.append(
+            (
+                contours[id(start)],
+                x,
+                segment_type,
+                start.x,
+                start.y,
+                control_x,
+                control_y,
+                end.x,
+                end.y,
+                int(start.implied),
+                int(end.implied),
+                distance,
+            )
+        )
+    return rows
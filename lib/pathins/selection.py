@@ -0,0 +1,182 @@
+import argparse
+import fnmatch
+import os
+import re
+import sys
+from typing import Callable, List, Optional, Sequence, Set, Tuple, Union
+
+from fontTools.ttLib import TTFont  # type: ignore
+
+from .validators import validate_glyph_in_font
+
+# inclusive (first, last) integer range
+Range = Tuple[int, int]
+
+UNICODE_PREFIXES = ("U+", "u+", "0x", "0X")
+
+
+def parse_gid_ranges(ranges: str) -> List[Range]:
+    """
+    Returns a list of inclusive (first, last) glyph ID ranges
+    from a comma-separated string of glyph IDs and glyph ID
+    ranges (e.g., "100-500,600").  Raises ValueError on invalid
+    range definitions.
+    """
+    return [_parse_range(item, _parse_gid) for item in _range_items(ranges)]
+
+
+def parse_unicode_ranges(ranges: str) -> List[Range]:
+    """
+    Returns a list of inclusive (first, last) Unicode code point
+    ranges from a comma-separated string of hexadecimal code
+    points and code point ranges (e.g., "U+0400-04FF,U+0020").
+    Raises ValueError on invalid range definitions.
+    """
+    return [_parse_range(item, _parse_code_point) for item in _range_items(ranges)]
+
+
+def select_glyph_ids(
+    tt: TTFont,
+    glyph_names: Optional[Sequence[str]] = None,
+    patterns: Optional[Sequence[str]] = None,
+    regexes: Optional[Sequence[str]] = None,
+    unicode_ranges: Optional[Sequence[Range]] = None,
+    gid_ranges: Optional[Sequence[Range]] = None,
+) -> Set[int]:
+    """
+    Returns the set of glyph IDs that are selected by any of the
+    glyph names, glob `patterns` that match whole glyph names, regular
+    expressions that are searched in glyph names, Unicode code
+    point ranges mapped through the cmap table, and glyph ID
+    ranges.  Raises KeyError on glyph names that are not in the
+    font and re.error on invalid regular expressions.
+    """
+    glyph_order = tt.getGlyphOrder()
+    reverse_glyph_map = tt.getReverseGlyphMap()
+    glyph_ids: Set[int] = set()
+
+    for glyph_name in glyph_names or []:
+        glyph_ids.add(reverse_glyph_map[glyph_name])
+
+    if patterns or regexes:
+        # glob patterns match whole glyph names, regular expressions
+        # are searched anywhere in glyph names
+        globs = [re.compile(fnmatch.translate(pattern)) for pattern in patterns or []]
+        compiled = [re.compile(regex) for regex in regexes or []]
+        glyph_ids.update(
+            glyph_id
+            for glyph_id, glyph_name in enumerate(glyph_order)
+            if any(glob.fullmatch(glyph_name) for glob in globs)
+            or any(regex.search(glyph_name) for regex in compiled)
+        )
+
+    if unicode_ranges:
+        for code_point, glyph_name in tt.getBestCmap().items():
+            if glyph_name in reverse_glyph_map and _in_ranges(code_point, unicode_ranges):
+                glyph_ids.add(reverse_glyph_map[glyph_name])
+
+    for first, last in gid_ranges or []:
+        glyph_ids.update(range(first, min(last, len(glyph_order) - 1) + 1))
+
+    return glyph_ids
+
+
+def selected_glyph_names(args: argparse.Namespace, tt: TTFont) -> List[str]:
+    """
+    Returns the glyph names that are requested with the glyph
+    selection command line arguments in glyph order.  All glyph
+    selections are combined.  The full glyph set is returned
+    when no glyph selection is requested.  Invalid selections
+    are reported on the standard error stream and exit with
+    status code 1.
+    """
+    glyph_names = list(getattr(args, "glyph", None) or [])
+    if getattr(args, "glyphname", None):
+        glyph_names.append(args.glyphname)
+    patterns = getattr(args, "match", None)
+    regexes = getattr(args, "regex", None)
+    unicodes = getattr(args, "unicodes", None)
+    gids = getattr(args, "gid", None)
+
+    if not (glyph_names or patterns or regexes or unicodes or gids):
+        return tt.getGlyphOrder()
+
+    for glyph_name in glyph_names:
+        # confirm that `glyph_name` request is in the font
+        validate_glyph_in_font(glyph_name, tt)
+    try:
+        glyph_ids = select_glyph_ids(
+            tt,
+            glyph_names=glyph_names,
+            patterns=patterns,
+            regexes=regexes,
+            unicode_ranges=parse_unicode_ranges(unicodes) if unicodes else None,
+            gid_ranges=parse_gid_ranges(gids) if gids else None,
+        )
+    except (ValueError, re.error) as e:
+        sys.stderr.write(f"error: invalid glyph selection. {e}{os.linesep}")
+        sys.exit(1)
+
+    glyph_order = tt.getGlyphOrder()
+    return [glyph_order[glyph_id] for glyph_id in sorted(glyph_ids)]
+
+
+def select_analyses(
+    analyses: Union[None, str, Sequence[str]], supported: Sequence[str]
+) -> List[str]:
+    """
+    Returns the requested analysis names in `supported` order.
+    A single analysis name string is accepted, and all `supported`
+    analyses are returned when no analyses are requested.  Raises
+    ValueError on unsupported analysis names.
+    """
+    if not analyses:
+        return list(supported)
+    if isinstance(analyses, str):
+        analyses = [analyses]
+    for analysis in analyses:
+        if analysis not in supported:
+            raise ValueError(f"unsupported analysis '{analysis}'")
+    return [analysis for analysis in supported if analysis in analyses]
+
+
+def _range_items(ranges: str) -> List[str]:
+    items = [item.strip() for item in ranges.split(",")]
+    if not all(items):
+        raise ValueError(f"'{ranges}' includes an empty range")
+    return items
+
+
+def _parse_range(item: str, parse_value: Callable[[str], int]) -> Range:
+    first, separator, last = item.partition("-")
+    first_value = parse_value(first.strip())
+    last_value = parse_value(last.strip()) if separator else first_value
+    if last_value < first_value:
+        raise ValueError(f"'{item}' range end is less than range start")
+    return first_value, last_value
+
+
+def _parse_gid(value: str) -> int:
+    if not value.isdigit():
+        raise ValueError(f"'{value}' is not a valid glyph ID")
+    return int(value)
+
+
+def _parse_code_point(value: str) -> int:
+    digits = value
+    for prefix in UNICODE_PREFIXES:
+        if digits.startswith(prefix):
+            start = len(prefix)
+            digits = digits[start:]
+            break
+    try:
+        code_point = int(digits, 16)
+    except ValueError:
+        raise ValueError(f"'{value}' is not a valid Unicode code point")
+    if code_point > 0x10FFFF:
+        raise ValueError(f"'{value}' is outside of the Unicode code point range")
+    return code_point
+
+
+def _in_ranges(value: int, ranges: Sequence[Range]) -> bool:
+    return any(first <= value <= last for first, last in ranges)
@@ -1,6 +1,6 @@
 import os
 import sys
-from typing import Dict, Sequence, Text, Tuple
+from typing import Any, Dict, Sequence, Text, Tuple
 
 from .datastructures import Coordinate
 
@@ -100,21 +100,97 @@ def report_header(header: str, nocolor: bool = False) -> str:
     return header_string
 
 
-# def overlap_result(glyphname: str, test_pass: bool, nocolor: bool = False) -> str:
-#     # color
-#     if not nocolor and IS_A_TTY:
-#         if test_pass:
-#             result_pre = f"[ {red_start}{glyphname}{reset} ]: "
-#         else:
-#             result_pre = f"[ {green_start}{glyphname}{reset} ]: "
-#     else:
-#         result_pre = f"[ {glyphname} ]: "
-#     # test pass indicator
-#     if test_pass:
-#         result = result_pre + "Yes"
-#     else:
-#         result = result_pre + "No"
-#     return result
+def font_header(fontpath: str, nocolor: bool = False) -> str:
+    header_len = len(fontpath) + 1
+    divider_char = "="
+    if not nocolor and IS_A_TTY:
+        header_string = (
+            f"{divider_char * header_len}{os.linesep}"
+            f"{bold_start}{fontpath}{reset}{os.linesep}"
+            f"{divider_char * header_len}"
+        )
+    else:
+        header_string = (
+            f"{divider_char * header_len}{os.linesep}"
+            f"{fontpath}{os.linesep}"
+            f"{divider_char * header_len}"
+        )
+    return header_string
+
+
+def batch_summary(
+    number_of_fonts: int,
+    failed_fontpaths: Sequence[str],
+    nocolor: bool = False,
+    flagged_fontpaths: Sequence[str] = (),
+) -> str:
+    # flagged fonts were analyzed and a --check option found an issue
+    number_of_failed = len(failed_fontpaths)
+    number_of_flagged = len(flagged_fontpaths)
+    number_of_ok = number_of_fonts - number_of_failed - number_of_flagged
+    summary_string = (
+        f"{bold_text('Summary', nocolor=nocolor)}: {number_of_fonts} fonts, "
+        f"{green_text(f'{number_of_ok} ok', nocolor=nocolor)}, "
+    )
+    if number_of_flagged > 0:
+        summary_string += f"{red_text(f'{number_of_flagged} flagged', nocolor=nocolor)}, "
+    summary_string += f"{red_text(f'{number_of_failed} failed', nocolor=nocolor)}"
+    for fontpath in flagged_fontpaths:
+        summary_string += f"{os.linesep}   flagged: {fontpath}"
+    for fontpath in failed_fontpaths:
+        summary_string += f"{os.linesep}   failed: {fontpath}"
+    return summary_string
+
+
+def diff_result(glyphname: str, status: str, nocolor: bool = False) -> str:
+    if not nocolor and IS_A_TTY:
+        if status == "added":
+            status_string = f"{green_start}{status}{reset}"
+        elif status == "removed":
+            status_string = f"{red_start}{status}{reset}"
+        else:
+            status_string = f"{cyan_start}{status}{reset}"
+        return f"[ {bright_cyan_start}{glyphname}{reset} ]: {status_string}"
+    else:
+        return f"[ {glyphname} ]: {status}"
+
+
+def diff_metric_line(metric: str, old_value: Any, new_value: Any) -> str:
+    return f"   {metric}: {_diff_value(old_value)} -> {_diff_value(new_value)}"
+
+
+def _diff_value(value: Any) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return f"{value}"
+
+
+def diff_summary(
+    number_changed: int, number_added: int, number_removed: int, nocolor: bool = False
+) -> str:
+    return (
+        f"{bold_text('Summary', nocolor=nocolor)}: {number_changed} changed, "
+        f"{number_added} added, {number_removed} removed"
+    )
+
+
+def overlap_result(glyphname: str, test_pass: bool, nocolor: bool = False) -> str:
+    # color
+    if not nocolor and IS_A_TTY:
+        if test_pass:
+            result_pre = f"[ {red_start}{glyphname}{reset} ]: "
+        else:
+            result_pre = f"[ {green_start}{glyphname}{reset} ]: "
+    else:
+        result_pre = f"[ {glyphname} ]: "
+    # test pass indicator
+    if test_pass:
+        result = result_pre + "Yes"
+    else:
+        result = result_pre + "No"
+    return result
 
 
 def direction_result(
@@ -125,33 +201,27 @@ def direction_result(
     nocolor: bool = False,
 ) -> str:
     if not nocolor and IS_A_TTY:
-        if contours == 0:
-            return f"[ {bright_cyan_start}{glyphname}{reset} ]: no contours"
-        if direction_clockwise:
-            return (
-                f"[ {bright_cyan_start}{glyphname}{reset} ]: "
-                f"clockwise"
-                f"{_transformed_component(components_with_transforms)}"
-            )
-        else:
-            return (
-                f"[ {bright_cyan_start}{glyphname}{reset} ]: "
-                f"counter-clockwise"
-                f"{_transformed_component(components_with_transforms)}"
-            )
+        result_pre = f"[ {bright_cyan_start}{glyphname}{reset} ]: "
     else:
-        if contours == 0:
-            return f"[ {glyphname} ]: no contours"
-        if direction_clockwise:
-            return (
-                f"[ {glyphname} ]: clockwise"
-                f"{_transformed_component(components_with_transforms)}"
-            )
-        else:
-            return (
-                f"[ {glyphname} ]: counter-clockwise"
-                f"{_transformed_component(components_with_transforms)}"
-            )
+        result_pre = f"[ {glyphname} ]: "
+    return result_pre + direction_text(
+        direction_clockwise,
+        contours,
+        components_with_transforms=components_with_transforms,
+    )
+
+
+def direction_text(
+    direction_clockwise: bool,
+    contours: int,
+    components_with_transforms: Sequence[Tuple] = [],
+) -> str:
+    if contours == 0:
+        return "no contours"
+    if direction_clockwise:
+        return f"clockwise{_transformed_component(components_with_transforms)}"
+    else:
+        return f"counter-clockwise{_transformed_component(components_with_transforms)}"
 
 
 def _transformed_component(components_with_transforms: Sequence[Tuple]) -> str:
@@ -1,6 +1,22 @@
+import mmap
 import os
 from typing import Union
 
+from fontTools.ttLib import TTFont  # type: ignore
+
+TRUETYPE_SIGNATURES = (b"\x00\x01\x00\x00", b"\x74\x72\x75\x65")
+
+
+class CheckIssueFound(SystemExit):
+    """
+    Exits with status code 1 when a sub-command --check option
+    finds an issue in a font.  Multi-font requests report these
+    fonts separately from fonts that failed.
+    """
+
+    def __init__(self) -> None:
+        super(CheckIssueFound, self).__init__(1)
+
 
 def is_truetype_font(filepath: Union[bytes, str, "os.PathLike[str]"]) -> bool:
     """Tests that a font has the TrueType file signature of either:
@@ -9,4 +25,37 @@ def is_truetype_font(filepath: Union[bytes, str, "os.PathLike[str]"]) -> bool:
     with open(filepath, "rb") as f:
         file_signature: bytes = f.read(4)
 
-        return file_signature in (b"\x00\x01\x00\x00", b"\x74\x72\x75\x65")
+        return has_truetype_signature(file_signature)
+
+
+def has_truetype_signature(data: Union[bytes, mmap.mmap]) -> bool:
+    """
+    Tests that in-memory or memory mapped font file data begin
+    with a TrueType file signature.  See is_truetype_font.
+    """
+    return data[:4] in TRUETYPE_SIGNATURES
+
+
+def map_font_file(fontpath: Union[bytes, str, "os.PathLike[str]"]) -> mmap.mmap:
+    """
+    Returns a read-only memory map of the font file at `fontpath`.
+    Font data are paged in from the file on demand and the pages
+    are shared across all processes that map the same file.
+    Raises ValueError on empty files.
+    """
+    with open(fontpath, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def open_font(font: Union[str, "os.PathLike[str]", mmap.mmap]) -> TTFont:
+    """
+    Returns a fontTools.ttLib.TTFont object for a font file path or
+    a memory mapped font file with lazy table loading.  Font tables
+    are read from the memory map and decompiled on first access, and
+    glyf table glyphs are only decompiled when they are requested.
+    The full font file is *not* read into memory.  The memory map is
+    closed when the TTFont is closed.
+    """
+    if not isinstance(font, mmap.mmap):
+        font = map_font_file(font)
+    return TTFont(font, lazy=True)
@@ -1,29 +1,43 @@
+import mmap
 import os
 import sys
 from typing import Union
 
 from fontTools.ttLib import ttFont  # type: ignore
 
-from .utils import is_truetype_font
+from .utils import has_truetype_signature, map_font_file
 
 
-def validate_fontpath(fontpath: Union[bytes, str, "os.PathLike[str]"]) -> None:
+def validate_fontpath(fontpath: Union[bytes, str, "os.PathLike[str]"]) -> mmap.mmap:
+    """
+    Validates a font file path and returns a read-only memory map
+    of the font file.  The memory map is intended for use as the
+    utils.open_font source so that the file is only read once.
+    """
     if not os.path.isfile(fontpath):
         sys.stderr.write(
             f"error: {str(fontpath)} does not appear to be a file{os.linesep}"
         )
         sys.exit(1)
-    if not is_truetype_font(fontpath):
+    try:
+        font_file = map_font_file(fontpath)
+    except ValueError:
+        # empty files cannot be memory mapped
+        font_file = None
+    if font_file is None or not has_truetype_signature(font_file):
+        if font_file is not None:
+            font_file.close()
         sys.stderr.write(
             f"error: {str(fontpath)} does not appear to be a TTF format font{os.linesep}"
         )
         sys.exit(1)
+    return font_file
 
 
 def validate_glyph_in_font(glyph_name: str, tt_font: ttFont.TTFont) -> None:
-    try:
-        tt_font["glyf"][glyph_name]  # type: ignore
-    except Exception:
+    # test against the font glyph order so that the
+    # glyph is not decompiled during the validation
+    if glyph_name not in tt_font.getReverseGlyphMap():
         sys.stderr.write(
             f"error: Failed to open glyph '{glyph_name}'. "
             f"Does it exist in the font?{os.linesep}"
@@ -0,0 +1,60 @@
+import sys
+from typing import Any, List, Optional, TextIO
+
+# number of buffered characters that triggers a write to the sink
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class ReportWriter(object):
+    """
+    Buffered text report writer.  Report strings are accumulated
+    in memory and written to the sink in large blocks when the
+    buffered text reaches `buffer_size` characters, on flush(),
+    and on context manager exit.
+
+    The sink defaults to the sys.stdout stream that is defined
+    at instantiation.
+    """
+
+    def __init__(
+        self, sink: Optional[TextIO] = None, buffer_size: int = DEFAULT_BUFFER_SIZE
+    ) -> None:
+        self.sink: TextIO = sink if sink is not None else sys.stdout
+        self.buffer_size = buffer_size
+        self._buffer: List[str] = []
+        self._buffered_size = 0
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+    def write(self, text: str) -> None:
+        """
+        Writes `text` to the buffer.
+        """
+        self._buffer.append(text)
+        self._buffered_size += len(text)
+        if self._buffered_size >= self.buffer_size:
+            self._write_buffer()
+
+    def writeline(self, text: str = "") -> None:
+        """
+        Writes `text` and a newline to the buffer.  This is the
+        buffered equivalent of print(text).
+        """
+        self.write(f"{text}\n")
+
+    def flush(self) -> None:
+        """
+        Writes all buffered text to the sink and flushes the sink.
+        """
+        self._write_buffer()
+        self.sink.flush()
+
+    def _write_buffer(self) -> None:
+        if self._buffer:
+            self.sink.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered_size = 0
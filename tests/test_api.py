@@ -0,0 +1,115 @@
+import os
+
+import pytest
+from fontTools.ttLib import TTFont
+import pathins
+from pathins.api import (
+    GlyphResult,
+    PathOperation,
+    Point,
+    Segment,
+    TransformedComponent,
+    glyph_result,
+    inspect,
+)
+from pathins.coordinates import coordinates_record
+from pathins.formats import glyph_record
+from pathins.report import RECORDS
+from pathins.segments import segments_record
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+TESTFONT_PATH_2 = os.path.join(
+    "tests", "testfiles", "fonts", "NotoSans-Regular.subset1.ttf"
+)
+
+
+def test_package_exports():
+    assert pathins.inspect is inspect
+    assert pathins.GlyphResult is GlyphResult
+
+
+def test_inspect_is_lazy(monkeypatch):
+    calls = []
+    monkeypatch.setitem(RECORDS, "contours", lambda decomposed: calls.append(1) or {})
+    results = inspect(TESTFONT_PATH_1, ["contours"])
+    assert calls == []
+    next(results)
+    assert calls == [1]
+    results.close()
+
+
+def test_inspect_full_glyph_set():
+    results = list(inspect(TESTFONT_PATH_1))
+    assert [result.glyph for result in results] == TTFont(TESTFONT_PATH_1).getGlyphOrder()
+    assert all(isinstance(result, GlyphResult) for result in results)
+    assert all(result.font == TESTFONT_PATH_1 for result in results)
+
+
+def test_inspect_requested_analyses_and_glyphs():
+    results = list(inspect(TESTFONT_PATH_1, ["overlap", "contours"], ["zero", "A"]))
+    assert results == [
+        GlyphResult(TESTFONT_PATH_1, "zero", contours=3, overlap=False),
+        GlyphResult(TESTFONT_PATH_1, "A", contours=2, overlap=False),
+    ]
+
+
+def test_inspect_single_glyph_name():
+    (result,) = inspect(TESTFONT_PATH_2, glyphs="uni2E2E")
+    assert result.glyph == "uni2E2E"
+    assert result.direction == "counter-clockwise"
+    assert result.transformed_components == (
+        TransformedComponent("question", ((-1.0, 0), (0, 1.0))),
+    )
+    assert result.coordinates[0] == Point(303, 201, True, True, False)
+    assert isinstance(result.path[0], PathOperation)
+    assert result.path[0].operation == "moveTo"
+    assert isinstance(result.segments[0], Segment)
+    assert result.total_length == pytest.approx(
+        sum(segment.length for segment in result.segments)
+    )
+
+
+def test_inspect_ttfont():
+    tt = TTFont(TESTFONT_PATH_1)
+    (result,) = inspect(tt, ["contours"], ["Scedilla"])
+    assert result == GlyphResult("", "Scedilla", contours=2)
+    # fonts that are owned by the caller are not closed
+    assert tt["glyf"]["A"].numberOfContours == 2
+
+
+def test_inspect_jobs_and_cache(tmp_path):
+    cache_path = str(tmp_path / "cache.db")
+    serial = list(inspect(TESTFONT_PATH_1, ["segments", "direction"]))
+    for _ in range(2):
+        assert (
+            list(
+                inspect(
+                    TESTFONT_PATH_1,
+                    ["segments", "direction"],
+                    jobs=2,
+                    cache_path=cache_path,
+                )
+            )
+            == serial
+        )
+
+
+def test_inspect_invalid_requests():
+    with pytest.raises(ValueError):
+        inspect(TESTFONT_PATH_1, ["bogus"])
+    with pytest.raises(ValueError):
+        inspect(TTFont(TESTFONT_PATH_1), jobs=2)
+    with pytest.raises(ValueError):
+        next(inspect(TESTFONT_PATH_1, glyphs=["A", "bogus"]))
+
+
+def test_glyph_result():
+    tt = TTFont(TESTFONT_PATH_1)
+    record = glyph_record("A", tt, [coordinates_record, segments_record], fontpath="")
+    result = glyph_result(record)
+    assert len(result.coordinates) == len(record["coordinates"])
+    assert [segment.points for segment in result.segments] == [
+        tuple(tuple(point) for point in segment["points"])
+        for segment in record["segments"]
+    ]
+    assert result.contours is None
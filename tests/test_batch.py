@@ -0,0 +1,165 @@
+import json
+import os
+
+import pytest
+from pathins.__main__ import run
+from pathins.batch import expand_fontpaths, split_fontpath_arguments
+
+TESTFONT_DIR = os.path.join("tests", "testfiles", "fonts")
+TESTFONT_PATH_1 = os.path.join(TESTFONT_DIR, "NotoSans-Regular.subset1.ttf")
+TESTFONT_PATH_2 = os.path.join(TESTFONT_DIR, "RobotoMono-subset1.ttf")
+TESTTEXT_PATH = os.path.join("tests", "testfiles", "text", "test.txt")
+
+
+def test_expand_fontpaths_file():
+    assert expand_fontpaths([TESTFONT_PATH_1]) == [TESTFONT_PATH_1]
+
+
+def test_expand_fontpaths_directory():
+    # non-font files in the directory are not included
+    assert expand_fontpaths([TESTFONT_DIR]) == [TESTFONT_PATH_1, TESTFONT_PATH_2]
+
+
+def test_expand_fontpaths_glob():
+    pattern = os.path.join(TESTFONT_DIR, "Roboto*.ttf")
+    assert expand_fontpaths([pattern]) == [TESTFONT_PATH_2]
+
+
+def test_expand_fontpaths_glob_without_match():
+    pattern = os.path.join(TESTFONT_DIR, "Bogus*.ttf")
+    assert expand_fontpaths([pattern]) == [pattern]
+
+
+def test_expand_fontpaths_missing_path():
+    assert expand_fontpaths(["boguspath"]) == ["boguspath"]
+
+
+def test_split_fontpath_arguments_single_path():
+    assert split_fontpath_arguments([TESTFONT_PATH_1], None) == ([TESTFONT_PATH_1], None)
+
+
+def test_split_fontpath_arguments_single_path_with_glyphname():
+    assert split_fontpath_arguments([TESTFONT_PATH_1, "A"], None) == (
+        [TESTFONT_PATH_1],
+        "A",
+    )
+
+
+def test_split_fontpath_arguments_multi_path_with_glyphname():
+    assert split_fontpath_arguments([TESTFONT_PATH_1, TESTFONT_PATH_2, "A"], None) == (
+        [TESTFONT_PATH_1, TESTFONT_PATH_2],
+        "A",
+    )
+
+
+def test_split_fontpath_arguments_multi_path():
+    assert split_fontpath_arguments([TESTFONT_PATH_1, TESTFONT_PATH_2], None) == (
+        [TESTFONT_PATH_1, TESTFONT_PATH_2],
+        None,
+    )
+
+
+@pytest.mark.parametrize(
+    "mistyped_path",
+    ["missing.ttf", "missing.OTF", "missing.ttc", os.path.join("fonts", "missing")],
+)
+def test_split_fontpath_arguments_mistyped_path(mistyped_path):
+    # mistyped font paths are not interpreted as glyph names
+    assert split_fontpath_arguments([TESTFONT_PATH_1, mistyped_path], None) == (
+        [TESTFONT_PATH_1, mistyped_path],
+        None,
+    )
+
+
+def test_run_batch_single_font_has_no_summary(capsys):
+    run(["contours", "--nocolor", TESTFONT_PATH_1, "A"])
+
+    captured = capsys.readouterr()
+    assert captured.out == f"[ A ]: 2{os.linesep}"
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_run_batch_multi_font(capsys, jobs):
+    run(["contours", "--nocolor", "--jobs", jobs, TESTFONT_DIR, "A"])
+
+    captured = capsys.readouterr()
+    assert TESTFONT_PATH_1 in captured.out
+    assert TESTFONT_PATH_2 in captured.out
+    # per-font report sections are in request order
+    assert captured.out.index(TESTFONT_PATH_1) < captured.out.index(TESTFONT_PATH_2)
+    assert captured.out.count("[ A ]: 2") == 2
+    assert "Summary: 2 fonts, 2 ok, 0 failed" in captured.out
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_run_batch_multi_font_with_failure(capsys, jobs):
+    with pytest.raises(SystemExit) as e:
+        run(["contours", "--nocolor", "--jobs", jobs, TESTFONT_DIR, TESTTEXT_PATH])
+
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "does not appear to be a TTF format font" in captured.err
+    assert "Summary: 3 fonts, 2 ok, 1 failed" in captured.out
+    assert f"failed: {TESTTEXT_PATH}" in captured.out
+
+
+def test_run_batch_mistyped_font_path(capsys):
+    with pytest.raises(SystemExit) as e:
+        run(["contours", "--nocolor", TESTFONT_PATH_1, "missing.ttf"])
+
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "missing.ttf does not appear to be a file" in captured.err
+    assert "Failed to open glyph" not in captured.err
+    assert "Summary: 2 fonts, 1 ok, 1 failed" in captured.out
+    assert "failed: missing.ttf" in captured.out
+
+
+def test_run_batch_multi_font_missing_glyph(capsys):
+    with pytest.raises(SystemExit) as e:
+        run(["contours", "--nocolor", TESTFONT_PATH_1, TESTFONT_PATH_2, "Amacron"])
+
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "Failed to open glyph 'Amacron'" in captured.err
+    assert "[ Amacron ]: 3" in captured.out
+    assert f"failed: {TESTFONT_PATH_1}" in captured.out
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_run_batch_overlap_check_is_not_a_failure(capsys, jobs):
+    with pytest.raises(SystemExit) as e:
+        run(["overlap", "--check", "--nocolor", "--jobs", jobs, TESTFONT_DIR])
+
+    captured = capsys.readouterr()
+    # overlaps that are found are reported, the font did not fail
+    assert e.value.code == 1
+    assert "Summary: 2 fonts, 1 ok, 1 flagged, 0 failed" in captured.out
+    assert f"flagged: {TESTFONT_PATH_2}" in captured.out
+    assert "failed:" not in captured.out
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_run_batch_overlap_check_json(capsys, jobs):
+    with pytest.raises(SystemExit) as e:
+        run(
+            [
+                "overlap",
+                "--check",
+                "--format",
+                "json",
+                "--jobs",
+                jobs,
+                TESTFONT_DIR,
+                TESTTEXT_PATH,
+            ]
+        )
+
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert json.loads(captured.out) == [
+        {"font": TESTFONT_PATH_1, "overlap": False},
+        {"font": TESTFONT_PATH_2, "overlap": True},
+    ]
+    assert "Summary: 3 fonts, 1 ok, 1 flagged, 1 failed" in captured.err
+    assert f"failed: {TESTTEXT_PATH}" in captured.err
@@ -235,3 +235,132 @@ def test_quadratic_path_simple_glyph_with_implied():
     assert eleventh.endpoint is True
     assert eleventh.coord_next is None
     assert eleventh.coord_previous == tenth
+
+
+def _duplicate_coordinate_glyph():
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((100, 0))
+    pen.lineTo((100, 100))
+    pen.lineTo((100, 0))
+    pen.lineTo((0, 100))
+    pen.closePath()
+    # second contour start point and first contour end point
+    # share the same coordinates
+    pen.moveTo((0, 100))
+    pen.lineTo((200, 200))
+    pen.lineTo((200, 0))
+    pen.closePath()
+    return pen.glyph()
+
+
+def test_contour_point_indices():
+    starts, ends = pathins.bezier.contour_point_indices([3, 7, 8])
+    assert starts == {0, 4, 8}
+    assert ends == {3, 7, 8}
+    assert pathins.bezier.contour_point_indices([]) == (set(), set())
+
+
+def test_quadratic_path_duplicate_coordinates():
+    glyph = _duplicate_coordinate_glyph()
+    qpath = pathins.bezier.quadratic_path(glyph, None)
+    assert len(qpath) == 8
+    assert [coord.startpoint for coord in qpath] == [
+        True,
+        False,
+        False,
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert [coord.endpoint for coord in qpath] == [
+        False,
+        False,
+        False,
+        False,
+        True,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_implied_oncurve_points_off_curve_pairs():
+    coords = [(0, 0), (0, 100), (100, 101), (100, 0)]
+    new_coords, endpoints, oncurve, implied = pathins.bezier.implied_oncurve_points(
+        coords, [3], [1, 0, 0, 1]
+    )
+    # implied point coordinates are rounded towards +Infinity
+    assert new_coords == [(0, 0), (0, 100), (50, 101), (100, 101), (100, 0)]
+    assert endpoints == [4]
+    assert oncurve == [True, False, True, False, True]
+    assert implied == [False, False, True, False, False]
+
+
+def test_implied_oncurve_points_wrap_around_pair():
+    # all off-curve point contour followed by a line contour
+    coords = [(0, 0), (0, 100), (100, 100), (100, 0), (200, 0), (300, 0)]
+    new_coords, endpoints, oncurve, implied = pathins.bezier.implied_oncurve_points(
+        coords, [3, 5], [0, 0, 0, 0, 1, 1]
+    )
+    # the implied point between the end point and the start point
+    # is the new contour start point
+    assert new_coords == [
+        (50, 0),
+        (0, 0),
+        (0, 50),
+        (0, 100),
+        (50, 100),
+        (100, 100),
+        (100, 50),
+        (100, 0),
+        (200, 0),
+        (300, 0),
+    ]
+    assert endpoints == [7, 9]
+    assert oncurve == [True, False] * 4 + [True, True]
+    assert implied == [True, False] * 4 + [False, False]
+
+
+def test_implied_oncurve_points_off_curve_start_point():
+    coords = [(50, 100), (100, 0), (0, 0)]
+    new_coords, endpoints, oncurve, implied = pathins.bezier.implied_oncurve_points(
+        coords, [2], [0, 1, 1]
+    )
+    # the on-curve end point is moved to the contour start
+    assert new_coords == [(0, 0), (50, 100), (100, 0)]
+    assert endpoints == [2]
+    assert oncurve == [True, False, True]
+    assert implied == [False, False, False]
+
+
+def test_implied_oncurve_points_single_point_contours():
+    coords = [(10, 10), (0, 0), (0, 100), (100, 0)]
+    new_coords, endpoints, oncurve, implied = pathins.bezier.implied_oncurve_points(
+        coords, [0, 3], [0, 1, 0, 1]
+    )
+    assert new_coords == coords
+    assert endpoints == [0, 3]
+    assert oncurve == [False, True, False, True]
+    assert implied == [False] * 4
+
+
+def test_quadratic_path_single_point_contour():
+    from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphCoordinates
+
+    glyph = Glyph()
+    glyph.numberOfContours = 2
+    glyph.coordinates = GlyphCoordinates([(0, 0), (100, 0), (100, 100), (50, 200)])
+    glyph.endPtsOfContours = [2, 3]
+    glyph.flags = bytearray([1, 1, 1, 1])
+    qpath = pathins.bezier.quadratic_path(glyph, None, include_implied=True)
+    assert len(qpath) == 4
+    single = qpath[3]
+    assert single.startpoint is True
+    assert single.endpoint is True
+    assert single.coord_previous is None
+    assert single.coord_next is None
@@ -1,10 +1,24 @@
 import os
 
 import pytest
+from fontTools.fontBuilder import FontBuilder
+from fontTools.misc.roundTools import otRound
+from fontTools.pens.recordingPen import DecomposingRecordingPen, RecordingPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
 from fontTools.ttLib import TTFont
-from pathins.bridge import skia_path_to_ttfont_glyph, ttfont_glyph_to_skia_path
+from pathins.bridge import (
+    ComponentDecomposer,
+    DecomposedGlyph,
+    GlyphPathConverter,
+    PointDecomposer,
+    skia_path_to_ttfont_glyph,
+    ttfont_glyph_to_skia_path,
+)
 
 TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+TESTFONT_PATH_2 = os.path.join(
+    "tests", "testfiles", "fonts", "NotoSans-Regular.subset1.ttf"
+)
 
 
 def test_ttfont_glyph_to_skia_path_non_composite():
@@ -38,3 +52,244 @@ def test_skia_path_to_ttfont_glyph_composite():
     # the original composite outlines are decomposed
     # during when converted to skia path
     assert glyph.isComposite() is False
+
+
+def test_decomposed_glyph_non_composite():
+    tt = TTFont(TESTFONT_PATH_1)
+    decomposed = DecomposedGlyph("A", tt)
+    assert decomposed.glyph is tt["glyf"]["A"]
+    # non-composite glyphs are not round-tripped through skia
+    assert decomposed.decomposed_glyph is decomposed.glyph
+    assert len(list(decomposed.skia_path.contours)) == 2
+
+
+def test_decomposed_glyph_composite_is_shared():
+    tt = TTFont(TESTFONT_PATH_1)
+    decomposed = DecomposedGlyph("Scedilla", tt)
+    assert decomposed.glyph.isComposite() is True
+    assert decomposed.decomposed_glyph.isComposite() is False
+    assert decomposed.decomposed_glyph.numberOfContours == 2
+    # decomposition data are built once and re-used
+    assert decomposed.skia_path is decomposed.skia_path
+    assert decomposed.decomposed_glyph is decomposed.decomposed_glyph
+
+
+def test_decomposed_glyph_composite_keeps_source_points():
+    tt = TTFont(TESTFONT_PATH_1)
+    glyf_table = tt["glyf"]
+    decomposed = DecomposedGlyph("Scedilla", tt)
+    coordinates, end_points, flags = glyf_table["Scedilla"].getCoordinates(glyf_table)
+    glyph = decomposed.decomposed_glyph
+    assert list(glyph.coordinates) == list(coordinates)
+    assert glyph.endPtsOfContours == list(end_points)
+    assert list(glyph.flags) == list(flags)
+    # composites are not round-tripped through skia
+    assert decomposed._skia_path is None
+
+
+def test_decomposed_glyph_number_of_points():
+    tt = TTFont(TESTFONT_PATH_1)
+    glyf_table = tt["glyf"]
+    decomposed = DecomposedGlyph("Scedilla", tt)
+    # only decomposition data that were built are counted
+    assert decomposed.number_of_points() == 0
+    decomposed.decomposed_glyph
+    number_of_points = len(glyf_table["Scedilla"].getCoordinates(glyf_table)[0])
+    assert decomposed.number_of_points() == number_of_points
+    decomposed.skia_path
+    number_of_points += len(decomposed.skia_path.points)
+    assert decomposed.number_of_points() == number_of_points
+    # repeated accesses do not change the count
+    decomposed.skia_path
+    decomposed.decomposed_glyph
+    assert decomposed.number_of_points() == number_of_points
+    # source glyph points are not decomposition data
+    decomposed = DecomposedGlyph("A", tt)
+    decomposed.decomposed_glyph
+    assert decomposed.number_of_points() == 0
+
+
+def _nested_composite_font():
+    # base glyph "a", composite "b" = scaled "a", composite "c" = "a" + offset "b"
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef", "a", "b", "c"])
+    fb.setupCharacterMap({})
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 100))
+    pen.qCurveTo((50, 150), (100, 100))
+    pen.lineTo((100, 0))
+    pen.closePath()
+    glyph_a = pen.glyph()
+    pen = TTGlyphPen({"a": glyph_a})
+    pen.addComponent("a", (-1, 0, 0, 0.5, 200, 0))
+    glyph_b = pen.glyph()
+    pen = TTGlyphPen({"a": glyph_a, "b": glyph_b})
+    pen.addComponent("a", (1, 0, 0, 1, 0, 0))
+    pen.addComponent("b", (1, 0, 0, 1, 300, 10))
+    glyph_c = pen.glyph()
+    fb.setupGlyf(
+        {".notdef": TTGlyphPen(None).glyph(), "a": glyph_a, "b": glyph_b, "c": glyph_c}
+    )
+    fb.setupHorizontalMetrics({name: (500, 0) for name in fb.font.getGlyphOrder()})
+    fb.setupHorizontalHeader()
+    return fb.font
+
+
+@pytest.mark.parametrize("fontpath", [TESTFONT_PATH_1, TESTFONT_PATH_2])
+def test_component_decomposer_matches_decomposing_pen(fontpath):
+    tt = TTFont(fontpath)
+    glyph_set = tt.getGlyphSet()
+    decomposer = ComponentDecomposer(glyph_set)
+    for glyph_name in tt.getGlyphOrder():
+        expected = DecomposingRecordingPen(glyph_set)
+        glyph_set[glyph_name].draw(expected)
+        observed = RecordingPen()
+        decomposer.draw(glyph_name, observed)
+        assert observed.value == expected.value
+
+
+def test_component_decomposer_nested_transformed_components():
+    tt = _nested_composite_font()
+    glyph_set = tt.getGlyphSet()
+    decomposer = ComponentDecomposer(glyph_set)
+    for glyph_name in ("b", "c"):
+        expected = DecomposingRecordingPen(glyph_set)
+        glyph_set[glyph_name].draw(expected)
+        observed = RecordingPen()
+        decomposer.draw(glyph_name, observed)
+        assert observed.value == expected.value
+    observed = RecordingPen()
+    decomposer.draw("c", observed)
+    assert observed.value[0] == ("moveTo", ((0, 0),))
+    # "b" mirrors and scales "a", then it is offset in "c"
+    assert ("moveTo", ((500, 10),)) in observed.value
+
+
+def test_component_decomposer_memoizes_components():
+    tt = _nested_composite_font()
+    decomposer = ComponentDecomposer(tt.getGlyphSet())
+    decomposer.draw("b", RecordingPen())
+    decomposer.draw("c", RecordingPen())
+    # "a" and "b" are decomposed once as components
+    assert len(decomposer) == 2
+    assert decomposer.component_recording("a") is decomposer.component_recording("a")
+
+
+def test_glyph_path_converter_convert():
+    tt = TTFont(TESTFONT_PATH_1)
+    converter = GlyphPathConverter(tt)
+    for glyph_name in ("A", "Scedilla", ".notdef"):
+        assert converter.convert(glyph_name) == ttfont_glyph_to_skia_path(glyph_name, tt)
+    # component outlines are memoized across conversions
+    assert len(converter.decomposer) == 2
+
+
+def test_glyph_path_converter_missing_glyph():
+    tt = TTFont(TESTFONT_PATH_1)
+    with pytest.raises(KeyError):
+        GlyphPathConverter(tt).convert("bogus")
+
+
+def _point_matching_font():
+    # composite "c" attaches point 2 of "a" to point 1 of "b"
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef", "a", "b", "c"])
+    fb.setupCharacterMap({})
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 100))
+    pen.lineTo((100, 100))
+    pen.closePath()
+    glyph_a = pen.glyph()
+    pen = TTGlyphPen(None)
+    pen.moveTo((500, 500))
+    pen.lineTo((510, 600))
+    pen.lineTo((600, 500))
+    pen.closePath()
+    glyph_b = pen.glyph()
+    pen = TTGlyphPen({"a": glyph_a, "b": glyph_b})
+    pen.addComponent("b", (1, 0, 0, 1, 0, 0))
+    pen.addComponent("a", (1, 0, 0, 1, 0, 0))
+    glyph_c = pen.glyph()
+    component = glyph_c.components[1]
+    del component.x
+    del component.y
+    component.firstPt = 1
+    component.secondPt = 2
+    fb.setupGlyf(
+        {".notdef": TTGlyphPen(None).glyph(), "a": glyph_a, "b": glyph_b, "c": glyph_c}
+    )
+    fb.setupHorizontalMetrics({name: (500, 0) for name in fb.font.getGlyphOrder()})
+    fb.setupHorizontalHeader()
+    return fb.font
+
+
+@pytest.mark.parametrize("fontpath", [TESTFONT_PATH_1, TESTFONT_PATH_2])
+def test_point_decomposer_matches_get_coordinates(fontpath):
+    tt = TTFont(fontpath)
+    glyf_table = tt["glyf"]
+    decomposer = PointDecomposer(glyf_table)
+    for glyph_name in tt.getGlyphOrder():
+        glyph = decomposer.decompose(glyph_name)
+        assert glyph.isComposite() is False
+        coordinates, end_points, flags = glyf_table[glyph_name].getCoordinates(
+            glyf_table, round=otRound
+        )
+        if len(end_points) == 0:
+            assert glyph.numberOfContours == 0
+            continue
+        coordinates = coordinates.copy()
+        coordinates.toInt()
+        assert list(glyph.coordinates) == list(coordinates)
+        assert glyph.endPtsOfContours == list(end_points)
+        assert list(glyph.flags) == list(flags)
+
+
+def test_point_decomposer_nested_transformed_components():
+    tt = _nested_composite_font()
+    decomposer = PointDecomposer(tt["glyf"])
+    glyph = decomposer.decompose("c")
+    assert glyph.endPtsOfContours == [4, 9]
+    assert list(glyph.flags) == [1, 1, 0, 1, 1, 1, 1, 0, 1, 1]
+    # "b" mirrors and scales "a", then it is offset in "c"
+    assert list(glyph.coordinates) == [
+        (0, 0),
+        (0, 100),
+        (50, 150),
+        (100, 100),
+        (100, 0),
+        (500, 10),
+        (500, 60),
+        (450, 85),
+        (400, 60),
+        (400, 10),
+    ]
+    assert (glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax) == (0, 0, 500, 150)
+
+
+def test_point_decomposer_point_matching_components():
+    tt = _point_matching_font()
+    glyph = PointDecomposer(tt["glyf"]).decompose("c")
+    # point 2 of "a" is moved onto point 1 of "b"
+    assert list(glyph.coordinates) == [
+        (500, 500),
+        (510, 600),
+        (600, 500),
+        (410, 500),
+        (410, 600),
+        (510, 600),
+    ]
+    assert glyph.endPtsOfContours == [2, 5]
+
+
+def test_point_decomposer_memoizes_components():
+    tt = _nested_composite_font()
+    decomposer = PointDecomposer(tt["glyf"])
+    decomposer.decompose("b")
+    decomposer.decompose("c")
+    # "a" and "b" are decomposed once as components
+    assert len(decomposer) == 2
+    assert decomposer.component_points("a") is decomposer.component_points("a")
+    # memoized component points are not transformed
+    assert list(decomposer.component_points("a")[0])[-1] == (100, 0)
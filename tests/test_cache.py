@@ -0,0 +1,117 @@
+import gc
+import os
+
+import pytest
+from fontTools.ttLib import TTFont
+from pathins.cache import (
+    BYTES_PER_ENTRY,
+    DecompositionCache,
+    _font_caches,
+    decomposed_glyph,
+    decomposition_cache,
+)
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+
+
+def test_decomposition_cache_hit_and_miss():
+    tt = TTFont(TESTFONT_PATH_1)
+    cache = DecompositionCache(tt)
+    first = cache.get("Scedilla")
+    second = cache.get("Scedilla")
+    assert first is second
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert len(cache) == 1
+    assert "Scedilla" in cache
+
+
+def test_decomposition_cache_shares_decomposition_data():
+    tt = TTFont(TESTFONT_PATH_1)
+    cache = DecompositionCache(tt)
+    skia_path = cache.get("Scedilla").skia_path
+    glyph = cache.get("Scedilla").decomposed_glyph
+    assert cache.get("Scedilla").skia_path is skia_path
+    assert cache.get("Scedilla").decomposed_glyph is glyph
+    assert glyph.numberOfContours == 2
+
+
+def test_decomposition_cache_missing_glyph():
+    tt = TTFont(TESTFONT_PATH_1)
+    cache = DecompositionCache(tt)
+    with pytest.raises(KeyError):
+        cache.get("bogus")
+    assert len(cache) == 0
+
+
+def test_decomposition_cache_lru_eviction_by_size():
+    tt = TTFont(TESTFONT_PATH_1)
+    cache = DecompositionCache(tt, maxsize=2)
+    cache.get("A")
+    cache.get("B")
+    # refresh "A" so that "B" is the least recently used glyph
+    cache.get("A")
+    cache.get("C")
+    assert len(cache) == 2
+    assert "A" in cache
+    assert "B" not in cache
+    assert "C" in cache
+
+
+def test_decomposition_cache_eviction_by_memory():
+    tt = TTFont(TESTFONT_PATH_1)
+    cache = DecompositionCache(tt, max_bytes=BYTES_PER_ENTRY * 3)
+    for glyph_name in ("A", "B", "C", "Amacron", "Scedilla"):
+        cache.get(glyph_name).skia_path
+    assert len(cache) < 5
+    # most recently used glyph is retained
+    assert "Scedilla" in cache
+
+
+def test_decomposition_cache_tracks_lazily_built_data():
+    tt = TTFont(TESTFONT_PATH_1)
+    cache = DecompositionCache(tt)
+    decomposed = cache.get("Amacron")
+    assert cache.total_bytes == BYTES_PER_ENTRY
+    decomposed.skia_path
+    decomposed.decomposed_glyph
+    assert cache.total_bytes > BYTES_PER_ENTRY
+
+
+def test_decomposition_cache_invalidated_on_table_reload():
+    tt = TTFont(TESTFONT_PATH_1)
+    cache = DecompositionCache(tt)
+    first = cache.get("A")
+    # replace the glyf table with a table reloaded from the font file
+    tt["glyf"] = TTFont(TESTFONT_PATH_1)["glyf"]
+    second = cache.get("A")
+    assert first is not second
+    assert len(cache) == 1
+
+
+def test_decomposition_cache_per_font():
+    tt1 = TTFont(TESTFONT_PATH_1)
+    tt2 = TTFont(TESTFONT_PATH_1)
+    assert decomposition_cache(tt1) is decomposition_cache(tt1)
+    assert decomposition_cache(tt1) is not decomposition_cache(tt2)
+    assert decomposed_glyph("A", tt1) is decomposed_glyph("A", tt1)
+    assert decomposed_glyph("A", tt1) is not decomposed_glyph("A", tt2)
+
+
+def test_decomposition_cache_released_with_font():
+    tt = TTFont(TESTFONT_PATH_1)
+    decomposed_glyph("Scedilla", tt).skia_path
+    assert tt in _font_caches
+    number_of_caches = len(_font_caches)
+    del tt
+    gc.collect()
+    assert len(_font_caches) == number_of_caches - 1
+
+
+def test_decomposition_cache_memoizes_components():
+    tt = TTFont(TESTFONT_PATH_1)
+    cache = DecompositionCache(tt)
+    cache.get("Amacron").skia_path
+    cache.get("Scedilla").skia_path
+    # "A", "glyph00015", "glyph00004", "glyph00016" component outlines
+    assert len(cache.converter.decomposer) == 4
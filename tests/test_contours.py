@@ -3,13 +3,20 @@ import os
 import sys
 
 import pytest
-from fontTools.ttLib import TTFont
-from pathins.contours import contours_run, number_of_contours
+from fontTools.ttLib import TTFont, newTable
+from pathins.cache import decomposed_glyph
+from pathins.contours import (
+    _component_glyph_ids,
+    contour_count,
+    contours_run,
+    number_of_contours,
+)
 import pathins.stringbuilder
 
 TESTFONT_PATH_1 = os.path.join(
     "tests", "testfiles", "fonts", "NotoSans-Regular.subset1.ttf"
 )
+TESTFONT_PATH_2 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
 
 # instantiate a parser for unit tests in this module
 parser = argparse.ArgumentParser()
@@ -40,6 +47,70 @@ def test_number_of_contours_composite():
     assert contour_number == 2
 
 
+@pytest.mark.parametrize("fontpath", [TESTFONT_PATH_1, TESTFONT_PATH_2])
+def test_contour_count(fontpath):
+    tt = TTFont(fontpath, lazy=True)
+    for glyphname in tt.getGlyphOrder():
+        # decomposed outline contour count
+        expected = decomposed_glyph(glyphname, TTFont(fontpath)).decomposed_glyph
+        assert contour_count(glyphname, tt) == expected.numberOfContours
+
+
+def test_contour_count_composite_without_decompile():
+    tt = TTFont(TESTFONT_PATH_2, lazy=True)
+    # Amacron is a composite of A (2 contours) and glyph00015 (1 contour)
+    assert contour_count("Amacron", tt) == 3
+    glyphs = tt["glyf"].glyphs
+    # raw glyf table data are not expanded
+    assert all(hasattr(glyphs[name], "data") for name in ("Amacron", "A", "glyph00015"))
+
+
+@pytest.mark.parametrize("expanded", [False, True])
+def test_contour_count_missing_component(expanded):
+    tt = TTFont(TESTFONT_PATH_2, lazy=True)
+    glyf_table = tt["glyf"]
+    if expanded:
+        glyf_table["Amacron"]
+    # Amacron is a composite of A (2 contours) and glyph00015 (1 contour)
+    del glyf_table.glyphs["glyph00015"]
+    assert contour_count("Amacron", tt) == 2
+    # missing components are skipped in decomposed outlines
+    assert decomposed_glyph("Amacron", tt).decomposed_glyph.numberOfContours == 2
+
+
+def test_contour_count_component_glyph_id_out_of_range():
+    tt = TTFont(TESTFONT_PATH_2, lazy=True)
+    glyph = tt["glyf"].glyphs["Amacron"]
+    data = bytearray(glyph.data)
+    # first component glyph ID follows the glyph header and flags
+    data[12:14] = (0xFFFF).to_bytes(2, "big")
+    glyph.data = bytes(data)
+    assert contour_count("Amacron", tt) == 1
+
+
+def test_component_glyph_ids():
+    tt = TTFont(TESTFONT_PATH_2)
+    glyf_table = tt["glyf"]
+    raw = TTFont(TESTFONT_PATH_2, lazy=True)["glyf"].glyphs
+    for glyphname in ("Amacron", "Scedilla"):
+        assert _component_glyph_ids(raw[glyphname].data) == [
+            tt.getGlyphID(component.glyphName)
+            for component in glyf_table[glyphname].components
+        ]
+
+
+def test_contour_count_new_glyf_table():
+    tt = TTFont(TESTFONT_PATH_2)
+    assert contour_count("A", tt) == 2
+    # counts are memoized per glyf table object
+    glyf_table = newTable("glyf")
+    glyf_table.glyphOrder = tt.getGlyphOrder()
+    glyf_table.glyphs = dict(tt["glyf"].glyphs)
+    glyf_table.glyphs["A"] = tt["glyf"]["C"]
+    tt["glyf"] = glyf_table
+    assert contour_count("A", tt) == 1
+
+
 def test_contours_run_error_invalid_path(capsys):
     test_path = os.path.join("bogus", "path.txt")
     args = parser.parse_args([test_path])
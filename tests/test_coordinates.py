@@ -3,7 +3,7 @@ import os
 import sys
 
 import pytest
-from pathins.coordinates import coordinates_run
+from pathins.coordinates import coordinates_report, coordinates_run
 import pathins.stringbuilder
 
 TESTFONT_PATH_1 = os.path.join(
@@ -346,3 +346,29 @@ def test_coordinates_run_multi_glyph_nocolor(capsys, monkeypatch):
 
     assert f"(203, 91) {ON_PATH}" not in captured.out
     assert "(203, 91)" in captured.out
+
+
+def test_coordinates_report_duplicate_coordinates(monkeypatch):
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", False)
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((100, 0))
+    pen.lineTo((0, 100))
+    pen.closePath()
+    # second contour start point shares the first contour
+    # end point coordinates
+    pen.moveTo((0, 100))
+    pen.lineTo((100, 0))
+    pen.lineTo((200, 200))
+    pen.closePath()
+    report = coordinates_report(pen.glyph(), None, nocolor=True)
+    assert report.splitlines() == [
+        "       (0, 0) START ~~~~~~~~",
+        "     (100, 0) ----- on -----",
+        "     (0, 100) ~~~~~~~~~~ END",
+        "     (0, 100) START ~~~~~~~~",
+        "     (100, 0) ----- on -----",
+        "   (200, 200) ~~~~~~~~~~ END",
+    ]
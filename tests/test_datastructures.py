@@ -117,3 +117,10 @@ def test_coordinate_repr_method():
         c.__repr__()
         == "Coordinate< (3,2) oncurve: True, startpoint: True, endpoint: True, implied: True >"
     )
+
+
+def test_coordinate_slots():
+    coord = Coordinate(1, 2)
+    assert not hasattr(coord, "__dict__")
+    with pytest.raises(AttributeError):
+        coord.z = 3
@@ -0,0 +1,200 @@
+import json
+import os
+
+import pytest
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables import ttProgram
+from pathins.__main__ import run
+from pathins.diff import changed_glyphs, glyph_diffs, glyph_metrics, outline_key
+import pathins.stringbuilder
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+
+
+def _edited_font(tmp_path):
+    # shift the first point of 'A', the base glyph of composite 'Amacron'
+    tt = TTFont(TESTFONT_PATH_1)
+    glyph = tt["glyf"]["A"]
+    glyph.coordinates[0] = (glyph.coordinates[0][0] + 10, glyph.coordinates[0][1])
+    path = str(tmp_path / "edited.ttf")
+    tt.save(path)
+    return path
+
+
+def _font(glyphs):
+    # glyph name : square side length, None = empty glyph
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef"] + list(glyphs))
+    fb.setupCharacterMap({})
+    glyf = {".notdef": TTGlyphPen(None).glyph()}
+    for glyph_name, size in glyphs.items():
+        pen = TTGlyphPen(None)
+        if size is not None:
+            pen.moveTo((0, 0))
+            pen.lineTo((0, size))
+            pen.lineTo((size, size))
+            pen.lineTo((size, 0))
+            pen.closePath()
+        glyf[glyph_name] = pen.glyph()
+    fb.setupGlyf(glyf)
+    fb.setupHorizontalMetrics({name: (500, 0) for name in fb.font.getGlyphOrder()})
+    fb.setupHorizontalHeader()
+    return fb.font
+
+
+def test_changed_glyphs_component_closure(tmp_path):
+    old_tt = TTFont(TESTFONT_PATH_1)
+    new_tt = TTFont(_edited_font(tmp_path))
+    assert changed_glyphs(old_tt, new_tt) == [("A", "changed"), ("Amacron", "changed")]
+    assert changed_glyphs(old_tt, TTFont(TESTFONT_PATH_1)) == []
+
+
+def test_changed_glyphs_added_removed():
+    old_tt = _font({"a": 100, "b": 100, "c": 100})
+    new_tt = _font({"a": 100, "c": 200, "d": None})
+    assert changed_glyphs(old_tt, new_tt) == [
+        ("c", "changed"),
+        ("d", "added"),
+        ("b", "removed"),
+    ]
+
+
+def _composite_font(glyph_order, transform=(1, 0, 0, 1, 0, 0)):
+    # square base glyph 'a' and composite 'b' of 'a'
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(glyph_order)
+    fb.setupCharacterMap({})
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 100))
+    pen.lineTo((100, 100))
+    pen.lineTo((100, 0))
+    pen.closePath()
+    glyf = {".notdef": TTGlyphPen(None).glyph(), "a": pen.glyph()}
+    pen = TTGlyphPen(glyf)
+    pen.addComponent("a", transform)
+    glyf["b"] = pen.glyph()
+    fb.setupGlyf(glyf)
+    fb.setupHorizontalMetrics({name: (500, 0) for name in glyph_order})
+    fb.setupHorizontalHeader()
+    return fb.font
+
+
+def test_changed_glyphs_instructions_only(tmp_path):
+    tt = TTFont(TESTFONT_PATH_1)
+    program = ttProgram.Program()
+    program.fromBytecode(b"\xb0\x00")
+    tt["glyf"]["A"].program = program
+    path = str(tmp_path / "hinted.ttf")
+    tt.save(path)
+    assert changed_glyphs(TTFont(TESTFONT_PATH_1), TTFont(path)) == []
+
+
+def test_changed_glyphs_glyph_order_only():
+    old_tt = _composite_font([".notdef", "a", "b"])
+    new_tt = _composite_font([".notdef", "b", "a"])
+    assert changed_glyphs(old_tt, new_tt) == []
+
+
+def test_changed_glyphs_component_transform():
+    old_tt = _composite_font([".notdef", "a", "b"])
+    new_tt = _composite_font([".notdef", "a", "b"], transform=(-1, 0, 0, 1, 100, 0))
+    assert changed_glyphs(old_tt, new_tt) == [("b", "changed")]
+
+
+def test_outline_key():
+    tt = _composite_font([".notdef", "a", "b"])
+    assert outline_key(tt, "a") == (
+        ((0, 0), (0, 100), (100, 100), (100, 0)),
+        (1, 1, 1, 1),
+        (3,),
+    )
+    assert outline_key(tt, "b") == (("a", 0, 0, None, None, 0, (), outline_key(tt, "a")),)
+    assert outline_key(tt, ".notdef") == ()
+
+
+def test_glyph_metrics():
+    tt = _font({"a": 100, "b": None})
+    assert glyph_metrics("a", tt, ["contours", "direction", "points", "length"]) == {
+        "contours": 1,
+        "direction": "clockwise",
+        "points": 4,
+        "length": 400.0,
+    }
+    assert glyph_metrics("b", tt, ["contours", "direction", "points", "length"]) == {
+        "contours": 0,
+        "direction": None,
+        "points": 0,
+        "length": 0.0,
+    }
+    assert glyph_metrics("a", tt, ["points"]) == {"points": 4}
+
+
+def test_glyph_diffs():
+    old_tt = _font({"a": 100, "b": 100, "c": 100})
+    new_tt = _font({"a": 100, "c": 200, "d": None})
+    records = list(glyph_diffs("", old_tt, "", new_tt, metrics=["length"]))
+    assert records == [
+        {
+            "glyph": "c",
+            "status": "changed",
+            "old": {"length": 400.0},
+            "new": {"length": 800.0},
+        },
+        {"glyph": "d", "status": "added", "old": {}, "new": {"length": 0.0}},
+        {"glyph": "b", "status": "removed", "old": {"length": 400.0}, "new": {}},
+    ]
+
+
+def test_glyph_diffs_invalid_metric():
+    tt = _font({"a": 100})
+    with pytest.raises(ValueError):
+        list(glyph_diffs("", tt, "", tt, metrics=["bogus"]))
+
+
+def test_diff_run_text(capsys, monkeypatch, tmp_path):
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", False)
+    run(["diff", TESTFONT_PATH_1, _edited_font(tmp_path)])
+    captured = capsys.readouterr()
+    assert captured.out == (
+        "[ A ]: changed\n"
+        "   length: 6565.33 -> 6572.53\n"
+        "[ Amacron ]: changed\n"
+        "   length: 8279.33 -> 8286.53\n"
+        "Summary: 2 changed, 0 added, 0 removed\n"
+    )
+
+
+def test_diff_run_ndjson(capsys, tmp_path):
+    run(
+        [
+            "diff",
+            "--format",
+            "ndjson",
+            "-a",
+            "points",
+            TESTFONT_PATH_1,
+            _edited_font(tmp_path),
+        ]
+    )
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert records == [
+        {"glyph": "A", "status": "changed", "old": {"points": 11}, "new": {"points": 11}},
+        {
+            "glyph": "Amacron",
+            "status": "changed",
+            "old": {"points": 15},
+            "new": {"points": 15},
+        },
+    ]
+
+
+def test_diff_run_invalid_path(capsys):
+    with pytest.raises(SystemExit) as e:
+        run(["diff", TESTFONT_PATH_1, os.path.join("bogus", "path.ttf")])
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "does not appear to be a file" in captured.err
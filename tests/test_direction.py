@@ -2,17 +2,30 @@ import argparse
 import os
 import sys
 
+import pathops
 import pytest
-from pathins.direction import direction_run
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables._g_l_y_f import Glyph
+from pathins.cache import decomposed_glyph, glyf_memo
+from pathins.direction import (
+    contours_signed_area,
+    direction_record,
+    direction_run,
+    glyph_signed_area,
+    native_direction,
+    skia_direction,
+)
 import pathins.stringbuilder
 
 TESTFONT_PATH_1 = os.path.join(
     "tests", "testfiles", "fonts", "NotoSans-Regular.subset1.ttf"
 )
+TESTFONT_PATH_2 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
 
 # instantiate a parser for unit tests in this module
 parser = argparse.ArgumentParser()
 parser.add_argument("--nocolor", action="store_true", help="no ANSI color")
+parser.add_argument("--engine", choices=("skia", "native"), default="skia")
 parser.add_argument("fontpath", type=str, help="font file path")
 parser.add_argument(
     "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
@@ -202,3 +215,97 @@ def test_direction_run_full_glyph_nocolor(capsys, monkeypatch):
         "          with component 'question' transform: [[-1.0, 0], [0, 1.0]]"
         in captured.out
     )
+
+
+def test_contours_signed_area_lines():
+    square = [(0, 0), (0, 100), (100, 100), (100, 0)]
+    assert contours_signed_area(square, [3], [1, 1, 1, 1]) == -10000.0
+    assert contours_signed_area(square[::-1], [3], [1, 1, 1, 1]) == 10000.0
+    # contour areas are summed
+    assert contours_signed_area(square + square[::-1], [3, 7], [1] * 8) == 0.0
+
+
+def test_contours_signed_area_quadratic_curve():
+    # parabolic segment area is 2/3 of the control point triangle
+    coordinates = [(0, 0), (50, 100), (100, 0)]
+    assert contours_signed_area(coordinates, [2], [1, 0, 1]) == pytest.approx(-10000 / 3)
+
+
+def test_contours_signed_area_implied_oncurve_points():
+    # all off-curve point contour with implied on-curve points
+    coordinates = [(0, 0), (0, 100), (100, 100), (100, 0)]
+    path = pathops.Path()
+    path.moveTo(0, 50)
+    path.quadTo(0, 100, 50, 100)
+    path.quadTo(100, 100, 100, 50)
+    path.quadTo(100, 0, 50, 0)
+    path.quadTo(0, 0, 0, 50)
+    path.close()
+    area = contours_signed_area(coordinates, [3], [0, 0, 0, 0])
+    assert area < 0
+    assert path.clockwise
+    assert abs(area) == pytest.approx(path.area)
+
+
+def test_glyph_signed_area_mirrored_component():
+    tt = TTFont(TESTFONT_PATH_1, lazy=True)
+    # uni2E2E is a mirrored composite of question
+    assert glyph_signed_area("uni2E2E", tt) == pytest.approx(
+        -glyph_signed_area("question", tt)
+    )
+    assert glyph_signed_area("space", tt) == 0.0
+
+
+def test_glyph_signed_area_parses_requested_glyphs_only():
+    tt = TTFont(TESTFONT_PATH_1, lazy=True)
+    glyf_table = tt["glyf"]
+    glyph_signed_area("question", tt)
+    # the whole font glyf table arrays are not built
+    assert glyf_memo(tt, "glyf_arrays") == {}
+    assert hasattr(glyf_table.glyphs["question"], "data")
+
+
+@pytest.mark.parametrize("fontpath", [TESTFONT_PATH_1, TESTFONT_PATH_2])
+def test_native_direction_full_glyph_set(fontpath):
+    tt = TTFont(fontpath, lazy=True)
+    tt_subset = TTFont(fontpath, lazy=True)
+    for glyphname in tt.getGlyphOrder():
+        assert native_direction(glyphname, tt, True) == native_direction(
+            glyphname, tt_subset
+        )
+    # the whole font glyf table arrays are built once
+    assert len(glyf_memo(tt, "glyf_arrays")) == 1
+    assert glyf_memo(tt_subset, "glyf_arrays") == {}
+
+
+def test_glyph_signed_area_malformed_glyph_data():
+    tt = TTFont(TESTFONT_PATH_1, lazy=True)
+    expected = glyph_signed_area("question", TTFont(TESTFONT_PATH_1, lazy=True))
+    glyf_table = tt["glyf"]
+    # truncated raw glyph data in one glyph
+    glyf_table.glyphs["A"] = Glyph(glyf_table.glyphs["A"].data[:20])
+    assert glyph_signed_area("question", tt) == expected
+    with pytest.raises(IndexError):
+        glyph_signed_area("A", tt)
+
+
+@pytest.mark.parametrize("fontpath", [TESTFONT_PATH_1, TESTFONT_PATH_2])
+def test_native_direction_skia_parity(fontpath):
+    tt = TTFont(fontpath, lazy=True)
+    for glyphname in tt.getGlyphOrder():
+        decomposed = decomposed_glyph(glyphname, tt)
+        skia_path = decomposed.skia_path
+        assert native_direction(glyphname, tt) == skia_direction(skia_path)
+        assert abs(glyph_signed_area(glyphname, tt)) == pytest.approx(skia_path.area)
+        assert direction_record(decomposed, engine="native") == direction_record(
+            decomposed, engine="skia"
+        )
+
+
+@pytest.mark.parametrize("fontpath", [TESTFONT_PATH_1, TESTFONT_PATH_2])
+def test_direction_run_engine_parity(capsys, monkeypatch, fontpath):
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", False)
+    direction_run(parser.parse_args(["--engine", "skia", fontpath]))
+    skia_output = capsys.readouterr().out
+    direction_run(parser.parse_args(["--engine", "native", fontpath]))
+    assert capsys.readouterr().out == skia_output
@@ -0,0 +1,108 @@
+import os
+from functools import partial
+
+import pytest
+from fontTools.ttLib import TTFont
+from pathins.__main__ import run
+from pathins.contours import contours_glyph_report
+from pathins.diskcache import (
+    DiskCache,
+    cached_results,
+    function_key,
+    glyph_digest,
+    result_key,
+)
+from pathins.engine import glyph_map
+import pathins.stringbuilder
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+
+
+def test_disk_cache_get_set(tmp_path):
+    path = str(tmp_path / "cache.db")
+    with DiskCache(path) as cache:
+        cache.set("a", {"b": [1, 2.5, "c"]})
+        assert cache.get("a") == {"b": [1, 2.5, "c"]}
+        assert cache.existing_keys(["a", "z"]) == {"a"}
+        with pytest.raises(KeyError):
+            cache.get("z")
+    # results persist across connections
+    with DiskCache(path) as cache:
+        assert cache.get("a") == {"b": [1, 2.5, "c"]}
+
+
+def test_function_key():
+    report = partial(contours_glyph_report, nocolor=True)
+    assert function_key(report) == [
+        "pathins.contours.contours_glyph_report",
+        [],
+        {"nocolor": "True"},
+    ]
+    assert function_key(report) != function_key(
+        partial(contours_glyph_report, nocolor=False)
+    )
+
+
+def test_glyph_digest_unchanged_glyph():
+    tt1 = TTFont(TESTFONT_PATH_1, lazy=True)
+    tt2 = TTFont(TESTFONT_PATH_1)
+    # expanded glyphs are compiled to glyf table bytes
+    tt2["glyf"]["A"].expand(tt2["glyf"])
+    assert glyph_digest(tt1, "A") == glyph_digest(tt2, "A")
+    assert glyph_digest(tt1, "A") != glyph_digest(tt1, "B")
+
+
+def test_glyph_digest_edited_component():
+    tt1 = TTFont(TESTFONT_PATH_1)
+    tt2 = TTFont(TESTFONT_PATH_1)
+    glyf_table = tt2["glyf"]
+    glyph = glyf_table["A"]
+    glyph.coordinates[0] = (glyph.coordinates[0][0] + 10, glyph.coordinates[0][1])
+    assert glyph_digest(tt1, "A") != glyph_digest(tt2, "A")
+    # composite glyph digests include the component closure
+    assert glyph_digest(tt1, "Amacron") != glyph_digest(tt2, "Amacron")
+    assert glyph_digest(tt1, "Scedilla") == glyph_digest(tt2, "Scedilla")
+
+
+def test_result_key_color_state(monkeypatch):
+    tt = TTFont(TESTFONT_PATH_1)
+    report = partial(contours_glyph_report, nocolor=False)
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", False)
+    key1 = result_key(report, tt, "A")
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", True)
+    key2 = result_key(report, tt, "A")
+    assert key1 != key2
+
+
+def test_cached_results_computes_missing_glyphs(tmp_path):
+    path = str(tmp_path / "cache.db")
+    tt = TTFont(TESTFONT_PATH_1)
+    report = partial(contours_glyph_report, nocolor=True)
+    glyph_names = tt.getGlyphOrder()
+    requests = []
+
+    def compute(names):
+        requests.append(list(names))
+        return glyph_map(report, TESTFONT_PATH_1, tt, names)
+
+    expected = [report(glyph_name, tt) for glyph_name in glyph_names]
+    with DiskCache(path) as cache:
+        assert list(cached_results(cache, report, tt, glyph_names[:3], compute)) == (
+            expected[:3]
+        )
+    with DiskCache(path) as cache:
+        assert list(cached_results(cache, report, tt, glyph_names, compute)) == expected
+    assert requests == [glyph_names[:3], glyph_names[3:]]
+
+
+def test_run_cache(capsys, tmp_path):
+    path = str(tmp_path / "cache.db")
+    run(["report", "--nocolor", TESTFONT_PATH_1])
+    expected = capsys.readouterr().out
+    for _ in range(2):
+        run(["report", "--nocolor", "--cache", path, TESTFONT_PATH_1])
+        assert capsys.readouterr().out == expected
+    with DiskCache(path) as cache:
+        assert cache.connection.execute("SELECT COUNT(*) FROM results").fetchone() == (
+            len(TTFont(TESTFONT_PATH_1).getGlyphOrder()),
+        )
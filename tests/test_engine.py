@@ -0,0 +1,78 @@
+import argparse
+import os
+from functools import partial
+
+import pytest
+from fontTools.ttLib import TTFont
+from pathins.contours import contours_glyph_report
+from pathins.engine import glyph_map, glyph_search, jobs_count
+from pathins.segments import segments_run
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+
+# instantiate a parser for unit tests in this module
+parser = argparse.ArgumentParser()
+parser.add_argument("--nocolor", action="store_true", help="no ANSI color")
+parser.add_argument("--jobs", type=int, default=1, help="number of worker processes")
+parser.add_argument("fontpath", type=str, help="font file path")
+parser.add_argument(
+    "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
+)
+
+
+def test_jobs_count():
+    assert jobs_count(None) == 1
+    assert jobs_count(1) == 1
+    assert jobs_count(4) == 4
+    assert jobs_count(0) == (os.cpu_count() or 1)
+    assert jobs_count(-1) == (os.cpu_count() or 1)
+
+
+def test_glyph_map_serial():
+    tt = TTFont(TESTFONT_PATH_1)
+    glyph_names = tt.getGlyphOrder()
+    func = partial(contours_glyph_report, nocolor=True)
+    results = list(glyph_map(func, TESTFONT_PATH_1, tt, glyph_names, jobs=1))
+    assert len(results) == len(glyph_names)
+    assert results[0] == "[ .notdef ]: 0"
+    assert results[2] == "[ B ]: 3"
+
+
+def test_glyph_map_parallel_matches_serial():
+    tt = TTFont(TESTFONT_PATH_1)
+    glyph_names = tt.getGlyphOrder()
+    func = partial(contours_glyph_report, nocolor=True)
+    serial = list(glyph_map(func, TESTFONT_PATH_1, tt, glyph_names, jobs=1))
+    parallel = list(glyph_map(func, TESTFONT_PATH_1, tt, glyph_names, jobs=3))
+    assert parallel == serial
+
+
+def test_glyph_map_empty_glyph_names():
+    tt = TTFont(TESTFONT_PATH_1)
+    func = partial(contours_glyph_report, nocolor=True)
+    assert list(glyph_map(func, TESTFONT_PATH_1, tt, [], jobs=4)) == []
+
+
+@pytest.mark.parametrize("jobs", ["2", "0"])
+def test_segments_run_parallel_output_matches_serial(capsys, jobs):
+    segments_run(parser.parse_args(["--nocolor", TESTFONT_PATH_1]))
+    serial = capsys.readouterr().out
+
+    segments_run(parser.parse_args(["--nocolor", "--jobs", jobs, TESTFONT_PATH_1]))
+    parallel = capsys.readouterr().out
+    assert parallel == serial
+
+
+def _is_glyph(glyph_name, tt, target):
+    return glyph_name == target
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 3])
+def test_glyph_search(jobs):
+    tt = TTFont(TESTFONT_PATH_1)
+    glyph_names = tt.getGlyphOrder()
+    search = partial(_is_glyph, target="Scedilla")
+    assert glyph_search(search, TESTFONT_PATH_1, tt, glyph_names, jobs=jobs) == "Scedilla"
+    search = partial(_is_glyph, target="bogus")
+    assert glyph_search(search, TESTFONT_PATH_1, tt, glyph_names, jobs=jobs) is None
+    assert glyph_search(search, TESTFONT_PATH_1, tt, [], jobs=jobs) is None
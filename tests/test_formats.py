@@ -0,0 +1,314 @@
+import csv
+import io
+import json
+import math
+import os
+
+import pytest
+from fontTools.ttLib import TTFont
+from pathins.__main__ import run
+from pathins.contours import contours_record
+from pathins.coordinates import COORDINATES_COLUMNS, coordinates_record, coordinates_rows
+from pathins.direction import direction_record
+from pathins.formats import (
+    glyph_record,
+    glyph_rows,
+    write_glyph_records,
+    write_glyph_rows,
+    write_records,
+)
+from pathins.path import path_record
+from pathins.segments import segments_record, segments_rows
+from pathins.writer import ReportWriter
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+TESTFONT_PATH_2 = os.path.join(
+    "tests", "testfiles", "fonts", "NotoSans-Regular.subset1.ttf"
+)
+
+
+def test_write_records_ndjson():
+    sink = io.StringIO()
+    with ReportWriter(sink) as writer:
+        write_records(writer, iter([{"a": 1}, {"b": [1, 2]}]), "ndjson")
+    assert sink.getvalue() == '{"a": 1}\n{"b": [1, 2]}\n'
+
+
+def test_write_records_json():
+    sink = io.StringIO()
+    with ReportWriter(sink) as writer:
+        write_records(writer, iter([{"a": 1}, {"b": [1, 2]}]), "json")
+    assert sink.getvalue() == '[\n{"a": 1},\n{"b": [1, 2]}\n]\n'
+    assert json.loads(sink.getvalue()) == [{"a": 1}, {"b": [1, 2]}]
+
+
+def test_write_records_json_empty():
+    sink = io.StringIO()
+    with ReportWriter(sink) as writer:
+        write_records(writer, iter([]), "json")
+    assert json.loads(sink.getvalue()) == []
+
+
+def test_write_records_invalid_format():
+    with pytest.raises(ValueError):
+        write_records(ReportWriter(io.StringIO()), iter([]), "bogus")
+
+
+def test_glyph_record():
+    tt = TTFont(TESTFONT_PATH_2)
+    record = glyph_record(
+        "comma", tt, [contours_record, direction_record], fontpath=TESTFONT_PATH_2
+    )
+    assert record == {
+        "font": TESTFONT_PATH_2,
+        "glyph": "comma",
+        "contours": 1,
+        "direction": "clockwise",
+        "transformed_components": [],
+    }
+
+
+def test_glyph_record_no_contours():
+    tt = TTFont(TESTFONT_PATH_2)
+    record = glyph_record(
+        "space",
+        tt,
+        [
+            contours_record,
+            direction_record,
+            coordinates_record,
+            path_record,
+            segments_record,
+        ],
+        fontpath=TESTFONT_PATH_2,
+    )
+    assert record["contours"] == 0
+    assert record["direction"] is None
+    assert record["coordinates"] == []
+    assert record["path"] == []
+    assert record["segments"] == []
+    assert record["total_length"] == 0.0
+
+
+def test_glyph_record_coordinates_and_segments():
+    tt = TTFont(TESTFONT_PATH_2)
+    record = glyph_record(
+        "comma", tt, [coordinates_record, path_record, segments_record], fontpath=""
+    )
+    assert record["coordinates"][0] == {
+        "x": 185,
+        "y": 116,
+        "oncurve": True,
+        "startpoint": True,
+        "endpoint": False,
+    }
+    assert record["coordinates"][-1]["endpoint"] is True
+    assert record["path"][0] == {"operation": "moveTo", "points": [[185.0, 116.0]]}
+    assert record["path"][-1] == {"operation": "closePath", "points": []}
+    assert record["segments"][0] == {
+        "type": "line",
+        "points": [[185, 116], [192, 105]],
+        "length": pytest.approx(13.04, abs=0.01),
+    }
+    assert {segment["type"] for segment in record["segments"]} == {"line", "qcurve"}
+    assert record["total_length"] == pytest.approx(
+        sum(segment["length"] for segment in record["segments"])
+    )
+
+
+def test_glyph_record_transformed_components():
+    tt = TTFont(TESTFONT_PATH_2)
+    record = glyph_record("uni2E2E", tt, [direction_record], fontpath="")
+    assert record["transformed_components"] == [
+        {"glyph": "question", "transform": [[-1.0, 0], [0, 1.0]]}
+    ]
+
+
+def test_write_glyph_records_full_glyph_set():
+    tt = TTFont(TESTFONT_PATH_1)
+    sink = io.StringIO()
+    with ReportWriter(sink) as writer:
+        write_glyph_records(
+            writer, TESTFONT_PATH_1, tt, None, [contours_record], "ndjson", jobs=2
+        )
+    records = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [record["glyph"] for record in records] == tt.getGlyphOrder()
+
+
+def test_write_glyph_records_glyph_names():
+    tt = TTFont(TESTFONT_PATH_1)
+    sink = io.StringIO()
+    with ReportWriter(sink) as writer:
+        write_glyph_records(
+            writer, TESTFONT_PATH_1, tt, ["zero", "A"], [contours_record], "ndjson"
+        )
+    records = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [record["glyph"] for record in records] == ["zero", "A"]
+
+
+def test_write_glyph_records_invalid_glyphname(capsys):
+    tt = TTFont(TESTFONT_PATH_1)
+    with pytest.raises(SystemExit) as e:
+        write_glyph_records(
+            ReportWriter(), TESTFONT_PATH_1, tt, "bogus", [contours_record], "json"
+        )
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "Failed to open glyph" in captured.err
+
+
+@pytest.mark.parametrize(
+    "subcommand", ["contours", "coordinates", "direction", "path", "report", "segments"]
+)
+def test_run_format_ndjson(capsys, subcommand):
+    run([subcommand, "--format", "ndjson", TESTFONT_PATH_1, "A"])
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert len(records) == 1
+    assert records[0]["font"] == TESTFONT_PATH_1
+    assert records[0]["glyph"] == "A"
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_run_format_json_batch(capsys, jobs):
+    run(
+        [
+            "contours",
+            "--format",
+            "json",
+            "--jobs",
+            jobs,
+            TESTFONT_PATH_1,
+            TESTFONT_PATH_2,
+            "A",
+        ]
+    )
+    captured = capsys.readouterr()
+    # one JSON array with the records of all fonts, no text section headers
+    records = json.loads(captured.out)
+    assert [(record["font"], record["glyph"]) for record in records] == [
+        (TESTFONT_PATH_1, "A"),
+        (TESTFONT_PATH_2, "A"),
+    ]
+    assert "Summary: 2 fonts" in captured.err
+
+
+def test_run_format_json_batch_with_failure(capsys):
+    with pytest.raises(SystemExit) as e:
+        run(["contours", "--format", "json", TESTFONT_PATH_1, TESTFONT_PATH_2, "Amacron"])
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    records = json.loads(captured.out)
+    assert [(record["font"], record["contours"]) for record in records] == [
+        (TESTFONT_PATH_1, 3)
+    ]
+    assert "Summary: 2 fonts, 1 ok, 1 failed" in captured.err
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_run_format_csv_batch(capsys, jobs):
+    run(
+        [
+            "coordinates",
+            "--format",
+            "csv",
+            "--jobs",
+            jobs,
+            TESTFONT_PATH_1,
+            TESTFONT_PATH_2,
+            "comma",
+        ]
+    )
+    captured = capsys.readouterr()
+    # one table with a single header row for all fonts
+    rows = list(csv.reader(io.StringIO(captured.out)))
+    assert rows[0] == list(COORDINATES_COLUMNS)
+    assert rows.count(list(COORDINATES_COLUMNS)) == 1
+    number_of_rows = [
+        len(TTFont(fontpath)["glyf"]["comma"].coordinates)
+        for fontpath in (TESTFONT_PATH_1, TESTFONT_PATH_2)
+    ]
+    assert [row[0] for row in rows[1:]] == (
+        [TESTFONT_PATH_1] * number_of_rows[0] + [TESTFONT_PATH_2] * number_of_rows[1]
+    )
+    assert "Summary: 2 fonts" in captured.err
+
+
+def test_run_format_csv_batch_with_failure(capsys):
+    with pytest.raises(SystemExit) as e:
+        run(["segments", "--format", "csv", TESTFONT_PATH_2, TESTFONT_PATH_1, "Amacron"])
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    # the header row is written by the first font with output
+    rows = list(csv.DictReader(io.StringIO(captured.out)))
+    assert len(rows) > 0
+    assert all(row["font"] == TESTFONT_PATH_1 for row in rows)
+    assert "Summary: 2 fonts, 1 ok, 1 failed" in captured.err
+
+
+def test_run_format_csv_coordinates(capsys):
+    run(["coordinates", "--format", "csv", TESTFONT_PATH_2, "comma"])
+    captured = capsys.readouterr()
+    rows = list(csv.reader(io.StringIO(captured.out)))
+    assert rows[0] == list(COORDINATES_COLUMNS)
+    assert rows[1] == [TESTFONT_PATH_2, "comma", "0", "0", "185", "116", "1", "1", "0"]
+    tt = TTFont(TESTFONT_PATH_2)
+    assert len(rows) == len(tt["glyf"]["comma"].coordinates) + 1
+    assert rows[-1][-1] == "1"
+
+
+def test_run_format_csv_segments(capsys):
+    run(["segments", "--format", "csv", TESTFONT_PATH_2, "comma"])
+    captured = capsys.readouterr()
+    rows = list(csv.DictReader(io.StringIO(captured.out)))
+    assert rows[0] == {
+        "font": TESTFONT_PATH_2,
+        "glyph": "comma",
+        "contour": "0",
+        "segment": "0",
+        "type": "line",
+        "start_x": "185",
+        "start_y": "116",
+        "control_x": "",
+        "control_y": "",
+        "end_x": "192",
+        "end_y": "105",
+        "start_implied": "0",
+        "end_implied": "0",
+        "length": str(math.sqrt(7**2 + 11**2)),
+    }
+    assert rows[1]["type"] == "qcurve"
+    assert rows[1]["end_implied"] == "1"
+    record = glyph_record("comma", TTFont(TESTFONT_PATH_2), [segments_record], "")
+    assert [float(row["length"]) for row in rows] == [
+        segment["length"] for segment in record["segments"]
+    ]
+
+
+def test_segments_rows_contour_index():
+    tt = TTFont(TESTFONT_PATH_1)
+    # RobotoMono 'A' has two contours
+    rows = glyph_rows("A", tt, segments_rows, fontpath="")
+    assert {row[2] for row in rows} == {0, 1}
+    assert [row[3] for row in rows] == list(range(len(rows)))
+
+
+def test_write_glyph_rows_full_glyph_set():
+    tt = TTFont(TESTFONT_PATH_1)
+    sink = io.StringIO()
+    with ReportWriter(sink) as writer:
+        write_glyph_rows(
+            writer,
+            TESTFONT_PATH_1,
+            tt,
+            None,
+            COORDINATES_COLUMNS,
+            coordinates_rows,
+            jobs=2,
+        )
+    rows = list(csv.reader(io.StringIO(sink.getvalue())))
+    glyph_order = tt.getGlyphOrder()
+    assert rows[0] == list(COORDINATES_COLUMNS)
+    assert [row[1] for row in rows[1:]] == sorted(
+        (row[1] for row in rows[1:]), key=glyph_order.index
+    )
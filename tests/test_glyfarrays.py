@@ -0,0 +1,156 @@
+import os
+import struct
+
+import pytest
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+from pathins.glyfarrays import (
+    GlyfArrays,
+    _loca_offsets,
+    glyf_arrays,
+    parse_glyph_points,
+)
+from pathins.utils import open_font
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+TESTFONT_PATH_2 = os.path.join(
+    "tests", "testfiles", "fonts", "NotoSans-Regular.subset1.ttf"
+)
+
+
+def _assert_fonttools_parity(tt, arrays):
+    glyf_table = tt["glyf"]
+    assert len(arrays) == len(tt.getGlyphOrder())
+    for glyph_id, glyph_name in enumerate(tt.getGlyphOrder()):
+        glyph = glyf_table[glyph_name]
+        coordinates, end_points, flags = arrays.glyph_points(glyph_id)
+        assert arrays.number_of_contours[glyph_id] == glyph.numberOfContours
+        if glyph.numberOfContours > 0:
+            assert list(coordinates) == [
+                value for coordinate in glyph.coordinates for value in coordinate
+            ]
+            assert end_points == list(glyph.endPtsOfContours)
+            assert list(flags) == [flag & 0x41 for flag in glyph.flags]
+        else:
+            assert len(coordinates) == 0
+            assert end_points == []
+            assert len(flags) == 0
+
+
+@pytest.mark.parametrize("fontpath", [TESTFONT_PATH_1, TESTFONT_PATH_2])
+def test_glyf_arrays_fonttools_parity(fontpath):
+    tt = open_font(fontpath)
+    _assert_fonttools_parity(tt, glyf_arrays(tt))
+
+
+def test_glyf_arrays_offsets():
+    tt = open_font(TESTFONT_PATH_1)
+    arrays = glyf_arrays(tt)
+    assert len(arrays.point_offsets) == len(arrays) + 1
+    assert len(arrays.contour_offsets) == len(arrays) + 1
+    assert arrays.point_offsets[-1] == len(arrays.flags)
+    assert len(arrays.coordinates) == 2 * len(arrays.flags)
+    assert arrays.contour_offsets[-1] == len(arrays.end_points)
+
+
+def test_glyf_arrays_composite_glyphs_have_no_points():
+    tt = open_font(TESTFONT_PATH_1)
+    arrays = glyf_arrays(tt)
+    glyph_id = tt.getGlyphID("Scedilla")
+    assert arrays.number_of_contours[glyph_id] == -1
+    assert arrays.point_offsets[glyph_id] == arrays.point_offsets[glyph_id + 1]
+
+
+def test_glyf_arrays_memoized_per_glyf_table():
+    tt = open_font(TESTFONT_PATH_1)
+    arrays = glyf_arrays(tt)
+    assert glyf_arrays(tt) is arrays
+    # replace the glyf table with a table reloaded from the font file
+    tt["glyf"] = TTFont(TESTFONT_PATH_1)["glyf"]
+    assert glyf_arrays(tt) is not arrays
+
+
+def test_glyf_arrays_in_memory_font():
+    # fonts without a file reader compile the table data
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef", "a"])
+    fb.setupCharacterMap({})
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 300))
+    pen.qCurveTo((150, 450), (300, 300))
+    pen.lineTo((-300, 0))
+    pen.closePath()
+    fb.setupGlyf({".notdef": TTGlyphPen(None).glyph(), "a": pen.glyph()})
+    fb.setupHorizontalMetrics({".notdef": (500, 0), "a": (500, -300)})
+    fb.setupHorizontalHeader()
+    arrays = glyf_arrays(fb.font)
+    coordinates, end_points, flags = arrays.glyph_points(1)
+    assert list(coordinates) == [0, 0, 0, 300, 150, 450, 300, 300, -300, 0]
+    assert end_points == [4]
+    assert list(flags) == [1, 1, 0, 1, 1]
+
+
+class _LongLocaFont(object):
+    # font stub with long loca offsets for the test font data
+    def __init__(self, tt):
+        self.tt = tt
+        offsets = tt["loca"].locations
+        self.reader = {
+            "loca": struct.pack(f">{len(offsets)}L", *offsets),
+            "glyf": tt.reader["glyf"],
+        }
+
+    def __getitem__(self, tag):
+        if tag == "head":
+            head = self.tt["head"]
+            head.indexToLocFormat = 1
+            return head
+        return self.tt[tag]
+
+
+def test_loca_offsets_long_format():
+    tt = TTFont(TESTFONT_PATH_2)
+    expected = list(tt["loca"].locations)
+    assert list(_loca_offsets(tt)) == expected
+    assert list(_loca_offsets(_LongLocaFont(tt))) == expected
+
+
+def test_glyf_arrays_truncated_glyph_data():
+    tt = TTFont(TESTFONT_PATH_2)
+    data = tt.reader["glyf"]
+    loca = tt["loca"].locations
+    glyph_id = tt.getGlyphID("A")
+    start = loca[glyph_id]
+    stop = loca[glyph_id + 1]
+    # truncated glyph data of the first of two glyphs
+    glyph_data = data[start:stop]
+    arrays = GlyfArrays(
+        [0, 20, 20 + len(glyph_data)], data[start : start + 20] + glyph_data
+    )
+    assert arrays.malformed == {0}
+    assert len(arrays.glyph_points(0)[0]) == 0
+    assert arrays.glyph_points(1) == parse_glyph_points(glyph_data)
+
+
+def test_parse_glyph_points():
+    tt = TTFont(TESTFONT_PATH_2)
+    arrays = glyf_arrays(tt)
+    data = tt.reader["glyf"]
+    loca = tt["loca"].locations
+    for glyph_id in range(len(arrays)):
+        start = loca[glyph_id]
+        stop = loca[glyph_id + 1]
+        assert parse_glyph_points(data[start:stop]) == arrays.glyph_points(glyph_id)
+        assert parse_glyph_points(data, start, stop) == arrays.glyph_points(glyph_id)
+
+
+def test_parse_glyph_points_truncated_glyph_data():
+    tt = TTFont(TESTFONT_PATH_2)
+    data = tt.reader["glyf"]
+    start = tt["loca"].locations[tt.getGlyphID("A")]
+    with pytest.raises(ValueError):
+        parse_glyph_points(data[start : start + 20])
+    with pytest.raises(ValueError):
+        parse_glyph_points(data, start, start + 20)
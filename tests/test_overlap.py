@@ -0,0 +1,208 @@
+import argparse
+import json
+import os
+
+import pathops
+import pytest
+from fontTools.ttLib import TTFont
+from pathins.__main__ import run
+import pathins.overlap
+from pathins.overlap import (
+    _may_overlap,
+    _probable_first,
+    font_has_overlap,
+    glyph_has_overlap,
+    has_overlap,
+    overlap_run,
+)
+import pathins.stringbuilder
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+TESTFONT_PATH_2 = os.path.join(
+    "tests", "testfiles", "fonts", "NotoSans-Regular.subset1.ttf"
+)
+
+# instantiate a parser for unit tests in this module
+parser = argparse.ArgumentParser()
+parser.add_argument("--check", action="store_true", help="quick check")
+parser.add_argument("--nocolor", action="store_true", help="no ANSI color")
+parser.add_argument("--jobs", type=int, default=1, help="number of worker processes")
+parser.add_argument("fontpath", type=str, help="font file path")
+parser.add_argument(
+    "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
+)
+
+
+def _path(*rectangles):
+    # rectangles are (x, y, width, height, clockwise) tuples
+    path = pathops.Path()
+    for x, y, width, height, clockwise in rectangles:
+        points = [(x, y), (x, y + height), (x + width, y + height), (x + width, y)]
+        if not clockwise:
+            points.reverse()
+        path.moveTo(*points[0])
+        for point in points[1:]:
+            path.lineTo(*point)
+        path.close()
+    return path
+
+
+def test_has_overlap_no_contours():
+    assert has_overlap(pathops.Path()) is False
+
+
+def test_has_overlap_disjoint_contours():
+    assert has_overlap(_path((0, 0, 100, 100, True), (200, 0, 100, 100, True))) is False
+
+
+def test_has_overlap_counter():
+    # outer contour with a reversed inner contour
+    assert (
+        has_overlap(_path((0, 0, 300, 300, True), (100, 100, 100, 100, False))) is False
+    )
+
+
+def test_has_overlap_overlapping_contours():
+    assert has_overlap(_path((0, 0, 100, 100, True), (50, 50, 100, 100, True))) is True
+
+
+def test_has_overlap_contour_order():
+    # pathops.simplify re-orders disjoint contours
+    path = _path((200, 0, 100, 100, True), (0, 0, 100, 100, True))
+    assert path != pathops.simplify(path, clockwise=path.clockwise)
+    assert has_overlap(path) is False
+
+
+def test_has_overlap_self_intersecting_contour():
+    path = pathops.Path()
+    path.moveTo(0, 0)
+    path.lineTo(100, 100)
+    path.lineTo(100, 0)
+    path.lineTo(0, 100)
+    path.close()
+    assert has_overlap(path) is True
+
+
+def test_has_overlap_disjoint_convex_contours_skip_simplify(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("pathops.simplify called")
+
+    monkeypatch.setattr(pathins.overlap.pathops, "simplify", fail)
+    path = _path((0, 0, 100, 100, True), (200, 0, 100, 100, False))
+    assert has_overlap(path) is False
+
+
+def test_may_overlap():
+    # disjoint convex contours
+    path = _path((0, 0, 100, 100, True), (0, 200, 100, 100, True))
+    assert _may_overlap(list(path.contours)) is False
+    # intersecting contour bounding boxes
+    path = _path((0, 0, 300, 300, True), (100, 100, 100, 100, False))
+    assert _may_overlap(list(path.contours)) is True
+    # concave contour
+    path = pathops.Path()
+    path.moveTo(0, 0)
+    path.lineTo(0, 100)
+    path.lineTo(50, 50)
+    path.lineTo(100, 100)
+    path.lineTo(100, 0)
+    path.close()
+    assert _may_overlap(list(path.contours)) is True
+
+
+def test_glyph_has_overlap():
+    tt = TTFont(TESTFONT_PATH_1)
+    # Scedilla has overlapping S and cedilla component contours
+    assert glyph_has_overlap("Scedilla", tt) is True
+    # zero simplifies to a path with different start points
+    assert glyph_has_overlap("zero", tt) is False
+    assert glyph_has_overlap(".notdef", tt) is False
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_font_has_overlap(jobs):
+    tt1 = TTFont(TESTFONT_PATH_1)
+    assert font_has_overlap(TESTFONT_PATH_1, tt1, tt1.getGlyphOrder(), jobs=jobs) is True
+    tt2 = TTFont(TESTFONT_PATH_2)
+    assert font_has_overlap(TESTFONT_PATH_2, tt2, tt2.getGlyphOrder(), jobs=jobs) is False
+
+
+def test_probable_first():
+    assert _probable_first(["a", "A", "b", "Q"]) == ["Q", "A", "a", "b"]
+
+
+def test_overlap_run_full_glyph_set(capsys, monkeypatch):
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", False)
+    overlap_run(parser.parse_args([TESTFONT_PATH_1]))
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+    assert len(lines) == len(TTFont(TESTFONT_PATH_1).getGlyphOrder())
+    assert "[ Scedilla ]: Yes" in lines
+    assert "[ zero ]: No" in lines
+
+
+def test_overlap_run_single_glyph(capsys, monkeypatch):
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", False)
+    overlap_run(parser.parse_args([TESTFONT_PATH_1, "Amacron"]))
+    captured = capsys.readouterr()
+    assert captured.out == "[ Amacron ]: No\n"
+
+
+def test_overlap_run_fail_invalid_glyphname(capsys):
+    with pytest.raises(SystemExit) as e:
+        overlap_run(parser.parse_args([TESTFONT_PATH_1, "bogus"]))
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "Failed to open glyph" in captured.err
+
+
+@pytest.mark.parametrize("jobs", ["1", "3"])
+def test_overlap_run_check(capsys, jobs):
+    with pytest.raises(SystemExit) as e:
+        overlap_run(parser.parse_args(["--check", "--jobs", jobs, TESTFONT_PATH_1]))
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert captured.out == f"{TESTFONT_PATH_1}: overlapping paths are present\n"
+
+    with pytest.raises(SystemExit) as e:
+        overlap_run(parser.parse_args(["--check", "--jobs", jobs, TESTFONT_PATH_2]))
+    captured = capsys.readouterr()
+    assert e.value.code == 0
+    assert captured.out == f"{TESTFONT_PATH_2}: no overlapping paths\n"
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson"])
+def test_run_overlap_check_machine_readable(capsys, output_format):
+    with pytest.raises(SystemExit) as e:
+        run(["overlap", "--check", "--format", output_format, TESTFONT_PATH_1])
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    records = json.loads(captured.out)
+    if output_format == "ndjson":
+        records = [records]
+    assert records == [{"font": TESTFONT_PATH_1, "overlap": True}]
+
+    with pytest.raises(SystemExit) as e:
+        run(["overlap", "--check", "--format", output_format, TESTFONT_PATH_2])
+    captured = capsys.readouterr()
+    assert e.value.code == 0
+    records = json.loads(captured.out)
+    if output_format == "ndjson":
+        records = [records]
+    assert records == [{"font": TESTFONT_PATH_2, "overlap": False}]
+
+
+def test_overlap_run_check_single_glyph(capsys):
+    with pytest.raises(SystemExit) as e:
+        overlap_run(parser.parse_args(["--check", TESTFONT_PATH_1, "Amacron"]))
+    assert e.value.code == 0
+
+
+def test_run_overlap_ndjson(capsys):
+    run(["overlap", "--format", "ndjson", TESTFONT_PATH_1, "Scedilla"])
+    captured = capsys.readouterr()
+    assert json.loads(captured.out) == {
+        "font": TESTFONT_PATH_1,
+        "glyph": "Scedilla",
+        "overlap": True,
+    }
@@ -0,0 +1,156 @@
+import argparse
+import os
+
+import pytest
+from fontTools.ttLib import TTFont
+from pathins.__main__ import run
+from pathins.report import ANALYSES, glyph_records, glyph_reports, report_run
+import pathins.stringbuilder
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+
+# instantiate a parser for unit tests in this module
+parser = argparse.ArgumentParser()
+parser.add_argument("--nocolor", action="store_true", help="no ANSI color")
+parser.add_argument("-a", "--analysis", action="append", choices=list(ANALYSES))
+parser.add_argument("fontpath", type=str, help="font file path")
+parser.add_argument(
+    "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
+)
+
+
+def test_report_run_error_invalid_path(capsys):
+    args = parser.parse_args([os.path.join("bogus", "path.txt")])
+
+    with pytest.raises(SystemExit) as e:
+        report_run(args)
+
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "does not appear to be a file" in captured.err
+
+
+def test_report_run_fail_invalid_glyphname(capsys):
+    args = parser.parse_args([TESTFONT_PATH_1, "bogus"])
+
+    with pytest.raises(SystemExit) as e:
+        report_run(args)
+
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "Failed to open glyph" in captured.err
+
+
+def test_report_run_single_glyph_all_analyses_nocolor(capsys):
+    args = parser.parse_args(["--nocolor", TESTFONT_PATH_1, "Scedilla"])
+    report_run(args)
+
+    captured = capsys.readouterr()
+    assert "'Scedilla' report" in captured.out
+    assert "contours: 2" in captured.out
+    assert "direction: counter-clockwise" in captured.out
+    assert "coordinates:" in captured.out
+    assert "START ~~~~~~~~" in captured.out
+    assert "path:" in captured.out
+    assert "path.moveTo(936, 368)" in captured.out
+    assert "segments:" in captured.out
+    assert "Total: " in captured.out
+    # sections are reported in a fixed order
+    assert captured.out.index("contours:") < captured.out.index("segments:")
+
+
+def test_report_run_single_glyph_selected_analyses_default(capsys, monkeypatch):
+    def mock_isatty():
+        return True
+
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", mock_isatty)
+
+    args = parser.parse_args(["-a", "direction", "-a", "contours", TESTFONT_PATH_1, "A"])
+    report_run(args)
+
+    captured = capsys.readouterr()
+    assert "\x1b[1;96m'A' report\x1b[0m" in captured.out
+    assert "\x1b[1mcontours\x1b[0m: 2" in captured.out
+    assert "\x1b[1mdirection\x1b[0m: counter-clockwise" in captured.out
+    assert "coordinates" not in captured.out
+    assert "segments" not in captured.out
+
+
+def test_report_run_no_contours_nocolor(capsys):
+    args = parser.parse_args(["--nocolor", TESTFONT_PATH_1, ".notdef"])
+    report_run(args)
+
+    captured = capsys.readouterr()
+    assert "contours: 0" in captured.out
+    assert "direction: no contours" in captured.out
+    assert "coordinates: No contours" in captured.out
+    assert "path: No contours" in captured.out
+    assert "segments: No contours" in captured.out
+
+
+def test_report_run_full_glyph_set_nocolor(capsys):
+    args = parser.parse_args(["--nocolor", "-a", "contours", TESTFONT_PATH_1])
+    report_run(args)
+
+    captured = capsys.readouterr()
+    tt = TTFont(TESTFONT_PATH_1)
+    for glyph_name in tt.getGlyphOrder():
+        assert f"'{glyph_name}' report" in captured.out
+    assert "contours: 3" in captured.out
+
+
+def test_run_report_subcmd_alias(capsys):
+    run(["all", "--nocolor", "-a", "contours", TESTFONT_PATH_1, "B"])
+
+    captured = capsys.readouterr()
+    assert "'B' report" in captured.out
+    assert "contours: 3" in captured.out
+
+
+def test_glyph_reports_library_api():
+    tt = TTFont(TESTFONT_PATH_1)
+    reports = list(
+        glyph_reports(tt, analyses=["contours", "segments"], glyph_names=["A", "B"])
+    )
+    assert len(reports) == 2
+    assert "'A' report" in reports[0]
+    assert "contours: 2" in reports[0]
+    assert "LINE 394.15 units" in reports[0]
+    assert "'B' report" in reports[1]
+    assert "direction" not in reports[1]
+
+
+def test_glyph_reports_library_api_full_glyph_set():
+    tt = TTFont(TESTFONT_PATH_1)
+    reports = list(glyph_reports(tt, analyses=["contours"]))
+    assert len(reports) == len(tt.getGlyphOrder())
+
+
+def test_glyph_reports_library_api_invalid_analysis():
+    tt = TTFont(TESTFONT_PATH_1)
+    with pytest.raises(ValueError):
+        list(glyph_reports(tt, analyses=["bogus"]))
+
+
+def test_glyph_records_library_api():
+    tt = TTFont(TESTFONT_PATH_1)
+    records = list(
+        glyph_records(tt, analyses=["overlap", "contours"], glyph_names=["A", "Scedilla"])
+    )
+    assert records == [
+        {"font": "", "glyph": "A", "contours": 2, "overlap": False},
+        {"font": "", "glyph": "Scedilla", "contours": 2, "overlap": True},
+    ]
+
+
+def test_glyph_records_library_api_full_glyph_set():
+    tt = TTFont(TESTFONT_PATH_1)
+    records = list(glyph_records(tt, analyses=["contours"], fontpath=TESTFONT_PATH_1))
+    assert [record["glyph"] for record in records] == tt.getGlyphOrder()
+    assert all(record["font"] == TESTFONT_PATH_1 for record in records)
+
+
+def test_glyph_records_library_api_invalid_analysis():
+    tt = TTFont(TESTFONT_PATH_1)
+    with pytest.raises(ValueError):
+        glyph_records(tt, analyses=["bogus"])
@@ -3,7 +3,9 @@ import os
 
 import pytest
 from fontTools.ttLib import TTFont
-from pathins.segments import segments_run
+from fontTools.misc.bezierTools import calcQuadraticArcLength
+from pathins.datastructures import Coordinate
+from pathins.segments import segment_distances, segments_run
 import pathins.stringbuilder
 
 
@@ -241,3 +243,17 @@ def test_segments_run_all_glyphs_nocolor(capsys, monkeypatch):
     assert "Total: 2245.15 units" in captured.out
     assert "Total: 3471.07 units" in captured.out
     assert "Total: 2246.05 units" in captured.out
+
+
+def test_segment_distances():
+    start = Coordinate(0, 0, oncurve=True, startpoint=True)
+    off_curve = Coordinate(50, 100)
+    end = Coordinate(100, 0, oncurve=True, endpoint=True)
+    segments = [(start, off_curve, end), (end, start)]
+    distances = segment_distances(segments)
+    assert len(distances) == 2
+    assert distances[0] == pytest.approx(
+        calcQuadraticArcLength((0, 0), (50, 100), (100, 0)), abs=1e-9
+    )
+    assert distances[1] == 100.0
+    assert segment_distances([]) == []
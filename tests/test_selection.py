@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import re
+
+import pytest
+from fontTools.ttLib import TTFont
+from pathins.__main__ import run
+from pathins.selection import (
+    parse_gid_ranges,
+    parse_unicode_ranges,
+    select_analyses,
+    select_glyph_ids,
+    selected_glyph_names,
+)
+import pathins.stringbuilder
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+
+# instantiate a parser for unit tests in this module
+parser = argparse.ArgumentParser()
+parser.add_argument("-g", "--glyph", action="append", help="glyph name")
+parser.add_argument("--match", action="append", help="glob pattern")
+parser.add_argument("--regex", action="append", help="regular expression")
+parser.add_argument("--unicodes", type=str, help="Unicode code point ranges")
+parser.add_argument("--gid", type=str, help="glyph ID ranges")
+parser.add_argument(
+    "glyphname", type=str, help="glyph name (optional, default=all)", nargs="?"
+)
+
+
+def test_parse_gid_ranges():
+    assert parse_gid_ranges("100-500") == [(100, 500)]
+    assert parse_gid_ranges("1, 3-4,10") == [(1, 1), (3, 4), (10, 10)]
+
+
+@pytest.mark.parametrize("ranges", ["", "a", "5-1", "1,,2", "-3", "1-"])
+def test_parse_gid_ranges_invalid(ranges):
+    with pytest.raises(ValueError):
+        parse_gid_ranges(ranges)
+
+
+def test_parse_unicode_ranges():
+    assert parse_unicode_ranges("U+0400-04FF") == [(0x400, 0x4FF)]
+    assert parse_unicode_ranges("U+0041,0x20AC,u+0061-U+007A") == [
+        (0x41, 0x41),
+        (0x20AC, 0x20AC),
+        (0x61, 0x7A),
+    ]
+
+
+@pytest.mark.parametrize("ranges", ["U+", "U+XYZ", "U+0041-0040", "U+110000"])
+def test_parse_unicode_ranges_invalid(ranges):
+    with pytest.raises(ValueError):
+        parse_unicode_ranges(ranges)
+
+
+def test_select_glyph_ids():
+    tt = TTFont(TESTFONT_PATH_1)
+    assert select_glyph_ids(tt) == set()
+    assert select_glyph_ids(tt, glyph_names=["A", "zero"]) == {1, 8}
+    assert select_glyph_ids(tt, patterns=["glyph0001?"]) == {15, 16}
+    assert select_glyph_ids(tt, regexes=["^[a-c]$"]) == {5, 6, 7}
+    assert select_glyph_ids(tt, unicode_ranges=[(0x41, 0x42), (0x100, 0x100)]) == {
+        1,
+        2,
+        13,
+    }
+    # ranges are clipped to the glyph set
+    assert select_glyph_ids(tt, gid_ranges=[(15, 500)]) == {15, 16}
+
+
+def test_select_glyph_ids_glob_matches_whole_names():
+    tt = TTFont(TESTFONT_PATH_1)
+    # "Scedilla" includes "a" but does not start with "a"
+    assert select_glyph_ids(tt, patterns=["a*"]) == {5}
+    assert select_glyph_ids(tt, patterns=["a*"], gid_ranges=[(1, 3)]) == {1, 2, 3, 5}
+    # regular expressions are searched anywhere in glyph names
+    assert 14 in select_glyph_ids(tt, regexes=["a"])
+
+
+def test_run_glyph_selection_glob(capsys):
+    run(["contours", "--format", "ndjson", "--match", "a*", TESTFONT_PATH_1])
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert [record["glyph"] for record in records] == ["a"]
+
+
+def test_select_glyph_ids_invalid():
+    tt = TTFont(TESTFONT_PATH_1)
+    with pytest.raises(KeyError):
+        select_glyph_ids(tt, glyph_names=["bogus"])
+    with pytest.raises(re.error):
+        select_glyph_ids(tt, regexes=["("])
+
+
+def test_select_analyses():
+    supported = ["contours", "direction", "segments"]
+    assert select_analyses(None, supported) == supported
+    assert select_analyses([], supported) == supported
+    # requested analyses are returned in supported order
+    assert select_analyses(["segments", "contours"], supported) == [
+        "contours",
+        "segments",
+    ]
+    assert select_analyses("direction", supported) == ["direction"]
+    with pytest.raises(ValueError):
+        select_analyses(["contours", "bogus"], supported)
+
+
+def test_selected_glyph_names_default():
+    tt = TTFont(TESTFONT_PATH_1)
+    assert selected_glyph_names(parser.parse_args([]), tt) == tt.getGlyphOrder()
+
+
+def test_selected_glyph_names_combined():
+    tt = TTFont(TESTFONT_PATH_1)
+    args = parser.parse_args(
+        ["zero", "-g", "A", "--match", "S*", "--unicodes", "U+002C", "--gid", "0"]
+    )
+    # glyph order, not request order
+    assert selected_glyph_names(args, tt) == [".notdef", "A", "zero", "comma", "Scedilla"]
+
+
+def test_selected_glyph_names_no_match():
+    tt = TTFont(TESTFONT_PATH_1)
+    assert (
+        selected_glyph_names(parser.parse_args(["--unicodes", "U+0400-04FF"]), tt) == []
+    )
+
+
+def test_selected_glyph_names_fail_invalid_glyphname(capsys):
+    tt = TTFont(TESTFONT_PATH_1)
+    with pytest.raises(SystemExit) as e:
+        selected_glyph_names(parser.parse_args(["-g", "A", "-g", "bogus"]), tt)
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "Failed to open glyph 'bogus'" in captured.err
+
+
+@pytest.mark.parametrize("args", [["--gid", "1-x"], ["--regex", "("]])
+def test_selected_glyph_names_fail_invalid_selection(capsys, args):
+    tt = TTFont(TESTFONT_PATH_1)
+    with pytest.raises(SystemExit) as e:
+        selected_glyph_names(parser.parse_args(args), tt)
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "invalid glyph selection" in captured.err
+
+
+@pytest.mark.parametrize(
+    "subcommand", ["contours", "coordinates", "direction", "path", "report", "segments"]
+)
+def test_run_glyph_selection_ndjson(capsys, subcommand):
+    run([subcommand, "--format", "ndjson", "--gid", "1-3", "-g", "zero", TESTFONT_PATH_1])
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert [record["glyph"] for record in records] == ["A", "B", "C", "zero"]
+
+
+def test_run_glyph_selection_text(capsys, monkeypatch):
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", False)
+    run(["contours", "--regex", "^[AB]$", TESTFONT_PATH_1])
+    captured = capsys.readouterr()
+    assert captured.out == "[ A ]: 2\n[ B ]: 3\n"
@@ -150,28 +150,40 @@ def test_report_header_nocolor(monkeypatch):
     assert res == f"-----{os.linesep}TEST{os.linesep}-----"
 
 
-# def test_overlap_result_pass_default(monkeypatch):
-#     # mock tty
-#     def mock_isatty():
-#         return True
+def test_overlap_result_pass_default(monkeypatch):
+    # mock tty
+    def mock_isatty():
+        return True
 
-#     # apply the monkeypatch for sys.stdout.isatty()
-#     monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", mock_isatty)
+    # apply the monkeypatch for sys.stdout.isatty()
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", mock_isatty)
 
-#     res = pathins.stringbuilder.overlap_result("TEST", test_pass=True)
-#     assert res == "[ \x1b[31mTEST\x1b[0m ]: Yes"
+    res = pathins.stringbuilder.overlap_result("TEST", test_pass=True)
+    assert res == "[ \x1b[31mTEST\x1b[0m ]: Yes"
 
 
-# def test_overlap_result_pass_nocolor(monkeypatch):
-#     # mock tty
-#     def mock_isatty():
-#         return True
+def test_overlap_result_pass_nocolor(monkeypatch):
+    # mock tty
+    def mock_isatty():
+        return True
 
-#     # apply the monkeypatch for sys.stdout.isatty()
-#     monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", mock_isatty)
+    # apply the monkeypatch for sys.stdout.isatty()
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", mock_isatty)
+
+    res = pathins.stringbuilder.overlap_result("TEST", test_pass=True, nocolor=True)
+    assert res == "[ TEST ]: Yes"
+
+
+def test_overlap_result_fail_default(monkeypatch):
+    # mock tty
+    def mock_isatty():
+        return True
+
+    # apply the monkeypatch for sys.stdout.isatty()
+    monkeypatch.setattr(pathins.stringbuilder, "IS_A_TTY", mock_isatty)
 
-#     res = pathins.stringbuilder.overlap_result("TEST", test_pass=True, nocolor=True)
-#     assert res == "[ TEST ]: Yes"
+    res = pathins.stringbuilder.overlap_result("TEST", test_pass=False)
+    assert res == "[ \x1b[32mTEST\x1b[0m ]: No"
 
 
 def test_direction_result_no_contours_default(monkeypatch):
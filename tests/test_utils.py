@@ -0,0 +1,92 @@
+import os
+
+import pytest
+from pathins.utils import (
+    has_truetype_signature,
+    is_truetype_font,
+    map_font_file,
+    open_font,
+)
+from pathins.validators import validate_fontpath, validate_glyph_in_font
+
+TESTFONT_PATH_1 = os.path.join("tests", "testfiles", "fonts", "RobotoMono-subset1.ttf")
+TESTTEXT_PATH = os.path.join("tests", "testfiles", "text", "test.txt")
+
+
+def test_is_truetype_font():
+    assert is_truetype_font(TESTFONT_PATH_1) is True
+    assert is_truetype_font(TESTTEXT_PATH) is False
+
+
+def test_open_font_lazy_table_loading():
+    with open_font(TESTFONT_PATH_1) as tt:
+        # tables are not loaded until requested
+        assert len(tt.tables) == 0
+        assert tt["glyf"]["A"].numberOfContours == 2
+        assert "glyf" in tt.tables
+        assert "GDEF" not in tt.tables
+
+
+def test_validate_glyph_in_font_does_not_load_glyf():
+    with open_font(TESTFONT_PATH_1) as tt:
+        validate_glyph_in_font("Scedilla", tt)
+        assert "glyf" not in tt.tables
+
+
+def test_validate_glyph_in_font_missing_glyph(capsys):
+    with open_font(TESTFONT_PATH_1) as tt:
+        with pytest.raises(SystemExit) as e:
+            validate_glyph_in_font("bogus", tt)
+
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "Failed to open glyph 'bogus'" in captured.err
+
+
+def test_validate_glyph_in_font_missing_glyph_id_name(capsys):
+    # fontTools resolves glyphXXXXX names to glyph IDs
+    # that are not necessarily in the font
+    with open_font(TESTFONT_PATH_1) as tt:
+        with pytest.raises(SystemExit) as e:
+            validate_glyph_in_font("glyph99999", tt)
+
+    assert e.value.code == 1
+
+
+def test_has_truetype_signature():
+    assert has_truetype_signature(b"\x00\x01\x00\x00\x00") is True
+    assert has_truetype_signature(b"true") is True
+    assert has_truetype_signature(b"OTTO") is False
+    assert has_truetype_signature(b"") is False
+
+
+def test_map_font_file():
+    font_file = map_font_file(TESTFONT_PATH_1)
+    assert font_file.size() == os.path.getsize(TESTFONT_PATH_1)
+    assert has_truetype_signature(font_file) is True
+    font_file.close()
+
+
+def test_open_font_from_memory_map_closes_map():
+    font_file = map_font_file(TESTFONT_PATH_1)
+    with open_font(font_file) as tt:
+        assert tt["glyf"]["A"].numberOfContours == 2
+    assert font_file.closed is True
+
+
+def test_validate_fontpath_returns_memory_map():
+    font_file = validate_fontpath(TESTFONT_PATH_1)
+    assert has_truetype_signature(font_file) is True
+    with open_font(font_file) as tt:
+        assert "Scedilla" in tt.getGlyphOrder()
+
+
+def test_validate_fontpath_empty_file(capsys, tmp_path):
+    empty_path = tmp_path / "empty.ttf"
+    empty_path.write_bytes(b"")
+    with pytest.raises(SystemExit) as e:
+        validate_fontpath(str(empty_path))
+
+    captured = capsys.readouterr()
+    assert e.value.code == 1
+    assert "does not appear to be a TTF format font" in captured.err
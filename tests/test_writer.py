@@ -0,0 +1,53 @@
+import io
+
+from pathins.writer import ReportWriter
+
+
+class CountingStringIO(io.StringIO):
+    def __init__(self):
+        super(CountingStringIO, self).__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super(CountingStringIO, self).write(text)
+
+
+def test_report_writer_buffers_until_flush():
+    sink = CountingStringIO()
+    writer = ReportWriter(sink)
+    writer.write("abc")
+    writer.writeline("def")
+    writer.writeline()
+    assert sink.getvalue() == ""
+    writer.flush()
+    assert sink.getvalue() == "abcdef\n\n"
+    assert sink.writes == 1
+
+
+def test_report_writer_flushes_on_buffer_size():
+    sink = CountingStringIO()
+    writer = ReportWriter(sink, buffer_size=10)
+    writer.write("12345")
+    assert sink.writes == 0
+    writer.write("67890")
+    assert sink.writes == 1
+    assert sink.getvalue() == "1234567890"
+    writer.write("abc")
+    assert sink.getvalue() == "1234567890"
+
+
+def test_report_writer_context_manager_flush():
+    sink = CountingStringIO()
+    with ReportWriter(sink) as writer:
+        for x in range(100):
+            writer.writeline(str(x))
+    assert sink.getvalue() == "".join(f"{x}\n" for x in range(100))
+    assert sink.writes == 1
+
+
+def test_report_writer_default_sink(capsys):
+    with ReportWriter() as writer:
+        writer.writeline("test")
+    captured = capsys.readouterr()
+    assert captured.out == "test\n"